@@ -0,0 +1,65 @@
+"""
+Benchmark writing formatted cells to the table body, across backends.
+
+Column merges and text transforms write to the body one cell at a time. This times building a
+table that uses both, for a varying number of rows, to check that the time grows linearly.
+
+Usage (from the repository root, with great_tables installed in editable mode):
+    python benchmarks/bench_body_writes.py [--rows 10000 100000] [--repeat 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+import warnings
+
+import pandas as pd
+import polars as pl
+import pyarrow as pa
+
+from great_tables import GT, loc
+
+BACKENDS = {
+    "pandas": pd.DataFrame,
+    "polars": pl.DataFrame,
+    "pyarrow": pa.table,
+}
+
+
+def build(data) -> GT:
+    gt = (
+        GT(data)
+        .fmt_number("x")
+        .cols_merge(["x", "y"])
+        .text_transform(loc.body(columns="y"), lambda s: s.upper())
+    )
+    return gt._build_data("html")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--rows", type=int, nargs="+", default=[10_000, 100_000], help="numbers of rows"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="timing repeats (best is kept)")
+    args = parser.parse_args()
+
+    warnings.simplefilter("ignore")
+
+    print(f"Building a table with cols_merge() and text_transform() (best of {args.repeat}, in s)")
+    print(f"{'rows':>10}" + "".join(f"{name:>12}" for name in BACKENDS))
+
+    for n_rows in args.rows:
+        columns = {"x": [float(i) for i in range(n_rows)], "y": [f"y{i}" for i in range(n_rows)]}
+        timings = []
+
+        for constructor in BACKENDS.values():
+            data = constructor(columns)
+            timings.append(min(timeit.repeat(lambda: build(data), number=1, repeat=args.repeat)))
+
+        print(f"{n_rows:>10,}" + "".join(f"{t:>12.2f}" for t in timings))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Benchmark `group_splits()` across the pandas, polars, and pyarrow backends.
+
+`group_splits()` maps each row group to its row numbers, and runs whenever a table is created
+with `groupname_col=`. This times it for tables with a varying number of rows and groups.
+
+Usage (from the repository root, with great_tables installed in editable mode):
+    python benchmarks/bench_group_splits.py [--rows 100000] [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import timeit
+
+import pandas as pd
+import polars as pl
+import pyarrow as pa
+
+from great_tables._tbl_data import group_splits
+
+BACKENDS = {
+    "pandas": pd.DataFrame,
+    "polars": pl.DataFrame,
+    "pyarrow": pa.table,
+}
+
+
+def make_groups(n_rows: int, n_groups: int, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    return [f"group_{rng.randrange(n_groups)}" for _ in range(n_rows)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=100_000, help="number of rows")
+    parser.add_argument("--repeat", type=int, default=5, help="timing repeats (best is kept)")
+    parser.add_argument(
+        "--groups",
+        type=int,
+        nargs="+",
+        default=[10, 1_000, 10_000],
+        help="numbers of distinct groups",
+    )
+    args = parser.parse_args()
+
+    print(f"group_splits() over {args.rows:,} rows (best of {args.repeat}, in ms)")
+    print(f"{'groups':>10}" + "".join(f"{name:>12}" for name in BACKENDS))
+
+    for n_groups in args.groups:
+        groups = make_groups(args.rows, n_groups)
+        timings = []
+
+        for constructor in BACKENDS.values():
+            data = constructor({"group": groups})
+            best = min(
+                timeit.repeat(lambda: group_splits(data, "group"), number=1, repeat=args.repeat)
+            )
+            timings.append(best * 1000)
+
+        print(f"{n_groups:>10,}" + "".join(f"{t:>12.1f}" for t in timings))
+
+
+if __name__ == "__main__":
+    main()
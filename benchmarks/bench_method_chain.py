@@ -0,0 +1,59 @@
+"""
+Benchmark long chains of GT method calls.
+
+Each GT method returns a new GT that adds to the table's styles, formats, footnotes, and so on.
+This times building a table with many `tab_style()` calls (as when they're generated
+programmatically), along with a chain of `fmt_*()` calls.
+
+Usage (from the repository root, with great_tables installed in editable mode):
+    python benchmarks/bench_method_chain.py [--calls 10000] [--repeat 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+
+import pandas as pd
+
+from great_tables import GT, loc, style
+
+
+def chain_tab_style(data: pd.DataFrame, n_calls: int) -> GT:
+    gt = GT(data)
+    n_rows = len(data)
+
+    for i in range(n_calls):
+        gt = gt.tab_style(style=style.fill(color="lightblue"), locations=loc.body("x", i % n_rows))
+
+    return gt
+
+
+def chain_fmt(data: pd.DataFrame, n_calls: int) -> GT:
+    gt = GT(data)
+    n_rows = len(data)
+
+    for i in range(n_calls):
+        gt = gt.fmt_number(columns="x", rows=i % n_rows, decimals=i % 4)
+
+    return gt
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--calls", type=int, default=10_000, help="number of chained calls")
+    parser.add_argument("--rows", type=int, default=100, help="number of table rows")
+    parser.add_argument("--repeat", type=int, default=3, help="timing repeats (best is kept)")
+    args = parser.parse_args()
+
+    data = pd.DataFrame({"x": [float(i) for i in range(args.rows)]})
+
+    print(f"{args.calls:,} chained calls on a {args.rows:,}-row table (best of {args.repeat})")
+
+    for name, fn in [("tab_style()", chain_tab_style), ("fmt_number()", chain_fmt)]:
+        best = min(timeit.repeat(lambda: fn(data, args.calls), number=1, repeat=args.repeat))
+        print(f"{name:>14}: {best:.2f}s ({best / args.calls * 1e6:.0f}us per call)")
+
+
+if __name__ == "__main__":
+    main()
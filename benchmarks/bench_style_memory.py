@@ -0,0 +1,66 @@
+"""
+Benchmark the memory used by per-cell styles.
+
+`data_color()` and `tab_style()` with `loc.body()` record a style entry for every targeted cell,
+so their memory use grows with the number of styled cells. This reports the memory allocated per
+styled cell, as traced by `tracemalloc`.
+
+Usage (from the repository root, with great_tables installed in editable mode):
+    python benchmarks/bench_style_memory.py [--rows 20000] [--cols 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import tracemalloc
+from typing import Callable
+
+import pandas as pd
+import polars as pl
+
+from great_tables import GT, loc, style
+
+
+def traced_bytes(fn: Callable[[], GT]) -> tuple[GT, int]:
+    tracemalloc.start()
+    try:
+        gt = fn()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return gt, size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=20_000, help="number of table rows")
+    parser.add_argument("--cols", type=int, default=5, help="number of table columns")
+    args = parser.parse_args()
+
+    columns = [f"x{i}" for i in range(args.cols)]
+    data = pd.DataFrame({col: [float(i % 100) for i in range(args.rows)] for col in columns})
+    gt = GT(data)
+    gt_pl = GT(pl.from_pandas(data))
+
+    cases: dict[str, Callable[[], GT]] = {
+        "data_color()": lambda: gt.data_color(palette=["white", "red"]),
+        "tab_style(loc.body())": lambda: gt.tab_style(
+            style=style.fill(color="red"), locations=loc.body()
+        ),
+        "tab_style(loc.body(mask=))": lambda: gt_pl.tab_style(
+            style=style.text(weight="bold"),
+            locations=loc.body(mask=pl.all() >= 50),
+        ),
+    }
+
+    print(f"Memory per styled cell on a {args.rows:,} x {args.cols} table")
+
+    for name, fn in cases.items():
+        styled, size = traced_bytes(fn)
+        n_styled = len(styled._styles)
+        print(f"{name:>28}: {size / n_styled:6.0f} bytes per cell ({n_styled:,} cells)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,282 @@
+"""
+Benchmark the steps of building and rendering a table, across backends and table sizes.
+
+Each case times one step: creating a `GT`, building the body with a formatter (`fmt_*()`,
+`data_color()`, `tab_style()`, `summary_rows()`) or without one (`_build_data()`), and rendering
+(`as_raw_html()`, `as_latex()`, `compile_scss()`). The cases run on tables made from the
+`pizzaplace`, `countrypops`, and `sp500` datasets, for each of the pandas, polars, and pyarrow
+backends, with the dataset's rows repeated (or cut) to reach each size tier. The timings are
+printed and written to a JSON file, so that runs can be compared to track regressions. Cases that a
+backend doesn't support (e.g., `mask=` needs polars) are recorded with the reason they were
+skipped. Cases that build the body clear the table's build cache before each call, so the
+rendering cases time building the body as well as generating the HTML or LaTeX.
+
+Usage (from the repository root, with great_tables installed in editable mode):
+    python benchmarks/bench_suite.py [--tiers 1k 10k] [--cases fmt_number as_raw_html]
+                                     [--backends polars] [--repeat 3] [--output results.json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import platform
+import statistics
+import sys
+import timeit
+import warnings
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from importlib.metadata import version
+from typing import Any, Callable
+
+import pandas as pd
+import polars as pl
+import pyarrow as pa
+
+from great_tables import GT, loc, style
+from great_tables._scss import compile_scss
+from great_tables.data import countrypops, pizzaplace, sp500
+
+BACKENDS: dict[str, Callable[[pd.DataFrame], Any]] = {
+    "pandas": lambda df: df,
+    "polars": pl.from_pandas,
+    "pyarrow": lambda df: pa.Table.from_pandas(df, preserve_index=False),
+}
+
+TIERS = {"1k": 1_000, "10k": 10_000, "100k": 100_000, "1m": 1_000_000}
+
+DATASETS = {"pizzaplace": pizzaplace, "countrypops": countrypops, "sp500": sp500}
+
+SP500_PRICES = ["open", "high", "low", "close", "adj_close"]
+
+
+class Skip(Exception):
+    """Raised by a case's setup when it doesn't apply to a backend."""
+
+
+@dataclass(frozen=True)
+class Case:
+    """A benchmark case.
+
+    `setup` receives the table data (for one backend) and the backend's name, and returns the
+    function to time. Only that function is timed, so `setup` can prepare the `GT` to render.
+    """
+
+    name: str
+    dataset: str
+    setup: Callable[[Any, str], Callable[[], Any]]
+
+
+def uncached(gt: GT, fn: Callable[[GT], Any]) -> Callable[[], Any]:
+    """Return a function calling `fn(gt)` that doesn't reuse a body built by a previous call."""
+
+    def run() -> Any:
+        gt._build_cache.clear()
+        return fn(gt)
+
+    return run
+
+
+def build_body(gt: GT) -> Callable[[], Any]:
+    return uncached(gt, lambda gt: gt._build_data("html"))
+
+
+def mean_by_group(backend: str) -> Any:
+    if backend == "pandas":
+        return lambda df: df.mean(numeric_only=True)
+    if backend == "polars":
+        return pl.col("year", "population").mean()
+
+    raise Skip("summary_rows() supports pandas and polars data")
+
+
+def setup_fmt_nanoplot(data: Any, backend: str) -> Callable[[], Any]:
+    if backend == "pyarrow":
+        raise Skip("fmt_nanoplot() doesn't take pyarrow float columns as single values")
+
+    return build_body(GT(data).fmt_nanoplot("close", plot_type="bar"))
+
+
+def setup_tab_style_mask(data: Any, backend: str) -> Callable[[], Any]:
+    if backend != "polars":
+        raise Skip("loc.body(mask=) needs polars data")
+
+    gt = GT(data)
+    return lambda: gt.tab_style(
+        style=style.fill(color="lightblue"),
+        locations=loc.body(mask=pl.col(SP500_PRICES) > 1000),
+    )
+
+
+def setup_tab_style_rows(data: Any, backend: str) -> Callable[[], Any]:
+    gt = GT(data)
+    rows = list(range(0, data.shape[0], 2))
+    return lambda: gt.tab_style(
+        style=style.fill(color="lightblue"),
+        locations=loc.body(columns=SP500_PRICES, rows=rows),
+    )
+
+
+def setup_data_color(data: Any, backend: str) -> Callable[[], Any]:
+    gt = GT(data)
+    return lambda: gt.data_color(SP500_PRICES, palette="viridis")
+
+
+def setup_compile_scss(data: Any, backend: str) -> Callable[[], Any]:
+    gt = pizza_table(data)
+    return lambda: compile_scss(gt, id="bench")
+
+
+def pizza_table(data: Any) -> GT:
+    return (
+        GT(data, groupname_col="type")
+        .fmt_currency("price")
+        .fmt_date("date", date_style="day_m_year")
+        .tab_header(title="Pizza sales")
+    )
+
+
+CASES = [
+    Case("GT", "pizzaplace", lambda data, _: lambda: GT(data)),
+    Case("_build_data", "pizzaplace", lambda data, _: build_body(pizza_table(data))),
+    Case("fmt_number", "sp500", lambda data, _: build_body(GT(data).fmt_number(SP500_PRICES))),
+    Case(
+        "fmt_integer",
+        "countrypops",
+        lambda data, _: build_body(GT(data).fmt_integer("population")),
+    ),
+    Case(
+        "fmt_percent",
+        "sp500",
+        lambda data, _: build_body(GT(data).fmt_percent(SP500_PRICES, scale_values=False)),
+    ),
+    Case(
+        "fmt_scientific",
+        "sp500",
+        lambda data, _: build_body(GT(data).fmt_scientific("volume")),
+    ),
+    Case("fmt_currency", "pizzaplace", lambda data, _: build_body(GT(data).fmt_currency("price"))),
+    Case("fmt_date", "sp500", lambda data, _: build_body(GT(data).fmt_date("date"))),
+    Case("fmt_time", "pizzaplace", lambda data, _: build_body(GT(data).fmt_time("time"))),
+    Case("fmt_markdown", "pizzaplace", lambda data, _: build_body(GT(data).fmt_markdown("name"))),
+    Case("fmt_nanoplot", "sp500", setup_fmt_nanoplot),
+    Case("data_color", "sp500", setup_data_color),
+    Case("tab_style_mask", "sp500", setup_tab_style_mask),
+    Case("tab_style_rows", "sp500", setup_tab_style_rows),
+    Case(
+        "summary_rows",
+        "countrypops",
+        lambda data, backend: build_body(
+            GT(data, groupname_col="country_name").summary_rows(
+                fns={"Mean": mean_by_group(backend)}
+            )
+        ),
+    ),
+    Case("as_raw_html", "pizzaplace", lambda data, _: uncached(pizza_table(data), GT.as_raw_html)),
+    Case("as_latex", "pizzaplace", lambda data, _: uncached(pizza_table(data), GT.as_latex)),
+    Case("compile_scss", "pizzaplace", setup_compile_scss),
+]
+
+
+def resize(df: pd.DataFrame, n_cells: int) -> pd.DataFrame:
+    """Repeat or cut the rows of `df` to get (about) `n_cells` cells."""
+
+    n_rows = math.ceil(n_cells / len(df.columns))
+    n_copies = math.ceil(n_rows / len(df))
+
+    return pd.concat([df] * n_copies, ignore_index=True).iloc[:n_rows].reset_index(drop=True)
+
+
+def run_case(case: Case, data: Any, backend: str, repeat: int) -> dict[str, Any]:
+    try:
+        fn = case.setup(data, backend)
+        # The first call checks that the case runs, and warms up caches shared between tables
+        fn()
+    except Skip as e:
+        return {"skipped": str(e)}
+    except Exception as e:
+        # Errors are recorded rather than raised, so that one failing case doesn't lose the
+        # results of the others
+        return {"error": f"{type(e).__name__}: {e}"}
+
+    times = timeit.repeat(fn, number=1, repeat=repeat)
+
+    return {"times": times, "min": min(times), "median": statistics.median(times)}
+
+
+def get_metadata(args: argparse.Namespace) -> dict[str, Any]:
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "versions": {
+            package: version(package) for package in ["great_tables", "pandas", "polars", "pyarrow"]
+        },
+        "repeat": args.repeat,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--tiers", nargs="+", choices=list(TIERS), default=list(TIERS), help="table size tiers"
+    )
+    parser.add_argument(
+        "--cases", nargs="+", choices=[case.name for case in CASES], help="cases to run (all)"
+    )
+    parser.add_argument(
+        "--backends", nargs="+", choices=list(BACKENDS), default=list(BACKENDS), help="backends"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="timing repeats")
+    parser.add_argument(
+        "--output", default="bench_suite.json", help="path of the JSON results file"
+    )
+    args = parser.parse_args()
+
+    warnings.simplefilter("ignore")
+
+    cases = [case for case in CASES if args.cases is None or case.name in args.cases]
+    results: list[dict[str, Any]] = []
+
+    print(f"{'case':<16}{'dataset':<13}{'cells':>11}" + "".join(f"{b:>10}" for b in args.backends))
+
+    for tier in args.tiers:
+        n_cells = TIERS[tier]
+        resized = {name: resize(df, n_cells) for name, df in DATASETS.items()}
+
+        for case in cases:
+            df = resized[case.dataset]
+            cells = []
+
+            for backend in args.backends:
+                res = run_case(case, BACKENDS[backend](df), backend, args.repeat)
+                results.append(
+                    {
+                        "case": case.name,
+                        "dataset": case.dataset,
+                        "backend": backend,
+                        "tier": tier,
+                        "rows": len(df),
+                        "columns": len(df.columns),
+                        **res,
+                    }
+                )
+                if "min" in res:
+                    cells.append(f"{res['min']:>10.4f}")
+                else:
+                    cells.append(f"{'-' if 'skipped' in res else 'error':>10}")
+
+            n_cells = len(df) * len(df.columns)
+            print(f"{case.name:<16}{case.dataset:<13}{n_cells:>11,}" + "".join(cells))
+
+    with open(args.output, "w") as f:
+        json.dump({"metadata": get_metadata(args), "results": results}, f, indent=2)
+
+    print(f"\nBest of {args.repeat} times, in seconds ('-' marks skipped cases)")
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
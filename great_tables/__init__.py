@@ -22,6 +22,9 @@ from ._helpers import (
     stub,
     system_fonts,
 )
+from ._profile import profile_render
+from ._render_cache import disable_render_cache, enable_render_cache
+from ._render_many import render_many
 from ._styles import FromColumn as from_column
 from .gt import GT
 
@@ -41,6 +44,10 @@ __all__ = (
     "nanoplot_options",
     "random_id",
     "from_column",
+    "enable_render_cache",
+    "disable_render_cache",
+    "render_many",
+    "profile_render",
     "vals",
     "loc",
     "style",
@@ -1,14 +1,37 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
-from ._tbl_data import copy_data
+from ._tbl_data import fill_null_column
 
 if TYPE_CHECKING:
     from ._gt_data import Body
+    from ._tbl_data import TblData
 
 
 def body_reassemble(body: Body) -> Body:
     # Note that this used to order the body based on groupings, but now that occurs in the
     # renderer itself.
-    return body.__class__(copy_data(body.body))
+    return body.copy()
+
+
+class BodyCells:
+    """The cells of a rendered table body, with unformatted cells filled in from the data.
+
+    Each column is only filled in when one of its cells is first needed, so columns that aren't
+    rendered (e.g., hidden ones) are skipped, and the original data of a column is only cast to
+    string when some of its cells weren't formatted.
+    """
+
+    def __init__(self, body: TblData, tbl_data: TblData):
+        self.body = body
+        self.tbl_data = tbl_data
+        self._columns: dict[str, list[Any]] = {}
+
+    def get(self, row: int, column: str) -> Any:
+        values = self._columns.get(column)
+
+        if values is None:
+            values = self._columns[column] = fill_null_column(self.body, column, self.tbl_data)
+
+        return values[row]
@@ -4,7 +4,7 @@ import re
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
-from ._tbl_data import Agnostic, _get_cell, _set_cell, is_na
+from ._tbl_data import Agnostic, _get_cell, is_na
 
 if TYPE_CHECKING:
     from ._gt_data import Body, GTData
@@ -342,11 +342,12 @@ def _apply_single_col_merge(
         values: list[Any] = []
 
         for col_name in col_merge.vars:
-            formatted_value = _get_cell(body.body, row_idx, col_name)
+            formatted_value = body.get_cell(row_idx, col_name)
             original_value = _get_cell(tbl_data, row_idx, col_name)
 
             original_na = ColMergeInfo.replace_na(original_value, tbl_data=tbl_data)
-            formatted_na = ColMergeInfo.replace_na(formatted_value, tbl_data=body.body)
+            # (the body has the same backend as the original data)
+            formatted_na = ColMergeInfo.replace_na(formatted_value, tbl_data=tbl_data)
 
             if formatted_na[0] is None and original_na[0] is None:
                 # Truly missing
@@ -370,12 +371,7 @@ def _apply_single_col_merge(
         else:
             merged_value = col_merge.merge(*values)
 
-        result = _set_cell(body.body, row_idx, target_column, merged_value)
-
-        # For Pandas and Polars, _set_cell() modifies in place and returns None but
-        # for PyArrow, _set_cell() returns a new table
-        if result is not None:
-            body.body = result
+        body.set_cell(row_idx, target_column, merged_value)
 
     return body
 
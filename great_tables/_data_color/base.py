@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from math import isnan
+from typing import TYPE_CHECKING, Any
 
 from typing_extensions import TypeAlias
 
+from great_tables._gt_data import StyleInfo
 from great_tables._locations import RowSelectExpr, resolve_cols_c, resolve_rows_i
 from great_tables._tbl_data import (
     DataFrameLike,
@@ -14,6 +16,7 @@ from great_tables._tbl_data import (
     to_list,
 )
 from great_tables.loc import body
+from great_tables._styles import CellStyle
 from great_tables.style import fill, text
 
 from .constants import ALL_PALETTES, COLOR_NAME_TO_HEX, DEFAULT_PALETTE
@@ -229,7 +232,9 @@ def data_color(
     row_res = resolve_rows_i(self, rows)
     row_pos = [name_pos[1] for name_pos in row_res]
 
-    gt_obj = self
+    # Style entries for each distinct color, shared by every cell that uses that color
+    color_styles: dict[str, list[CellStyle]] = {}
+    new_styles: list[StyleInfo] = []
 
     # For each column targeted, get the data values as a new list object
     for col in columns_resolved:
@@ -237,7 +242,7 @@ def data_color(
         column_vals = to_list(get_rows(data_table[col], indexes=row_pos))
 
         # Filter out NA values from `column_vals`
-        filtered_column_vals = [x for x in column_vals if not is_na(data_table, x)]
+        filtered_column_vals = [x for x in column_vals if not _is_na(data_table, x)]
 
         # The methodology for domain calculation and rescaling depends on column values being:
         # (1) numeric (integers or floats), then the method should be 'numeric'
@@ -270,7 +275,7 @@ def data_color(
             )
 
         # Replace NA values in `scaled_vals` with `None`
-        scaled_vals = [None if is_na(data_table, x) else x for x in scaled_vals]
+        scaled_vals = [None if _is_na(data_table, x) else x for x in scaled_vals]
 
         # Create a color scale function from the palette
         color_scale_fn = GradientPalette(colors=palette)
@@ -279,24 +284,42 @@ def data_color(
         color_vals = color_scale_fn(scaled_vals)
 
         # Replace 'None' values in `color_vals` with the `na_color=` color
-        color_vals = [na_color if is_na(data_table, x) else x for x in color_vals]
+        color_vals = [na_color if _is_na(data_table, x) else x for x in color_vals]
+
+        # for every color value in color_vals, add a fill style for the corresponding cell;
+        # this creates the same style entries as calling `tab_style()` once per cell but
+        # without resolving a location and copying the GT object for each of them
+        new_colors = [x for x in dict.fromkeys(color_vals) if x not in color_styles]
+        if autocolor_text:
+            fgnd_colors = _ideal_fgnd_colors(bgnd_colors=new_colors)
+            for color_val, fgnd_color in zip(new_colors, fgnd_colors):
+                color_styles[color_val] = [text(color=fgnd_color), fill(color=color_val)]
+        else:
+            for color_val in new_colors:
+                color_styles[color_val] = [fill(color=color_val)]
 
-        # for every color value in color_vals, apply a fill to the corresponding cell
-        # by using `tab_style()`
+        col_loc = body(columns=col, rows=row_pos)
         for i, color_val in zip(row_pos, color_vals):
-            if autocolor_text:
-                fgnd_color = _ideal_fgnd_color(bgnd_color=color_val)
+            new_styles.append(
+                StyleInfo(locname=col_loc, colname=col, rownum=i, styles=color_styles[color_val])
+            )
 
-                gt_obj = gt_obj.tab_style(
-                    style=[text(color=fgnd_color), fill(color=color_val)],
-                    locations=body(columns=col, rows=[i]),
-                )
+    return self._replace(_styles=self._styles + new_styles)
 
-            else:
-                gt_obj = gt_obj.tab_style(
-                    style=fill(color=color_val), locations=body(columns=col, rows=[i])
-                )
-    return gt_obj
+
+def _is_na(df: DataFrameLike, x: Any) -> bool:
+    """
+    Check whether a value is missing, as `is_na()` does
+
+    Floats and `None` make up most values here, and every backend treats them the same way, so
+    they are checked directly rather than dispatching on the type of `df` for each value.
+    """
+
+    if x is None:
+        return True
+    if type(x) is float:
+        return isnan(x)
+    return is_na(df, x)
 
 
 def _ideal_fgnd_color(bgnd_color: str, light: str = "#FFFFFF", dark: str = "#000000") -> str:
@@ -311,6 +334,46 @@ def _ideal_fgnd_color(bgnd_color: str, light: str = "#FFFFFF", dark: str = "#000
     return fgnd_color
 
 
+def _ideal_fgnd_colors(
+    bgnd_colors: list[str], light: str = "#FFFFFF", dark: str = "#000000"
+) -> list[str]:
+    """
+    Get the ideal foreground color for each of several background colors
+
+    This gives the same result as calling `_ideal_fgnd_color()` on each background color, but
+    composites and computes the contrast ratios for all colors at once with NumPy (if it is
+    installed).
+    """
+
+    try:
+        import numpy as np
+    except ImportError:
+        return [_ideal_fgnd_color(bgnd_color=x, light=light, dark=dark) for x in bgnd_colors]
+
+    if not bgnd_colors:
+        return []
+
+    rgb = np.array([_hex_to_rgb(hex_color=x) for x in bgnd_colors], dtype=np.int64)
+
+    # Alpha composite with a white background; colors without an alpha channel are left
+    # unchanged (as in `_alpha_composite_with_white()`, the composited channels are truncated)
+    alpha = np.array([int(x[7:9], 16) / 255.0 if len(x) == 9 else 1.0 for x in bgnd_colors])
+    alpha = alpha[:, np.newaxis]
+    rgb = np.clip(np.trunc(rgb * alpha + 255 * (1 - alpha)), 0, 255).astype(np.int64)
+
+    # Look up the sRGB value of each channel rather than recomputing it for every color
+    srgb = np.array([_srgb(x=x) for x in range(256)])[rgb]
+    luminance = 0.2126 * srgb[:, 0] + 0.7152 * srgb[:, 1] + 0.0722 * srgb[:, 2]
+
+    def contrast_ratio(color: str) -> Any:
+        l_color = _relative_luminance(rgb=_hex_to_rgb(hex_color=color))
+        return (np.maximum(l_color, luminance) + 0.05) / (np.minimum(l_color, luminance) + 0.05)
+
+    use_dark = np.abs(contrast_ratio(dark)) > np.abs(contrast_ratio(light))
+
+    return [dark if x else light for x in use_dark.tolist()]
+
+
 def _alpha_composite_with_white(color: str) -> str:
     """
     Alpha composite a color with white background
@@ -626,18 +689,66 @@ def _rescale_numeric(
 
     if domain_range == 0:
         # In the case where the domain range is 0, all scaled values in `vals` will be `0`
-        return [0.0 if not is_na(df, x) else x for x in vals]
+        return [0.0 if not _is_na(df, x) else x for x in vals]
+
+    is_na_vals = [_is_na(df, x) for x in vals]
+
+    scaled_array = _rescale_numeric_array(
+        vals=vals, is_na_vals=is_na_vals, domain_min=domain_min, domain_range=domain_range
+    )
+
+    min_val, max_val = (0, 1) if truncate else (None, None)
+
+    if scaled_array is not None:
+        return [
+            None if x is None else min_val if x < 0 else max_val if x > 1 else x
+            for x in scaled_array
+        ]
 
     # Rescale the values in `vals` to the range [0, 1], pass through NA values
     scaled: list[float | None] = [
-        None if is_na(df, x) else (x - domain_min) / domain_range for x in vals
+        None if x_is_na else (x - domain_min) / domain_range for x, x_is_na in zip(vals, is_na_vals)
     ]
 
-    min_val, max_val = (0, 1) if truncate else (None, None)
-
     return [None if x is None else min_val if x < 0 else max_val if x > 1 else x for x in scaled]
 
 
+def _rescale_numeric_array(
+    vals: list[int | float], is_na_vals: list[bool], domain_min: Any, domain_range: Any
+) -> list[float | None] | None:
+    """
+    Rescale numeric values all at once with NumPy
+
+    Returns `None` (so the values can be rescaled one at a time) if NumPy isn't installed, or if
+    float64 arithmetic could give a different result than rescaling each value on its own (e.g.,
+    for `Decimal` values, float32 values, or integers too large to be exactly represented).
+    """
+
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+
+    max_exact_int = 2**52
+
+    def is_exact(x: Any) -> bool:
+        if isinstance(x, float):
+            return True
+        if isinstance(x, (int, np.integer)):
+            return abs(int(x)) <= max_exact_int
+        return False
+
+    non_na_vals = [x for x, x_is_na in zip(vals, is_na_vals) if not x_is_na]
+    if not all(map(is_exact, non_na_vals)) or not (is_exact(domain_min) and is_exact(domain_range)):
+        return None
+
+    arr = np.array(non_na_vals, dtype=np.float64)
+    scaled = ((arr - float(domain_min)) / float(domain_range)).tolist()
+
+    scaled_iter = iter(scaled)
+    return [None if x_is_na else next(scaled_iter) for x_is_na in is_na_vals]
+
+
 def _rescale_factor(
     df: DataFrameLike, vals: list[int | float], domain: list[float], palette: list[str]
 ) -> list[float]:
@@ -674,7 +785,7 @@ def _get_domain_numeric(df: DataFrameLike, vals: list[int | float]) -> list[floa
     """
 
     # Exclude any NA values from `vals`
-    vals = [x for x in vals if not is_na(df, x)]
+    vals = [x for x in vals if not _is_na(df, x)]
 
     # Get the minimum and maximum values from `vals`
     domain_min = min(vals)
@@ -694,7 +805,7 @@ def _get_domain_factor(df: DataFrameLike, vals: list[str]) -> list[str]:
     """
 
     # Exclude any NA values from `vals`
-    vals = [x for x in vals if not is_na(df, x)]
+    vals = [x for x in vals if not _is_na(df, x)]
 
     # Create the domain by getting the unique values in `vals` in order provided
     seen: list[str] = []
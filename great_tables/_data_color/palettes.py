@@ -18,6 +18,10 @@ def rgb_to_hex(rgb: RGBColor) -> str:
     return f"#{rgb[0]:02x}{rgb[1]:02x}{rgb[2]:02x}"
 
 
+# Two-digit hex strings for each channel value, for building many hex colors at once
+_HEX_CHANNEL = [f"{x:02x}" for x in range(256)]
+
+
 # data ---------------------------------------------------------------------------------------------
 
 
@@ -125,15 +129,28 @@ class GradientPalette:
         self._g_coeffs = self._create_coefficients(values, [x[1] for x in rgb_colors])
         self._b_coeffs = self._create_coefficients(values, [x[2] for x in rgb_colors])
 
+        # The array path looks up coefficients by bisection, which matches every lookup
+        # class as long as the cutoffs are sorted
+        self._sorted_values = all(prev <= crnt for prev, crnt in pairwise(values))
+
     def __call__(self, data: list[float]) -> "list[str | None]":
         """Return data transformed to hex color values."""
 
         rgb = self.vals_to_rgb(data)
-        return [rgb_to_hex(x) if x is not None else None for x in rgb]
+        return [
+            "#" + _HEX_CHANNEL[x[0]] + _HEX_CHANNEL[x[1]] + _HEX_CHANNEL[x[2]]
+            if x is not None
+            else None
+            for x in rgb
+        ]
 
     def vals_to_rgb(self, data: list[float | None]) -> "list[RGBColor | None]":
         """Return data transformed to RGB values."""
 
+        out_array = self._vals_to_rgb_array(data)
+        if out_array is not None:
+            return out_array
+
         out: "list[RGBColor | None]" = []
         for ii, x in enumerate(data):
             if x is None:
@@ -154,6 +171,49 @@ class GradientPalette:
 
         return out
 
+    def _vals_to_rgb_array(self, data: list[float | None]) -> "list[RGBColor | None] | None":
+        """Return data transformed to RGB values, interpolating all values at once with NumPy.
+
+        This gives the same result as interpolating each value on its own. Returns `None` if
+        NumPy isn't installed or the data can't be converted to a float array, so that the values
+        can be interpolated one at a time instead.
+        """
+
+        try:
+            import numpy as np
+        except ImportError:
+            return None
+
+        if not self._sorted_values:
+            return None
+
+        try:
+            arr = np.array([np.nan if x is None else x for x in data], dtype=np.float64)
+        except (TypeError, ValueError, OverflowError):
+            return None
+
+        is_valid = np.isfinite(arr)
+        out_of_range = is_valid & ((arr < 0) | (arr > 1))
+        if out_of_range.any():
+            ii = int(np.argmax(out_of_range))
+            raise ValueError(f"Element {ii} is outside the range [0, 1]. Value: {data[ii]}.")
+
+        x = arr[is_valid]
+        idx = np.searchsorted(np.array(self.values[:-1], dtype=np.float64), x, side="right") - 1
+
+        channels = []
+        for coeffs in (self._r_coeffs, self._g_coeffs, self._b_coeffs):
+            scalar = np.array([coeff["scalar"] for coeff in coeffs.coeffs])[idx]
+            starting = np.array([coeff["starting"] for coeff in coeffs.coeffs])[idx]
+            intercept = np.array([coeff["intercept"] for coeff in coeffs.coeffs])[idx]
+
+            # np.rint rounds half to even, as round() does for floats
+            channel = np.rint(scalar * (x - starting) + intercept).astype(np.int64)
+            channels.append(channel.tolist())
+
+        valid_rgb = iter(zip(*channels))
+        return [next(valid_rgb) if valid else None for valid in is_valid.tolist()]
+
     @staticmethod
     def _linspace_to_one(n_steps: int) -> list[float]:
         # equivalent to np.linspace(0, 1, n_steps)
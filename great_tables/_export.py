@@ -7,11 +7,13 @@ import webbrowser
 from functools import partial
 from http.server import HTTPServer, SimpleHTTPRequestHandler
 from pathlib import Path
-from typing import TYPE_CHECKING, Literal
+from typing import IO, TYPE_CHECKING, Iterator, Literal
 
 from typing_extensions import TypeAlias
 
 from ._helpers import random_id
+from ._render_cache import render_html_table
+from ._render_checks import _render_check
 from ._scss import compile_scss
 from ._utils import _try_import
 from ._utils_render_latex import _render_as_latex
@@ -224,9 +226,15 @@ def as_raw_html(
     ```
     """
 
-    built_table = self._build_data(context="html")
+    # The checks run before the render cache is used, so that a cached render still warns
+    _render_check(self)
+
+    html_table = render_html_table(
+        self, "html", lambda: self._build_data(context="html")._render_table_as_html()
+    )
 
-    table_html = built_table._render_as_html(
+    table_html = self._wrap_html_table(
+        html_table,
         make_page=make_page,
         all_important=all_important,
     )
@@ -255,6 +263,78 @@ def as_raw_html(
     return table_html
 
 
+def iter_raw_html(
+    self: GT,
+    make_page: bool = False,
+    all_important: bool = False,
+    batch_size: int = 1000,
+) -> Iterator[str]:
+    """
+    Get the HTML content of a GT object in chunks.
+
+    The `iter_raw_html()` method produces the same HTML as `as_raw_html()`, but yields it in
+    chunks as it's generated instead of returning a single string: first the container and its
+    CSS, then the table heading and column labels, then the body in batches of rows, and finally
+    the footer. Joining the chunks gives the output of `as_raw_html()`.
+
+    This is useful for very large tables, since the full HTML never needs to be held in memory at
+    once. The chunks can be written to a file or socket as they're produced (see
+    `write_raw_html()`), or used as the body of a streaming HTTP response so that sending starts
+    before the table is complete.
+
+    Parameters
+    ----------
+    make_page
+        If `True`, the table will be wrapped in a complete HTML page with proper `<html>`, `<head>`,
+        and `<body>` tags.
+    all_important
+        If `True`, all CSS declarations are marked with `!important` to ensure they take precedence
+        over other styles that might be present in the document.
+    batch_size
+        The maximum number of table body rows in each chunk.
+
+    Returns
+    -------
+    Iterator[str]
+        An iterator of HTML strings.
+
+    Examples
+    --------
+    Let's write a table to a file, one chunk at a time.
+
+    ```python
+    from great_tables import GT
+    from great_tables.data import towny
+
+    gt_tbl = GT(towny).fmt_integer(columns="population_2021")
+
+    with open("towny.html", "w") as f:
+        for chunk in gt_tbl.iter_raw_html(make_page=True, batch_size=200):
+            f.write(chunk)
+    ```
+
+    Since the chunks are produced lazily, they can also be passed to a streaming response in a
+    web framework (e.g., `StreamingResponse` in Starlette).
+    """
+
+    if batch_size < 1:
+        raise ValueError(
+            f"The `batch_size=` value must be at least 1, but {batch_size} was provided."
+        )
+
+    _render_check(self)
+
+    built_table = self._build_data(context="html")
+
+    table_chunks = built_table._iter_table_as_html(batch_size=batch_size)
+
+    return self._iter_wrapped_html(
+        table_chunks,
+        make_page=make_page,
+        all_important=all_important,
+    )
+
+
 def as_latex(self: GT, use_longtable: bool = False, tbl_pos: str | None = None) -> str:
     """
     Output a GT object as LaTeX
@@ -582,7 +662,7 @@ def _dump_debug_screenshot(driver, path):
 
 def write_raw_html(
     gt: GT,
-    filename: str | Path,
+    filename: str | Path | IO[str],
     encoding: str = "utf-8",
     inline_css: bool = False,
     newline: str | None = None,
@@ -593,14 +673,19 @@ def write_raw_html(
     Write the table to an HTML file.
 
     This helper function saves the output of `GT.as_raw_html()` to an HTML file specified by the
-    user.
+    user. Unless `inline_css=True`, the HTML is written in chunks as it's generated (see
+    `GT.iter_raw_html()`), so the full HTML of a large table is never held in memory at once.
 
     Parameters
     ----------
     gt
         A GT object.
     filename
-        The name of the file to save the HTML. Can be a string or a `pathlib.Path` object.
+        The name of the file to save the HTML. Can be a string or a `pathlib.Path` object. This can
+        also be a writable text file object (e.g., an open file, `sys.stdout`, or a socket wrapped
+        with `socket.makefile("w")`), in which case `encoding=` and `newline=` are not used. A file
+        at the given path is only written once the HTML is complete, so it's left as it was if an
+        error occurs while rendering the table.
     encoding
         The encoding used when writing the file. Defaults to 'utf-8'.
     inline_css
@@ -616,14 +701,41 @@ def write_raw_html(
     """
     import os
 
-    html_content = as_raw_html(
-        gt, inline_css=inline_css, make_page=make_page, all_important=all_important
-    )
+    is_path = isinstance(filename, (str, Path))
+
+    if not is_path and not hasattr(filename, "write"):
+        raise TypeError(
+            "The `filename=` value must be a string, a `pathlib.Path` object, or a writable file "
+            f"object, but an object of type {type(filename).__name__} was provided."
+        )
+
+    if inline_css:
+        # Inlining the CSS needs the complete HTML
+        html_chunks = [
+            as_raw_html(gt, inline_css=True, make_page=make_page, all_important=all_important)
+        ]
+    else:
+        html_chunks = iter_raw_html(gt, make_page=make_page, all_important=all_important)
+
+    if not is_path:
+        for chunk in html_chunks:
+            filename.write(chunk)
+        return
 
     newline = newline if newline is not None else os.linesep
 
-    with open(filename, "w", encoding=encoding, newline=newline) as f:
-        f.write(html_content)
+    # Write to a temporary file next to the target first, so that an error while rendering
+    # doesn't leave a partial file behind
+    path = Path(filename)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+
+    try:
+        with open(tmp_path, "w", encoding=encoding, newline=newline) as f:
+            f.writelines(html_chunks)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
 
 def gtsave(
@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+import hashlib
 import math
+import os
 import re
-from collections.abc import Callable
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import date, datetime, time
 from decimal import Decimal
-from functools import partial
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import (
     TYPE_CHECKING,
@@ -14,7 +19,6 @@ from typing import (
     ClassVar,
     Literal,
     TypeAlias,
-    TypedDict,
     TypeVar,
     cast,
     overload,
@@ -22,30 +26,26 @@ from typing import (
 
 import babel
 import faicons
-from babel.dates import format_date, format_datetime, format_time
+from babel.dates import DateTimePattern, format_date, format_datetime, format_time, parse_pattern
 
 from ._gt_data import FormatFn, FormatFns, FormatInfo, FormatterSkipElement, GTData, PFrameData
 from ._helpers import px
-from ._locale import (
-    _get_currencies_data,
-    _get_default_locales_data,
-    _get_flags_data,
-    _get_locales_data,
-)
+from ._locale import _get_flag_row, _get_locale_registry
 from ._locations import resolve_cols_c, resolve_rows_i
 from ._tbl_data import (
     Agnostic,
     DataFrameLike,
     PlExpr,
     SelectExpr,
+    _get_column_cells,
     _get_column_dtype,
     is_na,
     is_series,
     to_list,
 )
-from ._text import _md_html, _md_latex, escape_pattern_str_latex
+from ._text import _md_html, _md_html_many, _md_latex, escape_pattern_str_latex
 from ._utils import _str_detect, _str_replace, is_valid_http_schema
-from ._utils_nanoplots import _generate_nanoplot
+from ._utils_nanoplots import _generate_nanoplot, _SingleYScale
 
 if TYPE_CHECKING:
     from ._types import GTSelf
@@ -157,9 +157,9 @@ def fmt(
     formatter = FormatInfo(fns, col_res, row_pos)
 
     if is_substitution:
-        return self._replace(_substitutions=[*self._substitutions, formatter])
+        return self._replace(_substitutions=self._substitutions + [formatter])
 
-    return self._replace(_formats=[*self._formats, formatter])
+    return self._replace(_formats=self._formats + [formatter])
 
 
 def fmt_number(
@@ -317,7 +317,9 @@ def fmt_number(
         pattern=pattern,
     )
 
-    return fmt_by_context(self, pf_format=pf_format, columns=columns, rows=rows)
+    pf_batch = partial(fmt_number_batch, **pf_format.keywords)
+
+    return fmt_by_context(self, pf_format=pf_format, columns=columns, rows=rows, pf_batch=pf_batch)
 
 
 def fmt_number_context(
@@ -391,6 +393,59 @@ def fmt_number_context(
     return x_formatted
 
 
+def fmt_number_batch(
+    x: list[Any],
+    data: GTData,
+    decimals: int,
+    n_sigfig: int | None,
+    drop_trailing_zeros: bool,
+    drop_trailing_dec_mark: bool,
+    use_seps: bool,
+    accounting: bool,
+    scale_by: float,
+    compact: bool,
+    sep_mark: str,
+    dec_mark: str,
+    force_sign: bool,
+    pattern: str,
+    context: str,
+) -> list[Any] | None:
+    """Vectorized version of `fmt_number_context()`, for a whole batch of values.
+
+    Returns `None` when the values (or options) can't go through the vectorized kernel, in which
+    case the values should be formatted one at a time.
+    """
+
+    # Compact and significant-figure formatting are only handled by the per-value pathway
+    if compact or n_sigfig:
+        return None
+
+    arr, is_na_ = _as_float_array(x, scale_by=scale_by)
+    if arr is None:
+        return None
+
+    x_formatted = _value_to_decimal_notation_array(
+        values=arr,
+        decimals=decimals,
+        drop_trailing_zeros=drop_trailing_zeros,
+        drop_trailing_dec_mark=drop_trailing_dec_mark,
+        use_seps=use_seps,
+        sep_mark=sep_mark,
+        dec_mark=dec_mark,
+        force_sign=force_sign,
+    )
+
+    return _finalize_formatted_batch(
+        x=x,
+        x_formatted=x_formatted,
+        is_na=is_na_,
+        is_negative=(arr < 0).tolist(),
+        accounting=accounting,
+        pattern=pattern,
+        context=context,
+    )
+
+
 def fmt_integer(
     self: GTSelf,
     columns: SelectExpr = None,
@@ -511,7 +566,9 @@ def fmt_integer(
         pattern=pattern,
     )
 
-    return fmt_by_context(self, pf_format=pf_format, columns=columns, rows=rows)
+    pf_batch = partial(fmt_integer_batch, **pf_format.keywords)
+
+    return fmt_by_context(self, pf_format=pf_format, columns=columns, rows=rows, pf_batch=pf_batch)
 
 
 def fmt_integer_context(
@@ -581,6 +638,53 @@ def fmt_integer_context(
     return x_formatted
 
 
+def fmt_integer_batch(
+    x: list[Any],
+    data: PFrameData,
+    use_seps: bool,
+    scale_by: float,
+    accounting: bool,
+    compact: bool,
+    sep_mark: str,
+    force_sign: bool,
+    pattern: str,
+    context: str,
+) -> list[Any] | None:
+    """Vectorized version of `fmt_integer_context()`, for a whole batch of values.
+
+    Returns `None` when the values (or options) can't go through the vectorized kernel, in which
+    case the values should be formatted one at a time.
+    """
+
+    if compact:
+        return None
+
+    arr, is_na_ = _as_float_array(x, scale_by=scale_by)
+    if arr is None:
+        return None
+
+    x_formatted = _value_to_decimal_notation_array(
+        values=arr,
+        decimals=0,
+        drop_trailing_zeros=False,
+        drop_trailing_dec_mark=True,
+        use_seps=use_seps,
+        sep_mark=sep_mark,
+        dec_mark="not used",
+        force_sign=force_sign,
+    )
+
+    return _finalize_formatted_batch(
+        x=x,
+        x_formatted=x_formatted,
+        is_na=is_na_,
+        is_negative=(arr < 0).tolist(),
+        accounting=accounting,
+        pattern=pattern,
+        context=context,
+    )
+
+
 def fmt_scientific(
     self: GTSelf,
     columns: SelectExpr = None,
@@ -1747,7 +1851,9 @@ def fmt_percent(
         pattern=pattern,
     )
 
-    return fmt_by_context(self, pf_format=pf_format, columns=columns, rows=rows)
+    pf_batch = partial(fmt_percent_batch, **pf_format.keywords)
+
+    return fmt_by_context(self, pf_format=pf_format, columns=columns, rows=rows, pf_batch=pf_batch)
 
 
 def fmt_percent_context(
@@ -1831,6 +1937,77 @@ def fmt_percent_context(
     return x_formatted
 
 
+def fmt_percent_batch(
+    x: list[Any],
+    data: GTData,
+    decimals: int,
+    drop_trailing_zeros: bool,
+    drop_trailing_dec_mark: bool,
+    use_seps: bool,
+    accounting: bool,
+    scale_by: float,
+    sep_mark: str,
+    dec_mark: str,
+    force_sign: bool,
+    placement: str,
+    incl_space: bool,
+    pattern: str,
+    context: str,
+) -> list[Any] | None:
+    """Vectorized version of `fmt_percent_context()`, for a whole batch of values.
+
+    Returns `None` when the values can't go through the vectorized kernel, in which case the values
+    should be formatted one at a time.
+    """
+
+    arr, is_na_ = _as_float_array(x, scale_by=scale_by)
+    if arr is None:
+        return None
+
+    is_negative = (arr < 0).tolist()
+    is_positive = (arr > 0).tolist()
+
+    x_formatted = _value_to_decimal_notation_array(
+        values=arr,
+        decimals=decimals,
+        drop_trailing_zeros=drop_trailing_zeros,
+        drop_trailing_dec_mark=drop_trailing_dec_mark,
+        use_seps=use_seps,
+        sep_mark=sep_mark,
+        dec_mark=dec_mark,
+        force_sign=force_sign,
+    )
+
+    # Get the context-specific percent mark
+    percent_mark = _context_percent_mark(context=context)
+
+    # Create a percent pattern for affixing the percent sign
+    space_character = " " if incl_space else ""
+    percent_pattern = (
+        f"{{x}}{space_character}{percent_mark}"
+        if placement == "right"
+        else f"{percent_mark}{space_character}{{x}}"
+    )
+
+    for ii, (negative, positive) in enumerate(zip(is_negative, is_positive)):
+        if negative and placement == "left":
+            x_formatted[ii] = "-" + percent_pattern.replace("{x}", x_formatted[ii].replace("-", ""))
+        elif positive and force_sign and placement == "left":
+            x_formatted[ii] = "+" + percent_pattern.replace("{x}", x_formatted[ii].replace("+", ""))
+        else:
+            x_formatted[ii] = percent_pattern.replace("{x}", x_formatted[ii])
+
+    return _finalize_formatted_batch(
+        x=x,
+        x_formatted=x_formatted,
+        is_na=is_na_,
+        is_negative=is_negative,
+        accounting=accounting,
+        pattern=pattern,
+        context=context,
+    )
+
+
 # Scale factors for parts-per units (multiply proportion by this value)
 _PARTSPER_UNITS: dict[str, dict[str, Any]] = {
     "per-mille": {"factor": 1_000, "symbol": "\u2030"},
@@ -3709,7 +3886,9 @@ def fmt_date(
         locale=locale,
     )
 
-    return fmt_by_context(self, pf_format=pf_format, columns=columns, rows=rows)
+    pf_batch = partial(_format_distinct, pf_format=pf_format)
+
+    return fmt_by_context(self, pf_format=pf_format, columns=columns, rows=rows, pf_batch=pf_batch)
 
 
 def fmt_date_context(
@@ -3732,14 +3911,8 @@ def fmt_date_context(
         # Stop if `x` is not a valid date object
         _validate_date_obj(x=x)
 
-    # Fix up the locale for `format_date()` by replacing any hyphens with underscores
-    if locale is None:
-        locale = "en_US"
-    else:
-        locale = _str_replace(locale, "-", "_")
-
     # Format the date object to a string using Babel's `format_date()` function
-    x_formatted = format_date(x, format=date_format_str, locale=locale)
+    x_formatted = _format_datetime_babel(x, "date", date_format_str, locale)
 
     # Use a supplied pattern specification to decorate the formatted value
     if pattern != "{x}":
@@ -3847,7 +4020,9 @@ def fmt_time(
         context=None,  # Ensure the 'context' parameter is explicitly handled
     )
 
-    return fmt_by_context(self, pf_format=pf_format, columns=columns, rows=rows)
+    pf_batch = partial(_format_distinct, pf_format=pf_format)
+
+    return fmt_by_context(self, pf_format=pf_format, columns=columns, rows=rows, pf_batch=pf_batch)
 
 
 def fmt_time_context(
@@ -3870,14 +4045,8 @@ def fmt_time_context(
         # Stop if `x` is not a valid time object
         _validate_time_obj(x=x)
 
-    # Fix up the locale for `format_time()` by replacing any hyphens with underscores
-    if locale is None:
-        locale = "en_US"
-    else:
-        locale = _str_replace(locale, "-", "_")
-
     # Format the time object to a string using Babel's `format_time()` function
-    x_formatted = format_time(x, format=time_format_str, locale=locale)
+    x_formatted = _format_datetime_babel(x, "time", time_format_str, locale)
 
     # Use a supplied pattern specification to decorate the formatted value
     if pattern != "{x}":
@@ -4027,7 +4196,9 @@ def fmt_datetime(
         locale=locale,
     )
 
-    return fmt_by_context(self, pf_format=pf_format, columns=columns, rows=rows)
+    pf_batch = partial(_format_distinct, pf_format=pf_format)
+
+    return fmt_by_context(self, pf_format=pf_format, columns=columns, rows=rows, pf_batch=pf_batch)
 
 
 def fmt_datetime_context(
@@ -4063,14 +4234,8 @@ def fmt_datetime_context(
         # From the date and time format strings, create a datetime format string
         datetime_format_str = f"{date_format_str}'{sep}'{time_format_str}"
 
-        # Fix up the locale for `format_datetime()` by replacing any hyphens with underscores
-        if locale is None:
-            locale = "en_US"
-        else:
-            locale = _str_replace(locale, "-", "_")
-
         # Format the datetime object to a string using Babel's `format_datetime()` function
-        x_formatted = format_datetime(x, format=datetime_format_str, locale=locale)
+        x_formatted = _format_datetime_babel(x, "datetime", datetime_format_str, locale)
 
     # Use a supplied pattern specification to decorate the formatted value
     if pattern != "{x}":
@@ -4462,7 +4627,9 @@ def fmt_markdown(
         data=self,
     )
 
-    return fmt_by_context(self, pf_format=pf_format, columns=columns, rows=rows)
+    pf_batch = partial(fmt_markdown_batch, data=self)
+
+    return fmt_by_context(self, pf_format=pf_format, columns=columns, rows=rows, pf_batch=pf_batch)
 
 
 def fmt_markdown_context(
@@ -4483,6 +4650,21 @@ def fmt_markdown_context(
     return x_formatted
 
 
+def fmt_markdown_batch(x: list[Any], data: GTData, context: str) -> list[Any] | None:
+    """Batch version of `fmt_markdown_context()`, rendering the Markdown of the values together.
+
+    Returns `None` for LaTeX output, in which case the values should be formatted one at a time.
+    """
+
+    if context == "latex":
+        return None
+
+    is_na_ = [is_na(data._tbl_data, value) for value in x]
+    x_formatted = iter(_md_html_many([str(value) for value, na in zip(x, is_na_) if not na]))
+
+    return [value if na else next(x_formatted) for value, na in zip(x, is_na_)]
+
+
 def fmt_units(
     self: GTSelf,
     columns: SelectExpr = None,
@@ -4695,6 +4877,143 @@ def _value_to_decimal_notation(
     return result
 
 
+def _value_to_decimal_notation_array(
+    values: Any,
+    decimals: int = 2,
+    drop_trailing_zeros: bool = False,
+    drop_trailing_dec_mark: bool = True,
+    use_seps: bool = True,
+    sep_mark: str = ",",
+    dec_mark: str = ".",
+    force_sign: bool = False,
+) -> list[str]:
+    """
+    Decimal notation for an array of values.
+
+    This is the vectorized counterpart of `_value_to_decimal_notation()` (with fixed decimals) for
+    a float64 NumPy array. Grouping separators are produced by the format specification itself
+    (rather than by inserting them digit by digit), and then swapped for the requested marks.
+    """
+
+    fmt_spec = f",.{decimals}f" if use_seps else f".{decimals}f"
+    result = [format(value, fmt_spec) for value in values.tolist()]
+
+    if (use_seps and sep_mark != ",") or dec_mark != ".":
+        marks = str.maketrans({",": sep_mark, ".": dec_mark})
+        result = [x.translate(marks) for x in result]
+
+    # Drop any trailing zeros if option is taken
+    if drop_trailing_zeros:
+        result = [x.rstrip("0") for x in result]
+
+    # Drop the trailing decimal mark if it is present, or add one in if it's absent
+    if drop_trailing_dec_mark:
+        result = [x.rstrip(dec_mark) for x in result]
+    else:
+        result = [x if dec_mark in x else x + dec_mark for x in result]
+
+    # Force the positive sign to be present if the `force_sign` option is taken
+    if force_sign:
+        result = [
+            "+" + x if is_positive else x for x, is_positive in zip(result, (values > 0).tolist())
+        ]
+
+    return result
+
+
+def _as_float_array(x: Any, scale_by: float) -> tuple[Any, list[bool]]:
+    """
+    Convert values to a scaled float64 NumPy array, for the vectorized formatters.
+
+    The input can be a list of values, a NumPy array, or an Arrow array. Returns the scaled array
+    and a list flagging the missing values. The array is `None` if NumPy isn't installed, or if
+    scaling and formatting the values as floats could give a different result than formatting each
+    value on its own (e.g., `Decimal` values or integers too large to be exactly represented).
+    """
+
+    try:
+        import numpy as np
+    except ImportError:
+        return None, []
+
+    max_exact_int = 2**53
+
+    if isinstance(scale_by, bool) or not isinstance(scale_by, (int, float)):
+        return None, []
+    if isinstance(scale_by, int) and abs(scale_by) > max_exact_int:
+        return None, []
+
+    if isinstance(x, list):
+        for value in x:
+            if value is None or isinstance(value, float):
+                continue
+            if not isinstance(value, (int, np.integer)) or abs(value) > max_exact_int:
+                return None, []
+
+        arr = np.array(x, dtype=np.float64)
+
+    else:
+        arr = np.asarray(x)
+
+        if arr.dtype.kind not in "iuf":
+            return None, []
+        if arr.dtype.kind in "iu" and arr.size and np.abs(arr).max() > max_exact_int:
+            return None, []
+
+        arr = arr.astype(np.float64)
+
+    # Missing values are recorded before scaling, since scaling can introduce NaN (e.g. inf * 0)
+    is_na = np.isnan(arr).tolist()
+
+    # Scale the values; adding zero normalizes any negative zero, which otherwise formats with a
+    # leading minus sign
+    arr = arr * scale_by + 0.0
+
+    return arr, is_na
+
+
+def _finalize_formatted_batch(
+    x: Any,
+    x_formatted: list[str],
+    is_na: list[bool],
+    is_negative: list[bool],
+    accounting: bool,
+    pattern: str,
+    context: str,
+) -> list[Any]:
+    """
+    Apply negative value styling and the pattern to a batch of formatted values.
+
+    Missing values are returned as they were found in `x`.
+    """
+
+    minus_mark = _context_minus_mark(context=context)
+
+    # Escape LaTeX special characters from literals in the pattern
+    if pattern != "{x}" and context == "latex":
+        pattern = escape_pattern_str_latex(pattern_str=pattern)
+
+    result: list[Any] = []
+    for value, formatted, na, negative in zip(x, x_formatted, is_na, is_negative):
+        if na:
+            result.append(value)
+            continue
+
+        # Implement minus sign replacement or use accounting style
+        if negative:
+            if accounting:
+                formatted = f"({_remove_minus(formatted)})"
+            else:
+                formatted = _replace_minus(formatted, minus_mark=minus_mark)
+
+        if pattern != "{x}":
+            formatted = pattern.replace("{x}", formatted)
+
+        result.append(formatted)
+
+    return result
+
+
 def _value_to_scientific_notation(
     value: float,
     decimals: int = 2,
@@ -5116,19 +5435,6 @@ def _remove_minus(string: str) -> str:
     return _str_replace(string, "-", "")
 
 
-T_dict = TypeVar("T_dict", bound=TypedDict)
-
-
-# TODO: remove pandas
-def _filter_pd_df_to_row(pd_df: list[T_dict], column: str, filter_expr: str) -> T_dict:
-    filtered_pd_df = [entry for entry in pd_df if entry[column] == filter_expr]
-    if len(filtered_pd_df) != 1:
-        raise Exception(
-            "Internal Error, the filtered table doesn't result in a table of exactly one row."
-        )
-    return filtered_pd_df[0]
-
-
 def _get_locale_sep_mark(default: str, use_seps: bool, locale: str | None = None) -> str:
     # If `use_seps` is False, then force `sep_mark` to be an empty string
     # TODO: what does an empty string signify? Where is this used? Is it the right choice here?
@@ -5140,7 +5446,7 @@ def _get_locale_sep_mark(default: str, use_seps: bool, locale: str | None = None
         return default
 
     # Get the correct `group` value from the locales lookup table
-    pd_df_row = _filter_pd_df_to_row(pd_df=_get_locales_data(), column="locale", filter_expr=locale)
+    pd_df_row = _get_locale_registry().get_locale(locale)
 
     # Obtain a single cell value from the single row in `pd_df_row` that is below
     # the column named 'group'; this could potentially be of any type but we expect
@@ -5163,7 +5469,7 @@ def _get_locale_dec_mark(default: str, locale: str | None = None) -> str:
         return default
 
     # Get the correct `decimal` value row from the locales lookup table
-    pd_df_row = _filter_pd_df_to_row(pd_df=_get_locales_data(), column="locale", filter_expr=locale)
+    pd_df_row = _get_locale_registry().get_locale(locale)
 
     # Obtain a single cell value from the single row in `pd_df_row` that is below
     # the column named 'decimal'; this could potentially be of any type but we expect
@@ -5186,10 +5492,8 @@ def _get_locales_list() -> list[str]:
         TypeError: If the first element of the locale list is not a string.
     """
 
-    # Get the 'locales' dataset and obtain from that a list of locales
-    # TODO: remove pandas
-    locales = _get_locales_data()
-    locale_list: list[str] = [entry["locale"] for entry in locales]
+    # Get the indexed 'locales' dataset and obtain from that a list of locales
+    locale_list: list[str] = list(_get_locale_registry().locales)
 
     # Ensure that `locale_list` is of the type 'str'
     # TODO: we control this data and should enforce this in the data schema
@@ -5215,14 +5519,13 @@ def _validate_locale(locale: str | None = None) -> None:
     if locale is None:
         return
 
-    locales_list = _get_locales_list()
-    default_locales_list = [entry["default_locale"] for entry in _get_default_locales_data()]
+    registry = _get_locale_registry()
 
     # Replace any underscores with hyphens
     supplied_locale = _str_replace(locale, "_", "-")
 
     # Stop if the `locale` provided isn't a valid one
-    if supplied_locale not in locales_list and supplied_locale not in default_locales_list:
+    if supplied_locale not in registry.locales and supplied_locale not in registry.default_locales:
         raise ValueError(
             f"The normalized locale name `{supplied_locale}` is not in the list of locales."
         )
@@ -5250,17 +5553,10 @@ def _normalize_locale(locale: str | None = None) -> str | None:
     supplied_locale = _str_replace(locale, "_", "-")
 
     # Resolve any default locales into their base names (e.g., 'en-US' -> 'en')
-    # TODO: remove pandas
-    default_locales = _get_default_locales_data()
-
-    matches = [
-        entry["base_locale"]
-        for entry in default_locales
-        if entry["default_locale"] == supplied_locale
-    ]
+    base_locale = _get_locale_registry().default_locales.get(supplied_locale)
 
-    if matches:
-        return matches[0]
+    if base_locale is not None:
+        return base_locale
 
     try:
         babel.Locale.parse(supplied_locale, sep="-")
@@ -5316,7 +5612,7 @@ def _get_locale_currency_code(locale: str | None = None) -> str:
         return "USD"
 
     # Get the correct 'locale' value row from the `__x_locales` lookup table
-    pd_df_row = _filter_pd_df_to_row(pd_df=_get_locales_data(), column="locale", filter_expr=locale)
+    pd_df_row = _get_locale_registry().get_locale(locale)
 
     # Extract the 'currency_code' cell value from this 1-row DataFrame
     currency_code = pd_df_row["currency_code"]
@@ -5350,12 +5646,9 @@ def _get_currency_str(currency: str) -> str:
     """
 
     # Get the correct 'curr_code' value row from the `__x_currencies` lookup table
-    pd_df_row = _filter_pd_df_to_row(
-        pd_df=_get_currencies_data(), column="curr_code", filter_expr=currency
-    )
+    pd_df_row = _get_locale_registry().get_currency(currency)
 
-    # Extract the 'symbol' cell value from this 1-row DataFrame
-    # TODO: remove pandas
+    # Extract the 'symbol' cell value from this row
     currency_str = pd_df_row["symbol"]
 
     # Ensure that `currency_str` is of the type 'str'
@@ -5381,12 +5674,9 @@ def _validate_currency(currency: str) -> None:
     - None
     """
 
-    # Get the currencies data
-    codes = [entry["curr_code"] for entry in _get_currencies_data()]
-
     # Stop if the `currency` provided isn't a valid one
     # TODO: how do users know what currencies are supported?
-    if currency not in codes:
+    if currency not in _get_locale_registry().currencies:
         raise ValueError(
             f"The supplied currency `{currency}` is not in the list of supported currencies."
         )
@@ -5437,13 +5727,10 @@ def _get_currency_exponent(currency: str) -> int:
     Returns:
         int: The exponent associated with the currency code.
     """
-    currencies = _get_currencies_data()
-
-    # get the curr_code column from currencies df as a list
-    matches = [entry["exponent"] for entry in currencies if entry["curr_code"] == currency]
+    currency_row = _get_locale_registry().currencies.get(currency)
 
-    if matches:
-        exponent = matches[0]
+    if currency_row is not None:
+        exponent = currency_row["exponent"]
 
         # TODO: why does this happen here if we control currency data?
         exponent = int(exponent)
@@ -5559,6 +5846,91 @@ def _validate_case(case: str) -> None:
         raise ValueError(f"The `case` argument must be either 'upper' or 'lower' (not '{case}').")
 
 
+_BABEL_FORMATTERS = {"date": format_date, "time": format_time, "datetime": format_datetime}
+
+
+def _format_datetime_babel(x: Any, kind: str, format_str: str, locale: str | None) -> str:
+    """
+    Format a date, time, or datetime object with Babel, using a format pattern like "y-MM-dd".
+
+    Results are memoized, since tables (e.g., of time series) often repeat the same values. The
+    type and timezone of `x` are part of the key, since values that compare equal (e.g., the same
+    instant in two timezones) can be formatted differently.
+    """
+    tzinfo = getattr(x, "tzinfo", None)
+
+    try:
+        hash(tzinfo)
+    except TypeError:
+        return _format_datetime_babel_uncached(x, kind, format_str, locale)
+
+    return _format_datetime_babel_cached(x, type(x), tzinfo, kind, format_str, locale)
+
+
+@lru_cache(maxsize=4096)
+def _format_datetime_babel_cached(
+    x: Any, x_type: type, tzinfo: Any, kind: str, format_str: str, locale: str | None
+) -> str:
+    return _format_datetime_babel_uncached(x, kind, format_str, locale)
+
+
+def _format_datetime_babel_uncached(x: Any, kind: str, format_str: str, locale: str | None) -> str:
+    # The Locale and pattern are passed to Babel already resolved, since resolving them from
+    # strings takes most of the time for each value
+    return _BABEL_FORMATTERS[kind](
+        x, format=_get_datetime_pattern(format_str), locale=_get_babel_locale(locale)
+    )
+
+
+@lru_cache(maxsize=64)
+def _get_babel_locale(locale: str | None) -> babel.Locale:
+    """Get the Babel `Locale` for a locale ID, resolving it only once per ID."""
+
+    # Fix up the locale for Babel by replacing any hyphens with underscores
+    if locale is None:
+        locale = "en_US"
+    else:
+        locale = _str_replace(locale, "-", "_")
+
+    return babel.Locale.parse(locale)
+
+
+@lru_cache(maxsize=256)
+def _get_datetime_pattern(format_str: str) -> DateTimePattern:
+    """Get the compiled Babel pattern for a date/time format string like "y-MM-dd"."""
+    return parse_pattern(format_str)
+
+
+def _format_distinct(x: list[Any], pf_format: Callable[..., str], context: str) -> list[Any] | None:
+    """
+    Format a batch of values, formatting each distinct value only once.
+
+    This suits formatters whose output only depends on the value (like `fmt_date()`), for columns
+    where values repeat (like the dates of a time series). Returns `None` if a value can't be used
+    as a key, in which case the values should be formatted one at a time.
+    """
+    formatted: dict[Any, Any] = {}
+    result: list[Any] = []
+
+    for value in x:
+        key = (type(value), value, getattr(value, "tzinfo", None))
+
+        try:
+            res = formatted.get(key, _MISSING)
+        except TypeError:
+            return None
+
+        if res is _MISSING:
+            res = formatted[key] = pf_format(value, context=context)
+
+        result.append(res)
+
+    return result
+
+
+_MISSING = object()
+
+
 def _get_date_formats_dict() -> dict[str, str]:
     date_formats = {
         "iso": "y-MM-dd",
@@ -5777,6 +6149,7 @@ def fmt_image(
     path: str | Path | None = None,
     file_pattern: str = "{}",
     encode: bool = True,
+    shared_css: bool = False,
 ) -> GTSelf:
     """Format image paths to generate images in cells.
 
@@ -5816,6 +6189,13 @@ def fmt_image(
     encode
         The option to always use Base64 encoding for image paths that are determined to be local. By
         default, this is `True`.
+    shared_css
+        With `encode=True`, the option to put each encoded local image in a CSS rule (added to the
+        table's CSS, as with [`opt_css()`](`great_tables.GT.opt_css`)) rather than in every `<img>`
+        tag that shows it. This makes the output much smaller when the same images are repeated
+        across many cells. The files are read when `fmt_image()` is called, and the images are
+        shown through the CSS `content` property, so they won't appear where the table's CSS isn't
+        applied (e.g., in most email clients). By default, this is `False`.
 
     Returns
     -------
@@ -5869,14 +6249,45 @@ def fmt_image(
     if height is None and width is None:
         height = "2em"
 
-    formatter = FmtImage(self._tbl_data, height, width, sep, path, file_pattern, encode)
-    return fmt(
+    formatter = FmtImage(
+        self._tbl_data, height, width, sep, path, file_pattern, encode, shared_css and encode
+    )
+    res = fmt(
         self,
-        fns=FormatFns(html=formatter.to_html, latex=formatter.to_latex, default=formatter.to_html),
+        fns=FormatFns(
+            html=formatter.to_html,
+            latex=formatter.to_latex,
+            default=formatter.to_html,
+            batch={"html": formatter.to_html_batch},
+        ),
         columns=columns,
         rows=rows,
     )
 
+    if formatter.shared_css:
+        from ._options import opt_css
+
+        vals = [
+            val
+            for col, rows_i in res._formats[-1].cells.resolve_columns()
+            for val in _get_column_cells(self._tbl_data, col, rows_i)
+        ]
+        res = opt_css(res, formatter.to_shared_css(vals))
+
+    return res
+
+
+_IMAGE_URI_CACHE_SIZE = 256
+_IMAGE_PREFETCH_WORKERS = 8
+
+_image_uri_cache: OrderedDict[tuple[str, int, int], str] = OrderedDict()
+_image_uri_lock = threading.Lock()
+
+
+def _get_image_file_key(filename: str) -> tuple[str, int, int]:
+    stat = os.stat(filename)
+    return (filename, stat.st_mtime_ns, stat.st_size)
+
 
 @dataclass
 class FmtImage:
@@ -5887,6 +6298,7 @@ class FmtImage:
     path: str | Path | None = None
     file_pattern: str = "{}"
     encode: bool = True
+    shared_css: bool = False
 
     SPAN_TEMPLATE: ClassVar = '<span style="white-space:nowrap;">{}</span>'
 
@@ -5898,11 +6310,6 @@ class FmtImage:
         if is_na(self.dispatch_on, val):
             return val
 
-        if "," in val:
-            files = re.split(r",\s*", val)
-        else:
-            files = [val]
-
         # TODO: if we allowing height and width to be set based on column values, then
         # they could end up as bespoke types like np int64, etc..
         # We should ensure we process those before hitting FmtImage
@@ -5916,33 +6323,81 @@ class FmtImage:
         if isinstance(self.width, (int, float)):
             raise NotImplementedError("The width argument must be specified as a string.")
 
+        out: list[str] = []
+        for source, is_local in self._get_sources(val):
+            if not is_local or not self.encode:
+                uri = source
+            elif self.shared_css:
+                # The image is set by a CSS rule (see `to_shared_css()`)
+                css_class = self._get_css_class(source)
+                out.append(self._build_img_tag(None, height, self.width, css_class=css_class))
+                continue
+            else:
+                uri = self._get_image_uri(source)
+
+            # TODO: do we have a way to create tags, that is good at escaping, etc..?
+            out.append(self._build_img_tag(uri, height, self.width))
+
+        img_tags = self.sep.join(out)
+        span = self.SPAN_TEMPLATE.format(img_tags)
+
+        return span
+
+    def to_html_batch(self, vals: list[Any]) -> list[Any]:
+        # Read the local files of the whole batch in parallel, then format from the cache
+        if self.encode and not self.shared_css:
+            self._prefetch_image_uris(self._get_local_files(vals))
+
+        return [self.to_html(val) for val in vals]
+
+    def to_shared_css(self, vals: list[Any]) -> str:
+        """Get the CSS rules holding the encoded local images of `vals`, one per file."""
+
+        filenames = self._get_local_files(vals)
+        self._prefetch_image_uris(filenames)
+
+        rules = []
+        for filename in filenames:
+            uri = self._get_image_uri(filename)
+            rules.append(f'.{self._get_css_class(filename)} {{ content: url("{uri}"); }}')
+
+        return "\n".join(rules)
+
+    def _get_sources(self, val: str) -> list[tuple[str, bool]]:
+        """Get the URL or absolute path of each image in a value, and whether it's a local file."""
+
+        if "," in val:
+            files = re.split(r",\s*", val)
+        else:
+            files = [val]
+
         full_files = self._apply_pattern(self.file_pattern, files)
 
-        out: list[str] = []
+        sources: list[tuple[str, bool]] = []
         for file in full_files:
             # Case 1: from url via `dispatch_on`
             if self.path is None and is_valid_http_schema(file):
-                uri = file.rstrip().removesuffix("/")
+                sources.append((file.rstrip().removesuffix("/"), False))
             # Case 2: from url via `path`
             elif self.path is not None and is_valid_http_schema(str(self.path)):
                 norm_path = str(self.path).rstrip().removesuffix("/")
-                uri = f"{norm_path}/{file}"
+                sources.append((f"{norm_path}/{file}", False))
             # Case 3:
             else:
-                filename = str((Path(self.path or "") / file).expanduser().absolute())
+                sources.append((str((Path(self.path or "") / file).expanduser().absolute()), True))
 
-                if self.encode:
-                    uri = self._get_image_uri(filename)
-                else:
-                    uri = filename
+        return sources
 
-            # TODO: do we have a way to create tags, that is good at escaping, etc..?
-            out.append(self._build_img_tag(uri, height, self.width))
+    def _get_local_files(self, vals: list[Any]) -> list[str]:
+        filenames: dict[str, None] = {}
+        for val in vals:
+            if is_na(self.dispatch_on, val):
+                continue
+            for source, is_local in self._get_sources(val):
+                if is_local:
+                    filenames[source] = None
 
-        img_tags = self.sep.join(out)
-        span = self.SPAN_TEMPLATE.format(img_tags)
-
-        return span
+        return list(filenames)
 
     def to_latex(self, val: Any):
         from warnings import warn
@@ -5959,6 +6414,27 @@ class FmtImage:
 
     @classmethod
     def _get_image_uri(cls, filename: str) -> str:
+        # Encoded files are cached by path, modification time and size, so that a file that's
+        # changed on disk is read again
+        key = _get_image_file_key(filename)
+
+        with _image_uri_lock:
+            uri = _image_uri_cache.get(key)
+            if uri is not None:
+                _image_uri_cache.move_to_end(key)
+                return uri
+
+        uri = cls._encode_image(filename)
+
+        with _image_uri_lock:
+            _image_uri_cache[key] = uri
+            while len(_image_uri_cache) > _IMAGE_URI_CACHE_SIZE:
+                _image_uri_cache.popitem(last=False)
+
+        return uri
+
+    @classmethod
+    def _encode_image(cls, filename: str) -> str:
         import base64
 
         with open(filename, "rb") as f:
@@ -5968,6 +6444,36 @@ class FmtImage:
 
         return f"data:{mime_type};base64,{encoded}"
 
+    @classmethod
+    def _prefetch_image_uris(cls, filenames: Iterable[str]) -> None:
+        """Read and encode the files that aren't cached yet, using a pool of threads."""
+
+        uncached: list[str] = []
+        for filename in filenames:
+            try:
+                key = _get_image_file_key(filename)
+            except OSError:
+                # Errors are raised when the value is formatted
+                continue
+            if key not in _image_uri_cache:
+                uncached.append(filename)
+
+        if len(uncached) < 2:
+            return
+
+        def prefetch(filename: str) -> None:
+            try:
+                cls._get_image_uri(filename)
+            except OSError:
+                pass
+
+        with ThreadPoolExecutor(max_workers=min(len(uncached), _IMAGE_PREFETCH_WORKERS)) as pool:
+            list(pool.map(prefetch, uncached))
+
+    @staticmethod
+    def _get_css_class(filename: str) -> str:
+        return "gt_image_" + hashlib.sha1(filename.encode()).hexdigest()[:12]
+
     @staticmethod
     def _get_mime_type(filename: str) -> str:
         # note that we strip off the leading "."
@@ -5981,7 +6487,12 @@ class FmtImage:
         return f"image/{suffix}"
 
     @staticmethod
-    def _build_img_tag(uri: str, height: str | None = None, width: str | None = None) -> str:
+    def _build_img_tag(
+        uri: str | None,
+        height: str | None = None,
+        width: str | None = None,
+        css_class: str | None = None,
+    ) -> str:
         style_string = "".join(
             [
                 f"height: {height};" if height is not None else "",
@@ -5990,6 +6501,9 @@ class FmtImage:
             ]
         )
 
+        if css_class is not None:
+            return f'<img class="{css_class}" style="{style_string}">'
+
         return f'<img src="{uri}" style="{style_string}">'
 
 
@@ -6417,26 +6931,7 @@ class FmtFlag:
             if len(flag) not in (2, 3):
                 raise ValueError("The country code provided must be either 2 or 3 characters long.")
 
-            # Since we allow 2- or 3- character country codes, create the name of the lookup
-            # column based on the length of the country code
-            lookup_column = "country_code_2" if len(flag) == 2 else "country_code_3"
-
-            # Get the correct dictionary entries based on the provided 'country_code_2' value
-            flag_dict = _filter_pd_df_to_row(
-                pd_df=_get_flags_data(), column=lookup_column, filter_expr=flag
-            )
-
-            # Get the SVG string and country name for the flag
-            flag_svg = str(flag_dict["country_flag"])
-            flag_title = str(flag_dict["country_name"])
-
-            # Extract the flag SVG data and modify it to include the height, width, and a
-            # title based on the country name
-            flag_icon = self._replace_flag_svg(
-                flag_svg=flag_svg, height=height, use_title=self.use_title, flag_title=flag_title
-            )
-
-            out.append(str(flag_icon))
+            out.append(_get_flag_icon(flag, height=height, use_title=self.use_title))
 
         img_tags = self.sep.join(out)
         span = self.SPAN_TEMPLATE.format(img_tags)
@@ -6469,7 +6964,32 @@ class FmtFlag:
         if use_title:
             replacement += f"<title>{flag_title}</title>"
 
-        return re.sub(r"<svg.*?>", replacement, flag_svg)
+        return _SVG_OPEN_TAG_RE.sub(replacement, flag_svg)
+
+
+_SVG_OPEN_TAG_RE = re.compile(r"<svg.*?>")
+
+
+# There are a few hundred flags, and a table typically uses one or two heights, so this is
+# large enough to hold every rewritten flag a session is likely to need
+@lru_cache(maxsize=1024)
+def _get_flag_icon(flag: str, height: str, use_title: bool) -> str:
+    """Get the SVG for a 2- or 3-character country code, rewritten with a height and title."""
+
+    # Get the correct dictionary entries based on the provided country code
+    flag_dict = _get_flag_row(flag)
+
+    # Get the SVG string and country name for the flag
+    flag_svg = str(flag_dict["country_flag"])
+    flag_title = str(flag_dict["country_name"])
+
+    # Extract the flag SVG data and modify it to include the height, width, and a
+    # title based on the country name
+    flag_icon = FmtFlag._replace_flag_svg(
+        flag_svg=flag_svg, height=height, use_title=use_title, flag_title=flag_title
+    )
+
+    return str(flag_icon)
 
 
 def fmt_nanoplot(
@@ -6739,10 +7259,14 @@ def fmt_nanoplot(
         else:
             all_single_y_vals = to_list(data_tbl[columns])
 
+        # The plots share a scale, which only needs to be worked out once for the column
+        single_y_scale = _SingleYScale.from_vals(all_single_y_vals)
+
         autoscale = False
 
     else:
         all_single_y_vals = None
+        single_y_scale = None
 
     if options is None:
         from great_tables._helpers import nanoplot_options
@@ -6803,6 +7327,7 @@ def fmt_nanoplot(
         reference_line: str | float | None = reference_line,
         reference_area: list[Any] | None = reference_area,
         all_single_y_vals: list[int | float] | None = all_single_y_vals,
+        single_y_scale: _SingleYScale | None = single_y_scale,
         options_plots: dict[str, Any] = options_plots,
     ) -> str:
         if context == "latex":
@@ -6847,6 +7372,7 @@ def fmt_nanoplot(
             expand_y=expand_y,
             missing_vals=missing_vals,
             all_single_y_vals=all_single_y_vals,
+            single_y_scale=single_y_scale,
             plot_type=plot_type,
             svg_height=plot_height,
             **options_plots,
@@ -6995,14 +7521,41 @@ def fmt_by_context(
     pf_format: Callable[[Any], str],
     columns: SelectExpr,
     rows: int | list[int] | None,
+    pf_batch: Callable[[list[Any]], list[Any] | None] | None = None,
 ) -> GTSelf:
+    batch = None
+    if pf_batch is not None:
+        batch = {
+            context: partial(
+                _format_batch,
+                pf_batch=partial(pf_batch, context=context),
+                pf_format=partial(pf_format, context=context),
+            )
+            for context in ("html", "latex")
+        }
+        batch["default"] = batch["html"]
+
     return fmt(
         self,
         fns=FormatFns(
             html=partial(pf_format, context="html"),  # type: ignore
             latex=partial(pf_format, context="latex"),  # type: ignore
             default=partial(pf_format, context="html"),  # type: ignore
+            batch=batch,
         ),
         columns=columns,
         rows=rows,
     )
+
+
+def _format_batch(
+    x: list[Any],
+    pf_batch: Callable[[list[Any]], list[Any] | None],
+    pf_format: Callable[[Any], str],
+) -> list[Any]:
+    # Use the vectorized formatter when it can handle the values, otherwise format one at a time
+    result = pf_batch(x)
+    if result is None:
+        return [pf_format(value) for value in x]
+
+    return result
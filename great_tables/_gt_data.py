@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import copy
-from collections.abc import Mapping, Sequence
+from collections.abc import Hashable, Mapping, Sequence
 from dataclasses import dataclass, field, replace
 from enum import Enum, auto
 from itertools import chain, product
@@ -11,6 +11,7 @@ from typing_extensions import Self, TypeAlias, Union
 
 from ._cols_merge import ColMergeInfo, ColMerges  # noqa: F401 (re-exported)
 from ._helpers import GoogleFontImports
+from ._profile import record_counts
 
 # TODO: move this class somewhere else (even gt_data could work)
 from ._styles import CellStyle
@@ -19,8 +20,9 @@ from ._tbl_data import (
     DataFrameLike,
     TblData,
     _get_cell,
+    _get_column_cells,
     _get_column_dtype,
-    _set_cell,
+    _set_column_cells,
     copy_data,
     create_empty_frame,
     get_column_names,
@@ -35,7 +37,7 @@ from ._tbl_data_align import (
     is_number_like_column,
 )
 from ._text import BaseText
-from ._utils import OrderedSet
+from ._utils import OrderedSet, PersistentList
 
 if TYPE_CHECKING:
     from ._helpers import UnitStr
@@ -72,6 +74,53 @@ def _prep_gt(
     return stub, boxhead
 
 
+class BuildCache:
+    """The parts of a table made by its last build, per context, for reuse by later builds.
+
+    A table shares its cache with the tables derived from it (e.g., by `tab_options()` or
+    `tab_style()`). A cached build is only reused when the table parts it was made from are the
+    very same objects, which holds when only parts that building doesn't read have changed (since
+    table methods replace the parts they change, rather than modifying them). The table data can
+    be modified in place by users though, so builds are also stored under a `key` for its contents
+    (see `data_fingerprint()`), and nothing is cached when that key is None.
+    """
+
+    __slots__ = ("_entries",)
+
+    def __init__(self):
+        self._entries: dict[str, tuple[tuple[Any, ...], Hashable, Any]] = {}
+
+    def __reduce__(self):
+        # Copies (e.g., pickled tables sent to other processes) start out empty
+        return (self.__class__, ())
+
+    def get(self, context: str, inputs: tuple[Any, ...], key: Hashable | None) -> Any | None:
+        entry = self._entries.get(context)
+        if entry is None or key is None:
+            return None
+
+        cached_inputs, cached_key, built = entry
+        if len(cached_inputs) != len(inputs) or any(
+            x is not y for x, y in zip(cached_inputs, inputs)
+        ):
+            return None
+
+        if cached_key != key:
+            return None
+
+        return built
+
+    def put(self, context: str, inputs: tuple[Any, ...], key: Hashable | None, built: Any) -> None:
+        if key is None:
+            self._entries.pop(context, None)
+            return
+
+        self._entries[context] = (inputs, key, built)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
 @dataclass(frozen=True)
 class GTData:
     _tbl_data: TblData
@@ -84,16 +133,17 @@ class GTData:
     _summary_rows: SummaryRows
     _summary_rows_grand: SummaryRows
     _source_notes: SourceNotes
-    _footnotes: Footnotes
-    _styles: Styles
+    _footnotes: PersistentList[FootnoteInfo]
+    _styles: PersistentList[StyleInfo]
     _locale: Locale | None
-    _formats: Formats
-    _substitutions: Formats
-    _col_merge: ColMerges
-    _transforms: list  # list[TextTransformInfo]
+    _formats: PersistentList[FormatInfo]
+    _substitutions: PersistentList[FormatInfo]
+    _col_merge: PersistentList[ColMergeInfo]
+    _transforms: PersistentList[TextTransformInfo]
     _options: Options
     _google_font_imports: GoogleFontImports = field(default_factory=GoogleFontImports)
     _has_built: bool = False
+    _build_cache: BuildCache = field(default_factory=BuildCache, compare=False, repr=False)
 
     def _replace(self, **kwargs: Any) -> Self:
         new_obj = copy.copy(self)
@@ -135,13 +185,13 @@ class GTData:
             _summary_rows=SummaryRows(),
             _summary_rows_grand=SummaryRows(_is_grand_summary=True),
             _source_notes=[],
-            _footnotes=[],
-            _styles=[],
+            _footnotes=PersistentList(),
+            _styles=PersistentList(),
             _locale=Locale(locale),
-            _formats=[],
-            _substitutions=[],
-            _col_merge=[],
-            _transforms=[],
+            _formats=PersistentList(),
+            _substitutions=PersistentList(),
+            _col_merge=PersistentList(),
+            _transforms=PersistentList(),
             _options=options,
             _google_font_imports=GoogleFontImports(),
         )
@@ -183,39 +233,117 @@ class _Sequence(Sequence[T]):
 # Body ----
 
 
-# TODO: it seems like this could just be a DataFrameLike object?
-# Similar to TblData now being a DataFrame, rather than its own class
-# I've left for now, and have just implemented concretes for it in
-# _tbl_data.py
 class Body:
-    body: TblData
+    """The formatted cells of a table, as a DataFrame of strings (null where not formatted).
+
+    Cell writes go to a per-column buffer of Python lists, rather than to the DataFrame, since
+    updating a single cell can require rebuilding its whole column (e.g., for pyarrow Tables).
+    The buffered columns are written back to the DataFrame in one go when `.body` is accessed.
+    """
 
     def __init__(self, body: TblData):
-        self.body = body
+        self._frame = body
+        # columns read from (or written to) the frame, and those with unwritten changes
+        self._columns: dict[str, list[Any]] = {}
+        self._dirty: set[str] = set()
+
+    @property
+    def body(self) -> TblData:
+        self.flush()
+        return self._frame
+
+    def flush(self) -> None:
+        """Write the buffered cells to the DataFrame."""
+        if self._dirty:
+            rows = list(range(n_rows(self._frame)))
+            for col in self._dirty:
+                self._frame = _set_column_cells(self._frame, col, rows, self._columns[col])
+
+            self._dirty = set()
+
+    @body.setter
+    def body(self, body: TblData):
+        self._frame = body
+        self._columns = {}
+        self._dirty = set()
+
+    def _column(self, column: str) -> list[Any]:
+        values = self._columns.get(column)
+
+        if values is None:
+            rows = list(range(n_rows(self._frame)))
+            values = self._columns[column] = _get_column_cells(self._frame, column, rows)
+
+        return values
+
+    def get_cell(self, row: int, column: str) -> Any:
+        return self._column(column)[row]
+
+    def set_cell(self, row: int, column: str, value: Any) -> None:
+        self._column(column)[row] = value
+        self._dirty.add(column)
+
+    def set_column_cells(self, column: str, rows: list[int], values: list[Any]) -> None:
+        col_values = self._column(column)
+        for row, value in zip(rows, values):
+            col_values[row] = value
+
+        self._dirty.add(column)
+
+    def is_na(self, x: Any) -> bool:
+        return is_na(self._frame, x)
 
     def render_formats(self, data_tbl: TblData, formats: list[FormatInfo], context: Any):
         for fmt in formats:
             eval_func = getattr(fmt.func, context, fmt.func.default)
             if eval_func is None:
                 raise Exception("Internal Error")
-            for col, row in fmt.cells.resolve():
-                result = eval_func(_get_cell(data_tbl, row, col))
-                if isinstance(result, FormatterSkipElement):
+            batch_func = fmt.func.get_batch(context)
+            mask_func = fmt.func.get_mask(context)
+            for col, rows in fmt.cells.resolve_columns():
+                masked = mask_func(data_tbl, col, rows) if mask_func is not None else None
+                if masked is not None:
+                    # Write the same text to the matching rows
+                    mask, text = masked
+                    masked_rows = [row for row, matched in zip(rows, mask) if matched]
+                    if masked_rows:
+                        self.set_column_cells(col, masked_rows, [text] * len(masked_rows))
+
+                    record_counts(cells=len(rows), formatter_calls=1)
                     continue
 
-                # TODO: I think that this is very inefficient with polars, so
-                # we could either accumulate results and set them per column, or
-                # could always use a pandas DataFrame inside Body?
-                new_body = _set_cell(self.body, row, col, result)
-                if new_body is not None:
-                    # Some backends do not support inplace operations, but return a new dataframe
-                    # TODO: Consolidate the behaviour of _set_cell
-                    self.body = new_body
+                # Pull the column slice once, format it as a batch, and write the results
+                # back in one go (rather than per-cell gets and sets)
+                values = _get_column_cells(data_tbl, col, rows)
+                if batch_func is not None:
+                    results = batch_func(values)
+                else:
+                    results = [eval_func(x) for x in values]
+
+                record_counts(
+                    cells=len(values), formatter_calls=1 if batch_func is not None else len(values)
+                )
+
+                kept_rows: list[int] = []
+                kept_results: list[Any] = []
+                for row, result in zip(rows, results):
+                    if isinstance(result, FormatterSkipElement):
+                        continue
+                    kept_rows.append(row)
+                    kept_results.append(result)
+
+                if kept_rows:
+                    self.set_column_cells(col, kept_rows, kept_results)
 
         return self
 
     def copy(self) -> Self:
-        return self.__class__(copy_data(self.body))
+        # unwritten changes are copied along with the frame, rather than written to it
+        new = self.__class__(copy_data(self._frame))
+        new._columns = {col: list(self._columns[col]) for col in self._dirty}
+        new._dirty = set(self._dirty)
+
+        return new
 
     @classmethod
     def from_empty(cls, body: DataFrameLike):
@@ -240,7 +368,7 @@ class ColInfoTypeEnum(Enum):
     summary_placeholder = auto()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ColInfo:
     # TODO: Make var readonly
     var: str
@@ -257,7 +385,8 @@ class ColInfo:
 
     def __post_init__(self):
         if self.column_label is None:
-            super().__setattr__("column_label", self.var)
+            # object.__setattr__, since zero-argument super() doesn't work in slotted dataclasses
+            object.__setattr__(self, "column_label", self.var)
 
     def replace_column_label(self, column_label: str) -> Self:
         return replace(self, column_label=column_label)
@@ -672,7 +801,7 @@ class Stub:
 
         for group_row in self.group_rows:
             first_index = group_row.indices[0]
-            cell_content = _get_cell(body.body, first_index, rowgroup_var.var)
+            cell_content = body.get_cell(first_index, rowgroup_var.var)
 
             # When no formatter was applied, the cell is still NA — fall back to
             # the original data value.
@@ -924,7 +1053,7 @@ class FootnotePlacement(Enum):
     auto = auto()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FootnoteInfo:
     locname: Loc | None = None
     grpname: str | None = None
@@ -940,7 +1069,7 @@ Footnotes: TypeAlias = list[FootnoteInfo]
 # Styles ----
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StyleInfo:
     locname: Loc
     grpname: str | None = None
@@ -970,6 +1099,8 @@ class FormatterSkipElement:
 
 
 FormatFn = Callable[[Any], "str | FormatterSkipElement"]
+FormatBatchFn = Callable[[list[Any]], "list[str | FormatterSkipElement]"]
+FormatMaskFn = Callable[[TblData, str, list[int]], "tuple[list[bool], str] | None"]
 
 
 class FormatFns:
@@ -978,16 +1109,48 @@ class FormatFns:
     rtf: FormatFn | None
     default: FormatFn | None
 
-    def __init__(self, **kwargs: FormatFn):
+    # Optional functions, keyed by context, that format a whole column slice at once. These
+    # must return the same values as calling the per-value function on each element.
+    batch: dict[str, FormatBatchFn]
+
+    # Optional functions, keyed by context, for formats that replace some values of a column
+    # with the same text (like substitutions). These take the table data, a column and its rows,
+    # and return whether each row is replaced, along with the text to replace it with (or None
+    # to use the per-value function instead).
+    mask: dict[str, FormatMaskFn]
+
+    def __init__(
+        self,
+        batch: dict[str, FormatBatchFn] | None = None,
+        mask: dict[str, FormatMaskFn] | None = None,
+        **kwargs: FormatFn,
+    ):
         for format in ("html", "latex", "rtf", "default"):
             if fmt := kwargs.get(format):
                 setattr(self, format, fmt)
 
+        self.batch = {} if batch is None else batch
+        self.mask = {} if mask is None else mask
+
+    def get_batch(self, context: str) -> FormatBatchFn | None:
+        return self.batch.get(context, self.batch.get("default"))
+
+    def get_mask(self, context: str) -> FormatMaskFn | None:
+        return self.mask.get(context, self.mask.get("default"))
+
 
 class CellSubset:
     def resolve(self) -> list[tuple[str, int]]:
         raise NotImplementedError("Not implemented")
 
+    def resolve_columns(self) -> list[tuple[str, list[int]]]:
+        """Return the resolved cells grouped by column, as (column, row indices) pairs."""
+        by_column: dict[str, list[int]] = {}
+        for col, row in self.resolve():
+            by_column.setdefault(col, []).append(row)
+
+        return list(by_column.items())
+
 
 class CellRectangle(CellSubset):
     cols: list[str]
@@ -1000,6 +1163,9 @@ class CellRectangle(CellSubset):
     def resolve(self) -> list[tuple[str, int]]:
         return list(product(self.cols, self.rows))
 
+    def resolve_columns(self) -> list[tuple[str, list[int]]]:
+        return [(col, self.rows) for col in self.cols]
+
 
 class FormatInfo:
     """Contains functions for formatting in different contexts, and columns and rows to apply to.
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from csv import DictReader
+from functools import lru_cache
 from typing import Any, TypedDict, cast
 
 from importlib_resources import files
@@ -94,31 +95,120 @@ class FlagsDataDict(TypedDict):
 
 # Note that all the functions below cast the result hint of read_csv
 # to a more specific dict type, which contains item info.
+#
+# The locale and currency tables are read once and cached, so the lists they return are
+# shared between callers and should be treated as read-only.
 
 
+@lru_cache(maxsize=None)
 def _get_locales_data() -> list[LocalesDict]:
     fname = DATA_MOD / "x_locales.csv"
 
     return cast("list[LocalesDict]", read_csv(fname))
 
 
+@lru_cache(maxsize=None)
 def _get_default_locales_data() -> list[DefaultLocalesDict]:
     fname = DATA_MOD / "x_default_locales.csv"
     return cast("list[DefaultLocalesDict]", read_csv(fname))
 
 
+@lru_cache(maxsize=None)
 def _get_currencies_data() -> list[CurrenciesDataDict]:
     fname = DATA_MOD / "x_currencies.csv"
 
     return cast("list[CurrenciesDataDict]", read_csv(fname))
 
 
+class LocaleRegistry:
+    """Lookup tables for the locale and currency data, indexed by their keys.
+
+    - `locales`: locale ID (e.g. "fr-CA") to its row of the locales table
+    - `default_locales`: default locale ID (e.g. "en-US") to its base locale (e.g. "en")
+    - `currencies`: currency code (e.g. "EUR") to its row of the currencies table
+
+    Use `_get_locale_registry()` to get the shared registry, rather than creating one directly.
+    """
+
+    locales: dict[str, LocalesDict]
+    default_locales: dict[str, str]
+    currencies: dict[str, CurrenciesDataDict]
+
+    def __init__(
+        self,
+        locales: list[LocalesDict],
+        default_locales: list[DefaultLocalesDict],
+        currencies: list[CurrenciesDataDict],
+    ):
+        # When keys are duplicated, the first entry wins (as with a linear search)
+        self.locales = {}
+        for entry in locales:
+            self.locales.setdefault(cast(str, entry["locale"]), entry)
+
+        self.default_locales = {}
+        for entry in default_locales:
+            self.default_locales.setdefault(
+                cast(str, entry["default_locale"]), cast(str, entry["base_locale"])
+            )
+
+        self.currencies = {}
+        for entry in currencies:
+            self.currencies.setdefault(cast(str, entry["curr_code"]), entry)
+
+    def get_locale(self, locale: str) -> LocalesDict:
+        try:
+            return self.locales[locale]
+        except KeyError:
+            raise _lookup_error() from None
+
+    def get_currency(self, currency: str) -> CurrenciesDataDict:
+        try:
+            return self.currencies[currency]
+        except KeyError:
+            raise _lookup_error() from None
+
+
+def _lookup_error() -> Exception:
+    return Exception(
+        "Internal Error, the filtered table doesn't result in a table of exactly one row."
+    )
+
+
+@lru_cache(maxsize=None)
+def _get_locale_registry() -> LocaleRegistry:
+    return LocaleRegistry(
+        locales=_get_locales_data(),
+        default_locales=_get_default_locales_data(),
+        currencies=_get_currencies_data(),
+    )
+
+
+@lru_cache(maxsize=None)
 def _get_flags_data() -> list[FlagsDataDict]:
     fname = DATA_MOD / "x_flags.csv"
 
     return cast("list[FlagsDataDict]", read_csv(fname))
 
 
+@lru_cache(maxsize=None)
+def _get_flags_index() -> dict[str, FlagsDataDict]:
+    """Index the flags table by both its 2- and 3-character country codes."""
+
+    index: dict[str, FlagsDataDict] = {}
+    for entry in _get_flags_data():
+        index.setdefault(entry["country_code_2"], entry)
+        index.setdefault(entry["country_code_3"], entry)
+
+    return index
+
+
+def _get_flag_row(country_code: str) -> FlagsDataDict:
+    try:
+        return _get_flags_index()[country_code]
+    except KeyError:
+        raise _lookup_error() from None
+
+
 class DurationsDataDict(TypedDict):
     locale: str
     type: str
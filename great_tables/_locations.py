@@ -70,7 +70,7 @@ RowSelectExpr: TypeAlias = 'bool | list[int] | int | PlExpr | Callable[["TblData
 # straight while going through helpers.R, but no strong opinion on naming!
 
 
-@dataclass
+@dataclass(slots=True)
 class CellPos:
     """The position of a cell in a DataFrame."""
 
@@ -1508,6 +1508,20 @@ def _(loc: LocSummaryStub, data: GTData, style: list[Union[CellStyle, FootnoteEn
     )
 
 
+def _resolve_row_styles(styles: list[CellStyle], data: TblData, row: int) -> list[CellStyle]:
+    """Return the styles for a row, with any FromColumn values taken from that row.
+
+    If no style takes values from a column, `styles` itself is returned, so that one list is
+    shared by all the cells it applies to.
+    """
+    row_styles = [entry._from_row(data, row) for entry in styles]
+
+    if all(row_style is entry for row_style, entry in zip(row_styles, styles)):
+        return styles
+
+    return row_styles
+
+
 @set_style.register(LocSummary)
 def _(loc: LocSummary, data: GTData, style: list[Union[CellStyle, FootnoteEntry]]) -> GTData:
     positions = resolve(loc, data)  # list of (group_id, CellPos)
@@ -1522,7 +1536,7 @@ def _(loc: LocSummary, data: GTData, style: list[Union[CellStyle, FootnoteEntry]
 
     for group_id, col_pos in positions:
         # Handle styles
-        row_styles = [entry._from_row(data._tbl_data, col_pos.row) for entry in style_ready]
+        row_styles = _resolve_row_styles(style_ready, data._tbl_data, col_pos.row)
         crnt_info = StyleInfo(
             locname=loc,
             colname=col_pos.colname,
@@ -1565,7 +1579,7 @@ def _(
 
     for col_pos in positions:
         # Handle styles
-        row_styles = [entry._from_row(data._tbl_data, col_pos.row) for entry in style_ready]
+        row_styles = _resolve_row_styles(style_ready, data._tbl_data, col_pos.row)
         crnt_info = StyleInfo(
             locname=loc, colname=col_pos.colname, rownum=col_pos.row, styles=row_styles
         )
@@ -17,6 +17,7 @@ from ._tbl_data import (
     eval_aggregate,
     reorder,
 )
+from ._utils import PersistentList
 
 if TYPE_CHECKING:
     from ._types import GTSelf
@@ -96,7 +97,7 @@ def tab_stub(
     if groupname_col is not None:
         styles = _remove_from_body_styles(self._styles, groupname_col)
 
-    self = self._replace(_styles=styles)
+    self = self._replace(_styles=PersistentList(styles))
 
     # remove from spanners ----
     if groupname_col is not None:
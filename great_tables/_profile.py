@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+import time
+import tracemalloc
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Iterable, Iterator
+
+
+@dataclass(slots=True)
+class PhaseStats:
+    """Measurements of one phase of rendering, summed over the times it ran.
+
+    `cells` is the number of cells the phase processed (formatted cells for `"render_formats"`,
+    rendered cells for `"body"`), and `formatter_calls` the number of times formatting functions
+    were called (a batch formatter counts once per column). `peak_bytes` is the largest amount of
+    memory allocated during one run of the phase. It's only measured with `trace_memory=True`, and
+    not for the HTML `"body"`, which is produced in chunks.
+    """
+
+    name: str
+    seconds: float = 0.0
+    runs: int = 0
+    cells: int = 0
+    formatter_calls: int = 0
+    peak_bytes: int | None = None
+
+
+class RenderProfile:
+    """Measurements of the phases of rendering, made within `profile_render()`.
+
+    Phases are listed in the order they first ran. A table rendered several times within the
+    same `profile_render()` block adds up in the same phases.
+    """
+
+    def __init__(self, trace_memory: bool = False):
+        self.trace_memory = trace_memory
+        self.phases: dict[str, PhaseStats] = {}
+        self._current: PhaseStats | None = None
+
+    def __repr__(self) -> str:
+        return f"<RenderProfile phases={list(self.phases)} seconds={self.total_seconds:.6f}>"
+
+    def __str__(self) -> str:
+        header = f"{'phase':<20}{'runs':>6}{'seconds':>12}{'cells':>12}{'fmt calls':>12}"
+        if self.trace_memory:
+            header += f"{'peak KiB':>12}"
+
+        lines = [header]
+        for stats in self.phases.values():
+            line = (
+                f"{stats.name:<20}{stats.runs:>6}{stats.seconds:>12.6f}{stats.cells:>12,}"
+                f"{stats.formatter_calls:>12,}"
+            )
+            if self.trace_memory and stats.peak_bytes is not None:
+                line += f"{stats.peak_bytes / 1024:>12,.1f}"
+            elif self.trace_memory:
+                line += f"{'-':>12}"
+            lines.append(line)
+
+        lines.append(f"{'total':<20}{'':>6}{self.total_seconds:>12.6f}")
+
+        return "\n".join(lines)
+
+    @property
+    def total_seconds(self) -> float:
+        return sum(stats.seconds for stats in self.phases.values())
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the measurements as a dictionary (e.g., to serialize as JSON)."""
+
+        return {
+            "total_seconds": self.total_seconds,
+            "phases": [asdict(stats) for stats in self.phases.values()],
+        }
+
+    def _get_phase(self, name: str) -> PhaseStats:
+        stats = self.phases.get(name)
+        if stats is None:
+            stats = self.phases[name] = PhaseStats(name)
+
+        return stats
+
+
+_active_profile: ContextVar[RenderProfile | None] = ContextVar("_active_profile", default=None)
+
+
+@contextmanager
+def profile_render(
+    callback: Callable[[RenderProfile], None] | None = None, trace_memory: bool = False
+) -> Iterator[RenderProfile]:
+    """
+    Measure the phases of rendering tables.
+
+    Within the `with` block, rendering a table (e.g., with `GT.as_raw_html()`, `GT.as_latex()`,
+    or `GT.show()`) records the time spent in each phase: formatting cells (`"render_formats"`),
+    merging columns (`"col_merge"`), applying text transforms (`"text_transforms"`), creating the
+    heading, column labels, body and footer, compiling the CSS (`"compile_scss"`), and so on.
+    Along with the time, the number of cells processed and of formatter calls are recorded. The
+    measurements are returned as a `RenderProfile`, which can be printed as a report or turned
+    into a dictionary with its `to_dict()` method.
+
+    Rendering isn't measured outside of a `profile_render()` block, and the measurements are
+    specific to the thread (or async task) that entered the block.
+
+    Parameters
+    ----------
+    callback
+        A function called with the `RenderProfile` when the `with` block exits without an error.
+        This can be used to send the measurements elsewhere, like a logging or metrics system.
+    trace_memory
+        Whether to measure the peak memory allocated during each phase, using the `tracemalloc`
+        module. This slows rendering down considerably. By default, this is `False`.
+
+    Returns
+    -------
+    RenderProfile
+        The measurements, which are filled in as tables are rendered within the block.
+
+    Examples
+    --------
+    Let's see where the time goes when rendering a table of the `sp500` dataset.
+
+    ```python
+    from great_tables import GT, profile_render
+    from great_tables.data import sp500
+
+    gt = GT(sp500).fmt_currency(columns=["open", "high", "low", "close"])
+
+    with profile_render() as profile:
+        gt.as_raw_html()
+
+    print(profile)
+    ```
+
+    The `callback=` argument makes it possible to pass the measurements on to another system,
+    here as a log message.
+
+    ```python
+    import json
+    import logging
+
+    def log_profile(profile):
+        logging.info(json.dumps(profile.to_dict()))
+
+    with profile_render(callback=log_profile):
+        gt.as_raw_html()
+    ```
+    """
+
+    profile = RenderProfile(trace_memory=trace_memory)
+
+    started_tracing = trace_memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+
+    token = _active_profile.set(profile)
+    try:
+        yield profile
+    finally:
+        _active_profile.reset(token)
+        if started_tracing:
+            tracemalloc.stop()
+
+    if callback is not None:
+        callback(profile)
+
+
+@contextmanager
+def render_phase(name: str) -> Iterator[None]:
+    """Record the time spent in the `with` block as the phase `name`, when profiling."""
+
+    profile = _active_profile.get()
+    if profile is None:
+        yield
+        return
+
+    stats = profile._get_phase(name)
+    outer = profile._current
+    profile._current = stats
+
+    if profile.trace_memory:
+        tracemalloc.reset_peak()
+        start_bytes = tracemalloc.get_traced_memory()[0]
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        stats.seconds += time.perf_counter() - start
+        stats.runs += 1
+        profile._current = outer
+
+        if profile.trace_memory:
+            peak_bytes = tracemalloc.get_traced_memory()[1] - start_bytes
+            stats.peak_bytes = max(stats.peak_bytes or 0, peak_bytes)
+
+
+def render_phase_iter(name: str, chunks: Iterable[str]) -> Iterable[str]:
+    """Record the time spent producing `chunks` as the phase `name`, when profiling."""
+
+    profile = _active_profile.get()
+    if profile is None:
+        return chunks
+
+    return _iter_phase(profile, name, iter(chunks))
+
+
+def _iter_phase(profile: RenderProfile, name: str, chunks: Iterator[str]) -> Iterator[str]:
+    # The time is only counted while a chunk is being produced, not while the consumer has it
+    stats = profile._get_phase(name)
+    stats.runs += 1
+
+    while True:
+        outer = profile._current
+        profile._current = stats
+        start = time.perf_counter()
+        try:
+            chunk = next(chunks)
+        except StopIteration:
+            return
+        finally:
+            stats.seconds += time.perf_counter() - start
+            profile._current = outer
+
+        yield chunk
+
+
+def record_counts(cells: int = 0, formatter_calls: int = 0) -> None:
+    """Add to the counts of the phase being profiled, if any."""
+
+    profile = _active_profile.get()
+    if profile is None or profile._current is None:
+        return
+
+    profile._current.cells += cells
+    profile._current.formatter_calls += formatter_calls
@@ -0,0 +1,321 @@
+from __future__ import annotations
+
+import dataclasses
+import functools
+import hashlib
+import marshal
+import pickle
+import threading
+import types
+from collections import OrderedDict
+from datetime import date, time, timedelta
+from decimal import Decimal
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Callable
+
+from ._tbl_data import DataFrameLike, SeriesLike
+from ._utils import PersistentList
+
+if TYPE_CHECKING:
+    from ._gt_data import GTData
+
+
+class RenderCache:
+    """A bounded, least-recently-used cache of rendered tables.
+
+    Entries also hold on to the objects fingerprinted by identity (see `fingerprint()`), so that
+    their ids can't be reused by other objects while the entry exists.
+    """
+
+    def __init__(self, maxsize: int):
+        if maxsize < 1:
+            raise ValueError(
+                f"The `maxsize=` value must be at least 1, but {maxsize} was provided."
+            )
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple[str, str], tuple[str, list[Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: tuple[str, str]) -> str | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: tuple[str, str], value: str, refs: list[Any]) -> None:
+        with self._lock:
+            self._entries[key] = (value, refs)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+
+_render_cache: RenderCache | None = None
+
+
+def enable_render_cache(maxsize: int = 128) -> None:
+    """
+    Cache rendered HTML tables.
+
+    Rendering a table builds its body (formatting every cell, merging columns, applying
+    transforms) and then generates the HTML. With the render cache enabled, the HTML for a table
+    is stored under a fingerprint of its contents: the table data, formats, styles, options,
+    spanners, and so on. Rendering a table with the same contents again (e.g., re-displaying a
+    table in a notebook, or a Shiny app re-running a render function after a reactive
+    invalidation) then reuses the stored HTML. This applies to every method that produces HTML,
+    like `GT.as_raw_html()`, `GT.show()`, `GT.gtsave()`, and `render_gt()` in Shiny.
+
+    The container around the table is still generated on each render, so tables without an ID set
+    by `GT.with_id()` get a new random ID each time.
+
+    Parameters
+    ----------
+    maxsize
+        The maximum number of rendered tables to keep. When the cache is full, the least recently
+        used table is dropped. Calling this function again replaces the cache with an empty one.
+
+    Returns
+    -------
+    None
+        This function returns nothing.
+
+    Notes
+    -----
+    Table data is fingerprinted by its contents, so changing the data in place is detected.
+    Functions (e.g., in `fmt()`) are fingerprinted by their code, default arguments, and the values
+    they close over; changes to global variables that a function reads are not detected. Objects
+    that can't be fingerprinted by their contents (like polars expressions) are fingerprinted by
+    identity, which means that rebuilding a table that uses them won't reuse a stored render.
+
+    Examples
+    --------
+    ```python
+    import great_tables as gt
+    from great_tables import GT, exibble
+
+    gt.enable_render_cache(maxsize=64)
+
+    GT(exibble).fmt_number(columns="num").as_raw_html()
+
+    # the same table, created again, is rendered from the cache
+    GT(exibble).fmt_number(columns="num").as_raw_html()
+
+    gt.disable_render_cache()
+    ```
+    """
+    global _render_cache
+
+    _render_cache = RenderCache(maxsize)
+
+
+def disable_render_cache() -> None:
+    """
+    Stop caching rendered HTML tables.
+
+    This turns off the cache enabled by `enable_render_cache()` and drops all stored renders.
+
+    Returns
+    -------
+    None
+        This function returns nothing.
+    """
+    global _render_cache
+
+    _render_cache = None
+
+
+def render_html_table(data: GTData, context: str, render: Callable[[], str]) -> str:
+    """Return the table HTML from `render()`, going through the render cache if it's enabled."""
+
+    cache = _render_cache
+    if cache is None:
+        return render()
+
+    refs: list[Any] = []
+    key = (context, fingerprint(data, refs))
+
+    html_table = cache.get(key)
+    if html_table is None:
+        html_table = render()
+        cache.put(key, html_table, refs)
+
+    return html_table
+
+
+# Fingerprints ----
+
+
+def fingerprint(obj: Any, refs: list[Any]) -> str:
+    """Return a digest that's equal for objects with the same contents.
+
+    Objects that can't be fingerprinted by contents are fingerprinted by identity, and appended
+    to `refs` (the caller needs to keep them alive for as long as the fingerprint is used).
+    """
+
+    fingerprinter = _Fingerprinter(refs)
+    fingerprinter.update(obj)
+
+    return fingerprinter.hash.hexdigest()
+
+
+_SCALAR_TYPES = (type(None), bool, int, float, complex, Decimal, date, time, timedelta)
+_PLAIN_TYPES = frozenset({type(None), bool, int, float, str})
+
+
+class _Fingerprinter:
+    """Feeds a description of an object's contents into a hash.
+
+    Each part of the description is a tag followed by a length-prefixed value, so that different
+    structures can't produce the same stream of bytes.
+    """
+
+    def __init__(self, refs: list[Any]):
+        self.refs = refs
+        self.hash = hashlib.sha256()
+
+        # The position of the (mutable) objects seen so far, by id. Objects that are seen again,
+        # like the table data referenced by format functions, are written as a reference to the
+        # first occurrence; this also stops cycles. The objects are kept in `refs`, so their ids
+        # can't be reused meanwhile.
+        self._seen: dict[int, int] = {}
+
+    def write(self, tag: bytes, value: str | bytes = b"") -> None:
+        if isinstance(value, str):
+            value = value.encode("utf-8", "surrogatepass")
+
+        self.hash.update(b"%s%d:%s" % (tag, len(value), value))
+
+    def write_type(self, cls: type) -> None:
+        self.hash.update(_type_tag(cls))
+
+    def update(self, obj: Any) -> None:
+        if isinstance(obj, str):
+            self.write_type(type(obj))
+            self.write(b"s", obj)
+            return
+
+        if isinstance(obj, _SCALAR_TYPES):
+            # repr() makes NaN equal to itself, distinguishes 0.0 from -0.0, and includes time zones
+            self.write_type(type(obj))
+            self.write(b"r", repr(obj))
+            return
+
+        if isinstance(obj, bytes):
+            self.write_type(type(obj))
+            self.write(b"b", obj)
+            return
+
+        if isinstance(obj, Enum):
+            self.write_type(type(obj))
+            self.write(b"e", obj.name)
+            return
+
+        if type(obj).__module__ == "numpy" and getattr(obj, "shape", None) == ():
+            # NumPy scalars, like the row indices of a pandas DataFrame
+            self.write_type(type(obj))
+            self.write(b"n", obj.tobytes())
+            return
+
+        obj_id = id(obj)
+        if obj_id in self._seen:
+            self.write(b"@", str(self._seen[obj_id]))
+            return
+
+        self._seen[obj_id] = len(self._seen)
+        self.refs.append(obj)
+
+        self.write_type(type(obj))
+        self._update_contents(obj)
+
+    def _update_contents(self, obj: Any) -> None:
+        if isinstance(obj, (list, tuple)) and all(type(x) in _PLAIN_TYPES for x in obj):
+            # A fast path for long lists of scalars, like row indices: their repr() is exact
+            self.write(b"l", repr(obj))
+            return
+
+        if isinstance(obj, PersistentList):
+            # Only the items in view, since the backing list can be shared with longer lists
+            self.update(list(obj))
+            return
+
+        if isinstance(obj, (list, tuple, set, frozenset, dict)):
+            items = obj.items() if isinstance(obj, dict) else obj
+            if isinstance(obj, (set, frozenset)):
+                # Sets have no order, so their items are written in the order of their fingerprints
+                items = sorted(items, key=self._item_fingerprint)
+
+            self.write(b"[", str(len(obj)))
+            for item in items:
+                self.update(item)
+            return
+
+        if isinstance(obj, (DataFrameLike, SeriesLike)):
+            try:
+                pickled = pickle.dumps(obj, protocol=5)
+            except Exception:
+                self.write_identity(obj)
+            else:
+                self.write(b"p", hashlib.sha256(pickled).digest())
+            return
+
+        if isinstance(obj, functools.partial):
+            self.update((obj.func, obj.args, obj.keywords))
+            return
+
+        if isinstance(obj, types.FunctionType):
+            closure = tuple(cell.cell_contents for cell in obj.__closure__ or ())
+            self.write(b"f", f"{obj.__module__}.{obj.__qualname__}")
+            self.write(b"c", marshal.dumps(obj.__code__))
+            self.update((obj.__defaults__, obj.__kwdefaults__, closure))
+            return
+
+        if isinstance(obj, types.MethodType):
+            self.update((obj.__func__, obj.__self__))
+            return
+
+        if isinstance(obj, (type, types.BuiltinFunctionType)):
+            self.write(b"q", f"{obj.__module__}.{obj.__qualname__}")
+            return
+
+        if type(obj).__module__.startswith("great_tables."):
+            # Objects holding table parts, like GTData, Body, and StyleInfo
+            if dataclasses.is_dataclass(obj):
+                # The field names are implied by the type
+                self.update(tuple(getattr(obj, name) for name in _field_names(type(obj))))
+                return
+
+            if hasattr(obj, "__dict__"):
+                self.update(vars(obj))
+                return
+
+        self.write_identity(obj)
+
+    def write_identity(self, obj: Any) -> None:
+        self.write(b"i", str(id(obj)))
+
+    def _item_fingerprint(self, item: Any) -> str:
+        return fingerprint(item, self.refs)
+
+
+@functools.lru_cache(maxsize=None)
+def _type_tag(cls: type) -> bytes:
+    name = f"{cls.__module__}.{cls.__qualname__}".encode("utf-8", "surrogatepass")
+    return b"T%d:%s" % (len(name), name)
+
+
+@functools.lru_cache(maxsize=None)
+def _field_names(cls: type) -> tuple[str, ...]:
+    # Fields left out of comparisons (like a table's build cache) aren't part of its contents
+    return tuple(f.name for f in dataclasses.fields(cls) if f.compare)
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import os
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Literal
+
+if TYPE_CHECKING:
+    from .gt import GT
+
+RenderContext = Literal["html", "latex"]
+
+
+@dataclass(frozen=True)
+class RenderResult:
+    """The result of rendering one table with `render_many()`.
+
+    Exactly one of `output` (the rendered table) and `error` (the exception raised while
+    rendering it) is set. `index` is the position of the table in the input.
+    """
+
+    index: int
+    output: str | None = None
+    error: BaseException | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def render_many(
+    gts: Iterable[GT],
+    context: RenderContext = "html",
+    workers: int | None = None,
+    mode: Literal["process", "thread"] = "process",
+    **kwargs: Any,
+) -> Iterator[RenderResult]:
+    """
+    Render many tables, in parallel.
+
+    Each table is rendered with `GT.as_raw_html()` (for `context="html"`) or `GT.as_latex()` (for
+    `context="latex"`), using a pool of workers. The results are yielded in the same order as the
+    tables, as soon as each one (and all the ones before it) is done. An error while rendering a
+    table doesn't stop the others from being rendered: it's returned in that table's result.
+
+    Parameters
+    ----------
+    gts
+        The tables to render. This can be any iterable (e.g., a generator), which is consumed as
+        workers become available.
+    context
+        The output format, either `"html"` or `"latex"`.
+    workers
+        The number of workers. By default, this is the number of CPUs. With `workers=1`, the tables
+        are rendered one at a time in the current process.
+    mode
+        Whether the workers are processes (`"process"`, the default) or threads (`"thread"`).
+        Rendering is mostly CPU-bound Python code, so processes are needed to render tables in
+        parallel on most Python builds; threads only render in parallel on free-threaded builds of
+        Python. In process mode, tables are pickled to send them to the workers, so tables with
+        functions that can't be pickled (like lambdas given to `fmt()`) fail to render.
+    **kwargs
+        Options passed to `GT.as_raw_html()` or `GT.as_latex()`, like `make_page=True` or
+        `use_longtable=True`.
+
+    Returns
+    -------
+    Iterator[RenderResult]
+        An iterator of results, one per table. Each has an `index` (the position of the table in
+        `gts`), and either an `output` string (if `ok` is `True`) or the `error` that was raised.
+
+    Examples
+    --------
+    Let's render a table for each group of rows in the `towny` dataset.
+
+    ```python
+    from great_tables import GT, render_many
+    from great_tables.data import towny
+
+    tables = (
+        GT(df).fmt_integer(columns="population_2021").tab_header(title=region)
+        for region, df in towny.groupby("csd_type")
+    )
+
+    for result in render_many(tables, workers=4):
+        if result.ok:
+            print(len(result.output))
+        else:
+            print(f"Table {result.index} failed: {result.error!r}")
+    ```
+    """
+
+    if context not in ("html", "latex"):
+        raise ValueError(f'The `context=` value must be "html" or "latex", not {context!r}.')
+
+    if mode not in ("process", "thread"):
+        raise ValueError(f'The `mode=` value must be "process" or "thread", not {mode!r}.')
+
+    if workers is not None and workers < 1:
+        raise ValueError(f"The `workers=` value must be at least 1, but {workers} was provided.")
+
+    if workers == 1:
+        return _render_serial(gts, context, kwargs)
+
+    return _render_parallel(gts, context, workers, mode, kwargs)
+
+
+def _render_one(gt: GT, context: RenderContext, kwargs: dict[str, Any]) -> str:
+    if context == "latex":
+        return gt.as_latex(**kwargs)
+
+    return gt.as_raw_html(**kwargs)
+
+
+def _warm_up() -> None:
+    """Load the data and templates that are shared by all renders."""
+
+    from ._locale import _get_locale_registry
+    from ._scss import _gt_styles_template
+
+    _get_locale_registry()
+    _gt_styles_template(True)
+    _gt_styles_template(False)
+
+
+def _render_serial(
+    gts: Iterable[GT], context: RenderContext, kwargs: dict[str, Any]
+) -> Iterator[RenderResult]:
+    _warm_up()
+
+    for index, gt in enumerate(gts):
+        try:
+            output = _render_one(gt, context, kwargs)
+        except Exception as e:
+            yield RenderResult(index, error=e)
+        else:
+            yield RenderResult(index, output=output)
+
+
+def _render_parallel(
+    gts: Iterable[GT],
+    context: RenderContext,
+    workers: int | None,
+    mode: Literal["process", "thread"],
+    kwargs: dict[str, Any],
+) -> Iterator[RenderResult]:
+    n_workers = workers if workers is not None else os.cpu_count() or 1
+
+    executor: Executor
+    if mode == "process":
+        executor = ProcessPoolExecutor(max_workers=n_workers, initializer=_warm_up)
+    else:
+        # The caches that warming fills are shared by the threads
+        _warm_up()
+        executor = ThreadPoolExecutor(max_workers=n_workers)
+
+    # Only a few tables per worker are submitted ahead of the one being yielded, so that the
+    # input is consumed (and the results are held) a bit at a time
+    max_pending = 4 * n_workers
+    pending: deque[tuple[int, Future[str]]] = deque()
+
+    try:
+        for index, gt in enumerate(gts):
+            pending.append((index, executor.submit(_render_one, gt, context, kwargs)))
+
+            if len(pending) >= max_pending:
+                yield _get_result(*pending.popleft())
+
+        while pending:
+            yield _get_result(*pending.popleft())
+
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _get_result(index: int, future: Future[str]) -> RenderResult:
+    # Errors include those from sending the table to a worker (e.g., if it can't be pickled)
+    error = future.exception()
+    if error is not None:
+        return RenderResult(index, error=error)
+
+    return RenderResult(index, output=future.result())
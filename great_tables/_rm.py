@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from ._gt_data import Heading, Spanners
+from ._utils import PersistentList
 
 if TYPE_CHECKING:
     from ._types import GTSelf
@@ -192,7 +193,7 @@ def rm_footnotes(self: GTSelf, footnotes: int | list[int] | None = None) -> GTSe
 
     new_footnotes = [note for ii, note in enumerate(self._footnotes) if ii not in idx_to_remove]
 
-    return self._replace(_footnotes=new_footnotes)
+    return self._replace(_footnotes=PersistentList(new_footnotes))
 
 
 def rm_spanners(
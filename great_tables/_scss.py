@@ -2,8 +2,9 @@ from __future__ import annotations
 
 import re
 from dataclasses import fields
-from functools import partial
+from functools import lru_cache, partial
 from string import Template
+from typing import Any
 
 from importlib_resources import files
 
@@ -85,16 +86,24 @@ def css_add(value: str | int, amount: int):
         raise NotImplementedError(f"Unable to add to CSS value: {value}")
 
 
-def compile_scss(
-    data: GTData, id: str | None, compress: bool = True, all_important: bool = False
-) -> str:
-    """Return CSS for styling a table, based on options set."""
+@lru_cache(maxsize=None)
+def _gt_styles_template(compress: bool) -> Template:
+    """Return the default table styles as a template, reading them from the package only once."""
 
-    # Obtain the SCSS options dictionary
-    options = {field.name: getattr(data._options, field.name) for field in fields(data._options)}
+    gt_styles_default = (files("great_tables") / "css/gt_styles_default.scss").read_text()
+
+    if compress:
+        gt_styles_default = re.sub(r"\s+", " ", gt_styles_default, count=0, flags=re.MULTILINE)
+        gt_styles_default = re.sub(r"}", "}\n", gt_styles_default, count=0, flags=re.MULTILINE)
+
+    return Template(gt_styles_default)
+
+
+def _compile_styles(
+    params: dict[str, Any], id: str | None, compress: bool, all_important: bool
+) -> str:
+    """Return the default table styles, filled in with the SCSS parameters."""
 
-    # Get collection of parameters that pertain to SCSS ----
-    params = {k: opt.value for k, opt in options.items() if opt.scss and opt.value is not None}
     scss_defaults = {k: params.get("table_background_color") for k in DEFAULTS_TABLE_BACKGROUND}
     scss_params = {**scss_defaults, **params}
 
@@ -116,6 +125,50 @@ def compile_scss(
         "heading_padding_bottom": css_add(scss_params["heading_padding"], 1),
     }
 
+    compiled_css = _gt_styles_template(compress).substitute(final_params)
+
+    if id is not None:
+        compiled_css = re.sub(r"\.gt_", f"#{id} .gt_", compiled_css, count=0, flags=re.MULTILINE)
+        compiled_css = re.sub(r"thead", f"#{id} thead", compiled_css, count=0, flags=re.MULTILINE)
+        compiled_css = re.sub(
+            r"^( p|p) \{", f"#{id} p {{", compiled_css, count=0, flags=re.MULTILINE
+        )
+
+    if all_important:
+        compiled_css = re.sub(r";", " !important;", compiled_css, count=0, flags=re.MULTILINE)
+
+    return compiled_css
+
+
+@lru_cache(maxsize=128)
+def _compile_styles_cached(
+    params: tuple[tuple[str, type, Any], ...], id: str | None, compress: bool, all_important: bool
+) -> str:
+    return _compile_styles({k: v for k, _, v in params}, id, compress, all_important)
+
+
+def compile_scss(
+    data: GTData, id: str | None, compress: bool = True, all_important: bool = False
+) -> str:
+    """Return CSS for styling a table, based on options set."""
+
+    # Obtain the SCSS options dictionary
+    options = {field.name: getattr(data._options, field.name) for field in fields(data._options)}
+
+    # Get collection of parameters that pertain to SCSS ----
+    params = {k: opt.value for k, opt in options.items() if opt.scss and opt.value is not None}
+
+    # The compiled styles depend only on these parameters, the id, and the flags, so tables
+    # sharing a theme reuse them (parameters with unhashable values skip the cache). The key
+    # includes each value's type, since e.g. `1` and `1.0` are equal but render differently
+    params_key = tuple((k, type(v), v) for k, v in params.items())
+    try:
+        hash(params_key)
+    except TypeError:
+        compiled_css = _compile_styles(params, id, compress, all_important)
+    else:
+        compiled_css = _compile_styles_cached(params_key, id, compress, all_important)
+
     # Handle table id ----
     # Determine whether the table has an ID
     has_id = id is not None
@@ -169,24 +222,6 @@ def compile_scss(
           -moz-osx-font-smoothing: grayscale;
         }}"""
 
-    gt_styles_default = (files("great_tables") / "css/gt_styles_default.scss").read_text()
-
-    if compress:
-        gt_styles_default = re.sub(r"\s+", " ", gt_styles_default, count=0, flags=re.MULTILINE)
-        gt_styles_default = re.sub(r"}", "}\n", gt_styles_default, count=0, flags=re.MULTILINE)
-
-    compiled_css = Template(gt_styles_default).substitute(final_params)
-
-    if has_id:
-        compiled_css = re.sub(r"\.gt_", f"#{id} .gt_", compiled_css, count=0, flags=re.MULTILINE)
-        compiled_css = re.sub(r"thead", f"#{id} thead", compiled_css, count=0, flags=re.MULTILINE)
-        compiled_css = re.sub(
-            r"^( p|p) \{", f"#{id} p {{", compiled_css, count=0, flags=re.MULTILINE
-        )
-
-    if all_important:
-        compiled_css = re.sub(r";", " !important;", compiled_css, count=0, flags=re.MULTILINE)
-
     # Assemble blocks of CSS ----
     additional_css_block = f"\n{table_additional_css}\n" if has_additional_css else ""
     finalized_css = f"{google_font_css}{gt_table_class_str}\n\n{compiled_css}{additional_css_block}"
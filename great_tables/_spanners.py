@@ -1241,7 +1241,7 @@ def cols_merge(
     )
 
     # Add to _col_merge list
-    return result._replace(_col_merge=[*result._col_merge, col_merge_entry])
+    return result._replace(_col_merge=result._col_merge + [col_merge_entry])
 
 
 def cols_merge_uncert(
@@ -1388,7 +1388,7 @@ def cols_merge_uncert(
         sep=display_sep,
     )
 
-    return result._replace(_col_merge=[*result._col_merge, col_merge_entry])
+    return result._replace(_col_merge=result._col_merge + [col_merge_entry])
 
 
 def cols_merge_range(
@@ -1538,7 +1538,7 @@ def cols_merge_range(
         sep=display_sep,
     )
 
-    return result._replace(_col_merge=[*result._col_merge, col_merge_entry])
+    return result._replace(_col_merge=result._col_merge + [col_merge_entry])
 
 
 def cols_merge_n_pct(
@@ -1676,7 +1676,7 @@ def cols_merge_n_pct(
         sep="",
     )
 
-    return result._replace(_col_merge=[*result._col_merge, col_merge_entry])
+    return result._replace(_col_merge=result._col_merge + [col_merge_entry])
 
 
 def cols_reorder(self: GTSelf, columns: SelectExpr) -> GTSelf:
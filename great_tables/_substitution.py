@@ -2,12 +2,22 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
+from functools import cached_property
+from numbers import Real
 from typing import TYPE_CHECKING, Any, Callable, Literal
 
 from ._formats import fmt
-from ._gt_data import FormatterSkipElement
+from ._gt_data import FormatFns, FormatterSkipElement
 from ._helpers import html
-from ._tbl_data import DataFrameLike, SelectExpr, is_na
+from ._tbl_data import (
+    DataFrameLike,
+    SelectExpr,
+    TblData,
+    is_na,
+    mask_between_column,
+    mask_distinct_column,
+    mask_na_column,
+)
 from ._text import Text, _process_text
 
 if TYPE_CHECKING:
@@ -92,7 +102,7 @@ def sub_missing(
     """
 
     subber = SubMissing(self._tbl_data, missing_text)
-    return fmt(self, fns=subber.to_html, columns=columns, rows=rows, is_substitution=True)
+    return fmt(self, fns=subber.format_fns(), columns=columns, rows=rows, is_substitution=True)
 
 
 def sub_zero(
@@ -152,7 +162,7 @@ def sub_zero(
     """
 
     subber = SubZero(zero_text)
-    return fmt(self, fns=subber.to_html, columns=columns, rows=rows, is_substitution=True)
+    return fmt(self, fns=subber.format_fns(), columns=columns, rows=rows, is_substitution=True)
 
 
 @dataclass
@@ -167,10 +177,21 @@ class SubMissing:
 
     def to_html(self, x: Any) -> str | FormatterSkipElement:
         if is_na(self.dispatch_frame, x):
-            return _process_text(self.missing_text)
+            return self._text
 
         return FormatterSkipElement()
 
+    def mask(self, data: TblData, column: str, rows: list[int]) -> tuple[list[bool], str] | None:
+        mask = mask_na_column(data, column, rows)
+        return None if mask is None else (mask, self._text)
+
+    def format_fns(self) -> FormatFns:
+        return FormatFns(default=self.to_html, mask={"default": self.mask})
+
+    @cached_property
+    def _text(self) -> str:
+        return _process_text(self.missing_text)
+
 
 @dataclass
 class SubZero:
@@ -178,10 +199,21 @@ class SubZero:
 
     def to_html(self, x: Any) -> str | FormatterSkipElement:
         if x == 0:
-            return _process_text(self.zero_text)
+            return self._text
 
         return FormatterSkipElement()
 
+    def mask(self, data: TblData, column: str, rows: list[int]) -> tuple[list[bool], str] | None:
+        mask = mask_between_column(data, column, rows, 0, 0)
+        return None if mask is None else (mask, self._text)
+
+    def format_fns(self) -> FormatFns:
+        return FormatFns(default=self.to_html, mask={"default": self.mask})
+
+    @cached_property
+    def _text(self) -> str:
+        return _process_text(self.zero_text)
+
 
 def sub_small_vals(
     self: GTSelf,
@@ -281,7 +313,7 @@ def sub_small_vals(
             small_pattern = ">-{x}"
 
     subber = SubSmallVals(threshold=threshold, small_pattern=small_pattern, sign=sign)
-    return fmt(self, fns=subber.to_html, columns=columns, rows=rows, is_substitution=True)
+    return fmt(self, fns=subber.format_fns(), columns=columns, rows=rows, is_substitution=True)
 
 
 def sub_large_vals(
@@ -373,7 +405,7 @@ def sub_large_vals(
     threshold = abs(threshold)
 
     subber = SubLargeVals(threshold=threshold, large_pattern=large_pattern, sign=sign)
-    return fmt(self, fns=subber.to_html, columns=columns, rows=rows, is_substitution=True)
+    return fmt(self, fns=subber.format_fns(), columns=columns, rows=rows, is_substitution=True)
 
 
 def sub_values(
@@ -475,7 +507,7 @@ def sub_values(
         raise TypeError("A function must be provided to the `fn` argument.")
 
     subber = SubValues(values=values, pattern=pattern, fn=fn, replacement=replacement)
-    return fmt(self, fns=subber.to_html, columns=columns, rows=rows, is_substitution=True)
+    return fmt(self, fns=subber.format_fns(), columns=columns, rows=rows, is_substitution=True)
 
 
 @dataclass
@@ -485,8 +517,8 @@ class SubSmallVals:
     sign: str
 
     def to_html(self, x: Any) -> str | FormatterSkipElement:
-        # Only operate on numeric values
-        if not isinstance(x, (int, float)):
+        # Only operate on numeric values (including NumPy scalars, like those of pandas columns)
+        if not isinstance(x, Real):
             return FormatterSkipElement()
 
         # Skip NA/NaN values
@@ -500,15 +532,27 @@ class SubSmallVals:
         if self.sign == "+":
             # Value must be positive and less than threshold
             if x > 0 and x < self.threshold:
-                return self._format_text()
+                return self._text
         else:
             # Value must be negative and greater than -threshold (closer to zero)
             if x < 0 and x > -self.threshold:
-                return self._format_text()
+                return self._text
 
         return FormatterSkipElement()
 
-    def _format_text(self) -> str:
+    def mask(self, data: TblData, column: str, rows: list[int]) -> tuple[list[bool], str] | None:
+        if self.sign == "+":
+            mask = mask_between_column(data, column, rows, 0, self.threshold, closed="none")
+        else:
+            mask = mask_between_column(data, column, rows, -self.threshold, 0, closed="none")
+
+        return None if mask is None else (mask, self._text)
+
+    def format_fns(self) -> FormatFns:
+        return FormatFns(default=self.to_html, mask={"default": self.mask})
+
+    @cached_property
+    def _text(self) -> str:
         text = self.small_pattern.replace("{x}", str(self.threshold))
         return _process_text(text)
 
@@ -520,8 +564,8 @@ class SubLargeVals:
     sign: str
 
     def to_html(self, x: Any) -> str | FormatterSkipElement:
-        # Only operate on numeric values
-        if not isinstance(x, (int, float)):
+        # Only operate on numeric values (including NumPy scalars, like those of pandas columns)
+        if not isinstance(x, Real):
             return FormatterSkipElement()
 
         # Skip NA/NaN values
@@ -531,15 +575,27 @@ class SubLargeVals:
         if self.sign == "+":
             # Value must be >= threshold
             if x >= self.threshold:
-                return self._format_text()
+                return self._text
         else:
             # Value must be <= -threshold
             if x <= -self.threshold:
-                return self._format_text()
+                return self._text
 
         return FormatterSkipElement()
 
-    def _format_text(self) -> str:
+    def mask(self, data: TblData, column: str, rows: list[int]) -> tuple[list[bool], str] | None:
+        if self.sign == "+":
+            mask = mask_between_column(data, column, rows, self.threshold, float("inf"))
+        else:
+            mask = mask_between_column(data, column, rows, float("-inf"), -self.threshold)
+
+        return None if mask is None else (mask, self._text)
+
+    def format_fns(self) -> FormatFns:
+        return FormatFns(default=self.to_html, mask={"default": self.mask})
+
+    @cached_property
+    def _text(self) -> str:
         pattern = self.large_pattern
 
         # When sign is "-", flip ">=" to "<=" in the pattern
@@ -559,10 +615,25 @@ class SubValues:
 
     def to_html(self, x: Any) -> str | FormatterSkipElement:
         if self._is_match(x):
-            return _process_text(str(self.replacement))
+            return self._text
 
         return FormatterSkipElement()
 
+    def mask(self, data: TblData, column: str, rows: list[int]) -> tuple[list[bool], str] | None:
+        # A function can match values in any way, so it's called on each value
+        if self.fn is not None:
+            return None
+
+        mask = mask_distinct_column(data, column, rows, self._is_match)
+        return None if mask is None else (mask, self._text)
+
+    def format_fns(self) -> FormatFns:
+        return FormatFns(default=self.to_html, mask={"default": self.mask})
+
+    @cached_property
+    def _text(self) -> str:
+        return _process_text(str(self.replacement))
+
     def _is_match(self, x: Any) -> bool:
         # Skip NA/None values
         if x is None:
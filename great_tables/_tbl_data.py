@@ -2,8 +2,9 @@ from __future__ import annotations
 
 import re
 import warnings
+import weakref
 from functools import singledispatch
-from typing import TYPE_CHECKING, Any, Callable, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, Hashable, Iterable, Literal, Optional, Union
 
 from typing_extensions import TypeAlias
 
@@ -204,6 +205,55 @@ def _(data: PyArrowTable) -> int:
     return data.num_rows
 
 
+# data_fingerprint ----
+
+
+@singledispatch
+def data_fingerprint(data: DataFrameLike) -> Hashable | None:
+    """Return a key that's equal for the same table as long as its contents are unchanged.
+
+    This is meant to detect a table being modified in place, so it's cheap to compute but only
+    compares equal for the very same table. None means that the contents can't be fingerprinted.
+    """
+    raise _raise_not_implemented(data)
+
+
+@data_fingerprint.register
+def _(data: PdDataFrame) -> Hashable | None:
+    import pandas as pd
+
+    try:
+        hashes = pd.util.hash_pandas_object(data, index=True)
+    except TypeError:
+        # cells that can't be hashed (e.g., lists or dicts)
+        return None
+
+    return (
+        id(data),
+        tuple(data.columns),
+        tuple(str(dtype) for dtype in data.dtypes),
+        hashes.to_numpy().tobytes(),
+    )
+
+
+@data_fingerprint.register
+def _(data: PlDataFrame) -> Hashable | None:
+    import polars as pl
+
+    try:
+        row_hash = data.hash_rows().implode().hash().item()
+    except pl.exceptions.PolarsError:
+        return None
+
+    return (id(data), tuple(data.schema.items()), row_hash)
+
+
+@data_fingerprint.register
+def _(data: PyArrowTable) -> Hashable | None:
+    # Tables can't be modified in place
+    return id(data)
+
+
 # _get_cell ----
 
 
@@ -275,6 +325,94 @@ def _(data: PyArrowTable, row: int, column: str, value: Any) -> PyArrowTable:
     return data
 
 
+# _get_column_cells ----
+
+
+@singledispatch
+def _get_column_cells(data: DataFrameLike, column: str, rows: list[int]) -> list[Any]:
+    """Get the content from several rows of a single column in the input data table
+
+    This returns the same values as calling `_get_cell()` once per row, but pulls the column
+    out of the table only once.
+    """
+
+    _raise_not_implemented(data)
+
+
+@_get_column_cells.register(PlDataFrame)
+def _(data: Any, column: str, rows: list[int]) -> list[Any]:
+    # container dtypes (pl.List, pl.Array) are converted to lists by .to_list()
+    return data[column][rows].to_list()
+
+
+@_get_column_cells.register(PdDataFrame)
+def _(data: Any, column: str, rows: list[int]) -> list[Any]:
+    col_ii = data.columns.get_loc(column)
+
+    if not isinstance(col_ii, int):
+        raise ValueError("Column named " + column + " matches multiple columns.")
+
+    # iterating over the underlying array (rather than using .tolist()) keeps the same scalar
+    # types that .iloc returns (e.g. numpy scalars or pandas Timestamps), and taking the rows
+    # first is much faster than indexing the array once per row
+    values = data.iloc[:, col_ii].array
+    return list(values.take(rows))
+
+
+@_get_column_cells.register(PyArrowTable)
+def _(data: PyArrowTable, column: str, rows: list[int]) -> list[Any]:
+    return data.column(column).take(rows).to_pylist()
+
+
+# _set_column_cells ----
+
+
+@singledispatch
+def _set_column_cells(
+    data: DataFrameLike, column: str, rows: list[int], values: list[Any]
+) -> DataFrameLike:
+    """Set several rows of a single column, returning the updated table
+
+    Note that some backends modify the table in place, while others return a new table, so
+    the result should always be used in place of the input.
+    """
+
+    _raise_not_implemented(data)
+
+
+@_set_column_cells.register(PdDataFrame)
+def _(data: Any, column: str, rows: list[int], values: list[Any]) -> PdDataFrame:
+    # TODO: This assumes column names are unique
+    # if this is violated, get_loc will return a mask
+    col_indx = data.columns.get_loc(column)
+    data.iloc[rows, col_indx] = values
+    return data
+
+
+@_set_column_cells.register(PlDataFrame)
+def _(data: Any, column: str, rows: list[int], values: list[Any]) -> PlDataFrame:
+    import polars as pl
+
+    pylist = data[column].to_list()
+    for row, value in zip(rows, values):
+        pylist[row] = value
+
+    # non-strict construction casts values to the column dtype, as single cell assignment does
+    return data.with_columns(pl.Series(column, pylist, dtype=data.schema[column], strict=False))
+
+
+@_set_column_cells.register(PyArrowTable)
+def _(data: PyArrowTable, column: str, rows: list[int], values: list[Any]) -> PyArrowTable:
+    import pyarrow as pa
+
+    colindex = data.column_names.index(column)
+    pylist = data.column(column).to_pylist()
+    for row, value in zip(rows, values):
+        pylist[row] = value
+
+    return data.set_column(colindex, column, pa.array(pylist))
+
+
 # _get_column_dtype ----
 
 
@@ -346,16 +484,19 @@ def _(data: PlDataFrame, group_key: str) -> dict[Any, list[int]]:
 
 @group_splits.register
 def _(data: PyArrowTable, group_key: str) -> dict[Any, list[int]]:
-    import pyarrow.compute as pc
-
     group_col = data.column(group_key)
     encoded = group_col.dictionary_encode().combine_chunks()
 
-    d = {}
-    for idx, group_key in enumerate(encoded.dictionary):
-        mask = pc.equal(encoded.indices, idx)
-        d[group_key.as_py()] = pc.indices_nonzero(mask).to_pylist()
-    return d
+    # Bucket the row numbers by dictionary index in a single pass over the rows. The dictionary
+    # holds the groups in order of first appearance, and null groups have no index.
+    keys = encoded.dictionary.to_pylist()
+    splits: list[list[int]] = [[] for _ in keys]
+
+    for row, idx in enumerate(encoded.indices.to_pylist()):
+        if idx is not None:
+            splits[idx].append(row)
+
+    return dict(zip(keys, splits))
 
 
 # eval_select ----
@@ -628,6 +769,351 @@ def _(df: PyArrowTable, replacement: PyArrowTable):
     )
 
 
+# cast_column_to_string ----
+
+
+class _ColumnMemo:
+    """Memoize per-column results for a DataFrame, for as long as the DataFrame is alive.
+
+    Entries are keyed by the identity of the DataFrame, so this is only suitable for DataFrames
+    that can't be modified in place (i.e., pyarrow Tables).
+    """
+
+    def __init__(self):
+        self._entries: dict[int, tuple[weakref.ref[Any], dict[str, Any]]] = {}
+
+    def get(self, df: DataFrameLike, column: str, compute: Callable[[], Any]) -> Any:
+        key = id(df)
+        entry = self._entries.get(key)
+
+        if entry is None or entry[0]() is not df:
+            # The entry is dropped as soon as the DataFrame is garbage collected (and so before
+            # its id can be reused)
+            ref = weakref.ref(df, lambda _, key=key: self._entries.pop(key, None))
+            entry = self._entries[key] = (ref, {})
+
+        columns = entry[1]
+        if column not in columns:
+            columns[column] = compute()
+
+        return columns[column]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_string_columns = _ColumnMemo()
+
+
+@singledispatch
+def cast_column_to_string(df: DataFrameLike, column: str) -> SeriesLike:
+    """Return a single column of the input DataFrame, cast to string like cast_frame_to_string()"""
+    raise NotImplementedError(f"Unsupported type: {type(df)}")
+
+
+# pandas and polars DataFrames can be modified in place, so their results aren't memoized
+
+
+@cast_column_to_string.register
+def _(df: PdDataFrame, column: str):
+    return _get_pd_column(df, column).astype("string")
+
+
+@cast_column_to_string.register
+def _(df: PlDataFrame, column: str):
+    return cast_frame_to_string(df.select(column)).to_series()
+
+
+@cast_column_to_string.register
+def _(df: PyArrowTable, column: str):
+    import pyarrow as pa
+
+    return _string_columns.get(df, column, lambda: df.column(column).cast(pa.string()))
+
+
+def _get_pd_column(df: PdDataFrame, column: str) -> PdSeries:
+    col_ii = df.columns.get_loc(column)
+
+    if not isinstance(col_ii, int):
+        raise ValueError("Column named " + column + " matches multiple columns.")
+
+    return df.iloc[:, col_ii]
+
+
+# fill_null_column ----
+
+
+@singledispatch
+def fill_null_column(df: DataFrameLike, column: str, replacement: DataFrameLike) -> list[Any]:
+    """Return the values of a column, with nulls replaced by the string-cast replacement column
+
+    This is the single-column version of
+    `replace_null_frame(df, cast_frame_to_string(replacement))`. The replacement column is only
+    cast to string when the column has nulls.
+    """
+    raise NotImplementedError(f"Unsupported type: {type(df)}")
+
+
+@fill_null_column.register
+def _(df: PdDataFrame, column: str, replacement: PdDataFrame) -> list[Any]:
+    ser = _get_pd_column(df, column)
+
+    if ser.hasnans:
+        # replace by position, since the body shares the index of the original data
+        ser = ser.where(ser.notna(), cast_column_to_string(replacement, column).array)
+
+    return ser.tolist()
+
+
+@fill_null_column.register
+def _(df: PlDataFrame, column: str, replacement: PlDataFrame) -> list[Any]:
+    ser = df[column]
+
+    if ser.null_count():
+        ser = ser.fill_null(cast_column_to_string(replacement, column))
+
+    return ser.to_list()
+
+
+@fill_null_column.register
+def _(df: PyArrowTable, column: str, replacement: PyArrowTable) -> list[Any]:
+    import pyarrow.compute as pc
+
+    arr = df.column(column)
+
+    if arr.null_count:
+        arr = pc.if_else(pc.is_null(arr), cast_column_to_string(replacement, column), arr)
+
+    return arr.to_pylist()
+
+
+# Column masks ----
+#
+# These check the given rows of a column with the backend's vectorized operations. Those that
+# only handle some column types return None for the others, so that callers can fall back to
+# checking one value at a time.
+
+
+@singledispatch
+def mask_na_column(df: DataFrameLike, column: str, rows: list[int]) -> list[bool] | None:
+    """Return whether each of the `rows` of a column is missing, as `is_na()` would."""
+    raise NotImplementedError(f"Unsupported type: {type(df)}")
+
+
+@mask_na_column.register
+def _(df: PdDataFrame, column: str, rows: list[int]) -> list[bool] | None:
+    return _get_pd_column(df, column).iloc[rows].isna().tolist()
+
+
+@mask_na_column.register
+def _(df: PlDataFrame, column: str, rows: list[int]) -> list[bool] | None:
+    import polars as pl
+
+    ser = df[column]
+    if ser.dtype == pl.Object:
+        return None
+
+    ser = ser[rows]
+    mask = ser.is_null()
+    if ser.dtype.is_float():
+        mask = mask | ser.is_nan().fill_null(False)
+
+    return mask.to_list()
+
+
+@mask_na_column.register
+def _(df: PyArrowTable, column: str, rows: list[int]) -> list[bool] | None:
+    import pyarrow.compute as pc
+
+    return pc.is_null(df.column(column).take(rows), nan_is_null=True).to_pylist()
+
+
+BetweenClosed: TypeAlias = Literal["both", "left", "right", "none"]
+
+
+@singledispatch
+def mask_between_column(
+    df: DataFrameLike,
+    column: str,
+    rows: list[int],
+    lower: float,
+    upper: float,
+    closed: BetweenClosed = "both",
+) -> list[bool] | None:
+    """Return whether each of the `rows` of a numeric column is between two bounds.
+
+    Missing values (including NaN) and strings are never between the bounds. This returns None
+    for other columns that aren't integer or floating point (e.g., booleans or decimals).
+    """
+    raise NotImplementedError(f"Unsupported type: {type(df)}")
+
+
+@mask_between_column.register
+def _(
+    df: PdDataFrame,
+    column: str,
+    rows: list[int],
+    lower: float,
+    upper: float,
+    closed: BetweenClosed = "both",
+) -> list[bool] | None:
+    import pandas as pd
+    from pandas.api.types import is_bool_dtype, is_float_dtype, is_integer_dtype
+
+    ser = _get_pd_column(df, column)
+    if isinstance(ser.dtype, pd.StringDtype):
+        return [False] * len(rows)
+    if is_bool_dtype(ser.dtype) or not (is_integer_dtype(ser.dtype) or is_float_dtype(ser.dtype)):
+        return None
+
+    inclusive = "neither" if closed == "none" else closed
+    mask = ser.iloc[rows].between(lower, upper, inclusive=inclusive)
+
+    return mask.fillna(False).astype(bool).tolist()
+
+
+@mask_between_column.register
+def _(
+    df: PlDataFrame,
+    column: str,
+    rows: list[int],
+    lower: float,
+    upper: float,
+    closed: BetweenClosed = "both",
+) -> list[bool] | None:
+    import polars as pl
+
+    ser = df[column]
+    if ser.dtype == pl.String:
+        return [False] * len(rows)
+    if not (ser.dtype.is_integer() or ser.dtype.is_float()):
+        return None
+
+    ser = ser[rows]
+    if ser.dtype.is_integer():
+        # polars casts the bounds to the column's dtype, which overflows when they lie outside
+        # its range (e.g., negative bounds for unsigned integers)
+        ser = ser.cast(pl.Float64)
+    mask = ser.is_between(lower, upper, closed=closed)
+    if ser.dtype.is_float():
+        # polars orders NaN above all other values
+        mask = mask & ~ser.is_nan()
+
+    return mask.fill_null(False).to_list()
+
+
+@mask_between_column.register
+def _(
+    df: PyArrowTable,
+    column: str,
+    rows: list[int],
+    lower: float,
+    upper: float,
+    closed: BetweenClosed = "both",
+) -> list[bool] | None:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    arr = df.column(column)
+    if pa.types.is_string(arr.type) or pa.types.is_large_string(arr.type):
+        return [False] * len(rows)
+    if not (pa.types.is_integer(arr.type) or pa.types.is_floating(arr.type)):
+        return None
+
+    arr = arr.take(rows)
+    above = pc.greater_equal if closed in ("both", "left") else pc.greater
+    below = pc.less_equal if closed in ("both", "right") else pc.less
+    mask = pc.and_(above(arr, lower), below(arr, upper))
+
+    return pc.fill_null(mask, False).to_pylist()
+
+
+@singledispatch
+def mask_distinct_column(
+    df: DataFrameLike, column: str, rows: list[int], predicate: Callable[[Any], bool]
+) -> list[bool] | None:
+    """Return whether `predicate()` holds for each of the `rows` of a column.
+
+    The predicate is only called once per distinct value, and the matching values are then
+    looked up in the column. So it must give the same result for values that are equal, and it
+    can't match NaN. This returns None for columns whose values can't be deduplicated (e.g.,
+    lists), or when NaN matches.
+    """
+    raise NotImplementedError(f"Unsupported type: {type(df)}")
+
+
+def _matching_values(values: Iterable[Any], predicate: Callable[[Any], bool]) -> list[Any] | None:
+    matching = [x for x in values if predicate(x)]
+    if any(isinstance(x, float) and x != x for x in matching):
+        return None
+
+    return matching
+
+
+@mask_distinct_column.register
+def _(
+    df: PdDataFrame, column: str, rows: list[int], predicate: Callable[[Any], bool]
+) -> list[bool] | None:
+    ser = _get_pd_column(df, column).iloc[rows]
+
+    try:
+        distinct = ser.unique()
+    except TypeError:
+        return None
+
+    matching = _matching_values(distinct, predicate)
+    if matching is None:
+        return None
+
+    return ser.isin(matching).tolist() if matching else [False] * len(rows)
+
+
+@mask_distinct_column.register
+def _(
+    df: PlDataFrame, column: str, rows: list[int], predicate: Callable[[Any], bool]
+) -> list[bool] | None:
+    import polars as pl
+
+    ser = df[column][rows]
+
+    try:
+        distinct = ser.unique().to_list()
+    except pl.exceptions.PolarsError:
+        return None
+
+    matching = _matching_values(distinct, predicate)
+    if matching is None:
+        return None
+    if not matching:
+        return [False] * len(rows)
+
+    return ser.is_in(pl.Series(matching, dtype=ser.dtype).implode()).fill_null(False).to_list()
+
+
+@mask_distinct_column.register
+def _(
+    df: PyArrowTable, column: str, rows: list[int], predicate: Callable[[Any], bool]
+) -> list[bool] | None:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    arr = df.column(column).take(rows)
+
+    try:
+        distinct = pc.unique(arr).to_pylist()
+    except pa.ArrowException:
+        return None
+
+    matching = _matching_values(distinct, predicate)
+    if matching is None:
+        return None
+    if not matching:
+        return [False] * len(rows)
+
+    mask = pc.is_in(arr, value_set=pa.array(matching, type=arr.type))
+    return pc.fill_null(mask, False).to_pylist()
+
+
 @singledispatch
 def to_list(ser: SeriesLike) -> list[Any]:
     raise NotImplementedError(f"Unsupported type: {type(ser)}")
@@ -765,6 +1251,14 @@ def _(df: PlDataFrame, x: Any) -> bool:
 def _(df: PyArrowTable, x: Any) -> bool:
     import pyarrow as pa
 
+    # fast paths for common cell values, since creating an array per value is slow
+    if x is None:
+        return True
+    if type(x) is float:
+        return x != x
+    if type(x) in (str, int, bool):
+        return False
+
     arr = pa.array([x])
     return arr.is_null(nan_is_null=True).to_pylist()[0]
 
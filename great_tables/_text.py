@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import html
 import re
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Callable
 
@@ -59,18 +60,95 @@ class Html(Text):
 
 
 def _md_html(x: str) -> str:
-    if "{{" in x and "}}" in x:
-        from great_tables._helpers import UnitStr
+    cached = _md_html_cache.get(x)
+    if cached is not None:
+        return cached
+
+    return _cache_md_html(x, _md_html_uncached(x))
 
-        unit_str = UnitStr.from_str(x)
-        processed_text = unit_str.to_html()
-    else:
-        processed_text = x
+
+def _md_html_uncached(x: str) -> str:
+    processed_text = _md_units_to_html(x)
 
     str_result = markdown_to_html(processed_text, unsafe=True)
     if str_result is None:
         return processed_text
-    return re.sub(r"^<p>|</p>\n$", "", str_result)
+    return _strip_md_paragraph(str_result)
+
+
+def _md_html_many(xs: list[str]) -> list[str]:
+    """Render many Markdown strings to HTML, giving the same results as `_md_html()` on each.
+
+    The strings that aren't already cached are rendered together, as a single document with the
+    strings separated by an HTML comment, and the output is split at the comments. Strings with
+    constructs that could reach past a separator (like fenced code blocks, raw HTML, or link
+    reference definitions) are rendered on their own.
+    """
+
+    to_render = {x: _md_units_to_html(x) for x in xs if x not in _md_html_cache}
+    batch = [x for x, processed in to_render.items() if _md_is_batchable(processed)]
+    rendered: dict[str, str] = {}
+
+    if len(batch) > 1:
+        str_result = markdown_to_html(
+            f"\n\n{_MD_BATCH_SEP}\n\n".join(to_render[x] for x in batch), unsafe=True
+        )
+        parts = str_result.split(f"{_MD_BATCH_SEP}\n") if str_result is not None else []
+
+        # In case the documents weren't kept apart, they're rendered one at a time below
+        if len(parts) == len(batch):
+            for x, part in zip(batch, parts):
+                rendered[x] = _cache_md_html(x, _strip_md_paragraph(part))
+
+    return [rendered[x] if x in rendered else _md_html(x) for x in xs]
+
+
+# The Markdown of table cells often repeats across rows (and tables), so the HTML for each
+# string is cached (up to a limit on the number of entries)
+_MD_HTML_CACHE_SIZE = 4096
+_md_html_cache: OrderedDict[str, str] = OrderedDict()
+
+_MD_BATCH_SEP = "<!-- gt-md-batch-sep -->"
+
+
+def _cache_md_html(x: str, result: str) -> str:
+    if len(_md_html_cache) >= _MD_HTML_CACHE_SIZE:
+        # evict the oldest entry
+        try:
+            _md_html_cache.popitem(last=False)
+        except KeyError:
+            pass
+
+    _md_html_cache[x] = result
+    return result
+
+
+def _md_units_to_html(x: str) -> str:
+    if "{{" in x and "}}" in x:
+        from great_tables._helpers import UnitStr
+
+        unit_str = UnitStr.from_str(x)
+        return unit_str.to_html()
+
+    return x
+
+
+def _md_is_batchable(x: str) -> bool:
+    # Raw HTML, link reference definitions, and fenced code blocks
+    return "<" not in x and "]:" not in x and "```" not in x and "~~~" not in x
+
+
+def _strip_md_paragraph(x: str) -> str:
+    # Same as `re.sub(r"^<p>|</p>\n$", "", x)`, which is much slower for many short strings
+    if x.startswith("<p>"):
+        x = x[3:]
+
+    if x.endswith("</p>\n"):
+        return x[:-5]
+    if x.endswith("</p>\n\n"):
+        return x[:-6] + "\n"
+
+    return x
 
 
 def _md_latex(x: str) -> str:
@@ -3,17 +3,20 @@ from __future__ import annotations
 import importlib
 import itertools
 import re
-from collections.abc import Generator, Set
+import threading
+from collections.abc import Generator, Sequence, Set
 from types import ModuleType
-from typing import TYPE_CHECKING, Any, Iterable, Iterator
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, TypeVar, overload
 
-from ._tbl_data import _get_cell, _set_cell, get_column_names, n_rows
+from ._tbl_data import _get_cell, get_column_names, n_rows
 from ._text import BaseText, _process_text
 
 if TYPE_CHECKING:
     from ._gt_data import FormatInfo, GTData
     from ._tbl_data import TblData
 
+T = TypeVar("T")
+
 
 def _try_import(name: str, pip_install_line: str | None = None) -> ModuleType:
     try:
@@ -117,6 +120,85 @@ class OrderedSet(Set[Any]):
         return f"{cls_name}({lst!r})"
 
 
+class PersistentList(Sequence[T]):
+    """An immutable list that shares storage with the lists it was appended to.
+
+    Adding items to a PersistentList returns a new PersistentList, and leaves the original as is.
+    Each PersistentList is a view of the first `n` items of a backing list. When items are added
+    to the most recent view of the backing list, they're appended to it in place, so a chain of
+    additions takes O(1) time per item rather than copying the whole list each time. Adding items
+    to an older view copies its items into a new backing list.
+
+    This is used for the table parts that GT methods add to (e.g., styles, formats, footnotes),
+    since each method returns a new GT and earlier GT objects must not change.
+    """
+
+    __slots__ = ("_items", "_n")
+
+    # Guards the check-then-append in `__add__()`, so that two threads adding to the same view
+    # can't both append in place
+    _lock = threading.Lock()
+
+    def __init__(self, items: Iterable[T] = ()) -> None:
+        self._items: list[T] = list(items)
+        self._n = len(self._items)
+
+    @classmethod
+    def _from_shared(cls, items: list[T], n: int) -> PersistentList[T]:
+        new = cls.__new__(cls)
+        new._items = items
+        new._n = n
+        return new
+
+    @overload
+    def __getitem__(self, ii: int) -> T: ...
+
+    @overload
+    def __getitem__(self, ii: slice) -> PersistentList[T]: ...
+
+    def __getitem__(self, ii: int | slice) -> T | PersistentList[T]:
+        if isinstance(ii, slice):
+            return PersistentList(self._items[: self._n][ii])
+
+        # Indexing a range checks the bounds and resolves negative indices
+        return self._items[range(self._n)[ii]]
+
+    def __iter__(self) -> Iterator[T]:
+        return itertools.islice(self._items, self._n)
+
+    def __len__(self) -> int:
+        return self._n
+
+    def __add__(self, other: Iterable[T]) -> PersistentList[T]:
+        new_items = list(other)
+        if not new_items:
+            return self
+
+        with self._lock:
+            if len(self._items) == self._n:
+                # This is the most recent view, so the items can be appended in place
+                items = self._items
+                items.extend(new_items)
+            else:
+                items = [*self._items[: self._n], *new_items]
+
+        return self._from_shared(items, self._n + len(new_items))
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (PersistentList, list)):
+            return len(self) == len(other) and all(x == y for x, y in zip(self, other))
+
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (type(self), (list(self),))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self)!r})"
+
+
 def _as_css_font_family_attr(fonts: list[str], value_only: bool = False) -> str:
     fonts_w_spaces: list[str] = list(map(lambda x: f"'{x}'" if " " in x else x, fonts))
 
@@ -272,7 +354,7 @@ def _migrate_unformatted_to_output(
 
         result = _process_text(cell_value_str, context=context)
 
-        _set_cell(data._body.body, row, col, result)
+        data._body.set_cell(row, col, result)
 
     return data
 
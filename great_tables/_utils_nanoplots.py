@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import math
 import random
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Callable
 
 from ._tbl_data import Agnostic, NpInteger, is_na
@@ -11,13 +13,19 @@ REFERENCE_LINE_KEYWORDS = ["mean", "median", "min", "max", "q1", "q3"]
 
 
 def _is_na(x: Any) -> bool:
+    # Plain numbers make up most values in nanoplots, so they're checked without dispatching
+    if isinstance(x, float):
+        return math.isnan(x)
+    if isinstance(x, int):
+        return False
+
     return is_na(Agnostic(), x)
 
 
 def _map_is_na(x: list[Any]) -> list[bool]:
     # TODO: all([]) returns True. Let's double check all places
     # in the code that call all() with this function. Do they work as intended?
-    return [is_na(Agnostic(), val) for val in x]
+    return [_is_na(val) for val in x]
 
 
 def _val_is_numeric(x: Any) -> bool:
@@ -122,8 +130,6 @@ def _format_number_compactly(
     Format a single numeric value compactly, using a currency if provided.
     """
 
-    from great_tables.vals import fmt_currency, fmt_integer, fmt_number, fmt_scientific
-
     if fn is not None and isinstance(fn, Callable):
         res = fn(val)
 
@@ -136,6 +142,27 @@ def _format_number_compactly(
     if _is_na(val):
         return "NA"
 
+    return _format_number_compactly_cached(val, currency, as_integer)
+
+
+# The values of a nanoplot column (and its axis bounds) repeat a lot, so formatted values are
+# cached; `typed=True` keeps apart values that are equal but format differently (e.g., 1 and 1.0)
+@lru_cache(maxsize=4096, typed=True)
+def _format_number_compactly_cached(
+    val: int | float, currency: str | None, as_integer: bool
+) -> str:
+    # The formatting functions behind `vals.fmt_*()` are called directly with frameless data,
+    # which avoids building a one-column table for every value
+    from ._formats import (
+        _get_currency_decimals,
+        _validate_currency,
+        fmt_currency_context,
+        fmt_integer_context,
+        fmt_number_context,
+        fmt_scientific_context,
+    )
+    from ._gt_data import FramelessData
+
     if val == 0:
         return "0"
 
@@ -203,49 +230,89 @@ def _format_number_compactly(
 
     # Format value accordingly
 
+    data = FramelessData()
+
     if currency is not None:
-        if abs(val) >= 1e15:
-            val_formatted = fmt_currency(
-                1e15,
-                currency=currency,
-                use_subunits=False,
-                decimals=0,
-                # compact=True,
-            )
+        _validate_currency(currency=currency)
 
-            val_formatted = f">{val_formatted}"
+        # Values too large to format as a currency are only marked as such
+        if abs(val) >= 1e15:
+            return ">"
 
-        else:
-            val_formatted = fmt_currency(
-                val,
-                currency=currency,
-                use_subunits=use_subunits,
-                decimals=decimals,
-                # compact=compact,
-            )
+        val_formatted = fmt_currency_context(
+            val,
+            data=data,
+            currency=currency,
+            decimals=_get_currency_decimals(
+                currency=currency, decimals=decimals, use_subunits=use_subunits
+            ),
+            drop_trailing_dec_mark=True,
+            use_seps=True,
+            accounting=False,
+            scale_by=1,
+            compact=False,
+            sep_mark=",",
+            dec_mark=".",
+            force_sign=False,
+            placement="left",
+            incl_space=False,
+            pattern="{x}",
+            context="html",
+        )
 
     else:
         if abs(val) < 0.01 or abs(val) >= 1e15:
-            val_formatted = fmt_scientific(
+            val_formatted = fmt_scientific_context(
                 val,
-                exp_style="E",
-                n_sigfig=n_sigfig,
+                data=data,
                 decimals=1,
+                n_sigfig=n_sigfig,
+                drop_trailing_zeros=False,
+                drop_trailing_dec_mark=True,
+                scale_by=1,
+                exp_style="E",
+                dec_mark=".",
+                force_sign_m=False,
+                force_sign_n=False,
+                pattern="{x}",
+                context="html",
             )
 
         else:
             if as_integer and val > -100 and val < 100:
-                val_formatted = fmt_integer(val)
+                val_formatted = fmt_integer_context(
+                    val,
+                    data=data,
+                    use_seps=True,
+                    scale_by=1,
+                    accounting=False,
+                    compact=False,
+                    sep_mark=",",
+                    force_sign=False,
+                    pattern="{x}",
+                    context="html",
+                )
 
             else:
-                val_formatted = fmt_number(
+                val_formatted = fmt_number_context(
                     val,
-                    n_sigfig=n_sigfig,
+                    data=data,
                     decimals=1,
+                    n_sigfig=n_sigfig,
+                    drop_trailing_zeros=False,
+                    drop_trailing_dec_mark=True,
+                    use_seps=True,
+                    accounting=False,
+                    scale_by=1,
                     compact=compact,
+                    sep_mark=",",
+                    dec_mark=".",
+                    force_sign=False,
+                    pattern="{x}",
+                    context="html",
                 )
 
-    return val_formatted[0]
+    return val_formatted
 
 
 #
@@ -499,6 +566,46 @@ def _normalize_to_dict(**kwargs: list[int | float]) -> dict[str, list[int | floa
     return args
 
 
+@dataclass(frozen=True)
+class _SingleYScale:
+    """
+    The common scale of the single-value plots in a column, which share the values of all rows.
+    Collecting these once keeps each row's plot from going over the values of every other row.
+    """
+
+    y_min: int | float
+    y_max: int | float
+    all_zero: bool
+    all_negative: bool
+
+    @classmethod
+    def from_vals(cls, all_single_y_vals: list[int | float]) -> _SingleYScale:
+        vals = _remove_na_from_list(all_single_y_vals)
+        n_missing = len(all_single_y_vals) - len(vals)
+
+        return cls(
+            # The scale always includes zero, where the plots start from
+            y_min=min([*vals, 0]),
+            y_max=max([*vals, 0]),
+            all_zero=n_missing == 0 and all(val == 0 for val in vals),
+            all_negative=n_missing == 0 and all(val < 0 for val in vals),
+        )
+
+    def proportions(self, val: int | float) -> tuple[float, float]:
+        """
+        Get the proportions of `val` and of zero along the scale (as `_normalize_to_dict()` would
+        with all the values).
+        """
+
+        if self.all_zero:
+            return 0.5, 0.5
+
+        y_min = min(self.y_min, val)
+        y_max = max(self.y_max, val)
+
+        return (val - y_min) / (y_max - y_min), (0 - y_min) / (y_max - y_min)
+
+
 def _construct_nanoplot_svg(
     viewbox: str,
     svg_height: str,
@@ -539,6 +646,48 @@ def _construct_nanoplot_svg(
     return f'<div><svg role="img" viewBox="{viewbox}" style="height: {svg_height}; margin-left: auto; margin-right: auto; font-size: inherit; overflow: visible; vertical-align: middle; position:relative;">{svg_defs}{svg_style}{ref_area_tags}{area_path_tags}{data_path_tags}{zero_line_tags}{bar_tags}{ref_line_tags}{circle_tags}{g_y_axis_tags}{g_guide_tags}</svg></div>'
 
 
+# The <defs> and <style> tags only depend on the options, which are shared by all the
+# nanoplots of a column, so these are made once rather than for every plot
+@lru_cache
+def _nanoplot_svg_defs(data_area_fill_color: str) -> str:
+    """
+    Generate the background with a repeating line pattern for data areas.
+    """
+
+    return (
+        f"<defs>"
+        f'<pattern id="area_pattern" width="8" height="8" patternUnits="userSpaceOnUse">'
+        f'<path class="pattern-line" d="M 0,8 l 8,-8 M -1,1 l 4,-4 M 6,10 l 4,-4" stroke="'
+        f"{data_area_fill_color}"
+        f'" stroke-width="1.5" stroke-linecap="round" shape-rendering="geometricPrecision">'
+        f"</path>"
+        f"</pattern>"
+        f"</defs>"
+    )
+
+
+@lru_cache
+def _nanoplot_svg_style(interactive_data_values: bool, vertical_guide_stroke_color: str) -> str:
+    """
+    Generate the style tag for vertical guidelines and the y-axis.
+    """
+
+    hover_param = ":hover" if interactive_data_values else ""
+
+    return (
+        f"<style> text {{ font-family: ui-monospace, 'Cascadia Code', 'Source Code Pro', Menlo, Consolas, 'DejaVu Sans Mono', monospace; stroke-width: 0.15em; paint-order: stroke; stroke-linejoin: round; cursor: default; }} "
+        f".vert-line{hover_param} rect {{ fill: {vertical_guide_stroke_color}; fill-opacity: 40%; stroke: #FFFFFF60; color: red; }} "
+        f".vert-line{hover_param} text {{ stroke: white; fill: #212427; }} "
+        f".horizontal-line{hover_param} text {{stroke: white; fill: #212427; }} "
+        f".ref-line{hover_param} rect {{ stroke: #FFFFFF60; }} "
+        f".ref-line{hover_param} line {{ stroke: #FF0000; }} "
+        f".ref-line{hover_param} text {{ stroke: white; fill: #212427; }} "
+        f".y-axis-line{hover_param} rect {{ fill: #EDEDED; fill-opacity: 60%; stroke: #FFFFFF60; color: red; }} "
+        f".y-axis-line{hover_param} text {{ stroke: white; stroke-width: 0.20em; fill: #1A1C1F; }} "
+        f"</style>"
+    )
+
+
 def _generate_nanoplot(
     y_vals: list[int] | list[float] | list[int | float],
     y_ref_line: str | None = None,
@@ -549,6 +698,7 @@ def _generate_nanoplot(
     missing_vals: str = "marker",
     all_y_vals: list[int] | list[float] | list[int | float] | None = None,
     all_single_y_vals: list[int] | list[float] | list[int | float] | None = None,
+    single_y_scale: _SingleYScale | None = None,
     plot_type: str = "line",
     data_line_type: str = "curved",
     currency: str | None = None,
@@ -711,6 +861,9 @@ def _generate_nanoplot(
 
         y_vals = [y_vals]
 
+        if single_y_scale is None:
+            single_y_scale = _SingleYScale.from_vals(all_single_y_vals)
+
     # If this is a box plot, set several parameters
     if plot_type == "boxplot":
         show_data_points = False
@@ -1142,18 +1295,8 @@ def _generate_nanoplot(
 
         bar_thickness = data_point_radius[0] * 4
 
-        if all(val == 0 for val in all_single_y_vals):
-            # Handle case where all values across rows are `0`
-
-            y_proportion = 0.5
-            y_proportion_zero = 0.5
-
-        else:
-            # Scale to proportional values
-            y_proportions_list = _normalize_to_dict(val=y_vals, all_vals=all_single_y_vals, zero=0)
-
-            y_proportion = y_proportions_list["val"][0]
-            y_proportion_zero = y_proportions_list["zero"][0]
+        # Scale to proportional values (when all values across rows are `0`, both are `0.5`)
+        y_proportion, y_proportion_zero = single_y_scale.proportions(y_vals[0])
 
         y0_width = y_proportion_zero * data_x_width
         y_width = y_proportion * data_x_width
@@ -1196,11 +1339,11 @@ def _generate_nanoplot(
             text_strings = f'<text x="{y0_width - 10}" y="{safe_y_d + 10}" fill="transparent" stroke="transparent" font-size="30px" text-anchor="end">{y_value}</text>'
 
         elif y_vals[0] == 0:
-            if all(val == 0 for val in all_single_y_vals):
+            if single_y_scale.all_zero:
                 text_anchor = "start"
                 x_position_text = y0_width + 10
 
-            elif all(val < 0 for val in all_single_y_vals):
+            elif single_y_scale.all_negative:
                 text_anchor = "end"
                 x_position_text = y0_width - 10
 
@@ -1237,18 +1380,8 @@ def _generate_nanoplot(
 
         bar_thickness = data_point_radius[0] * 4
 
-        if all(val == 0 for val in all_single_y_vals):
-            # Handle case where all values across rows are `0`
-
-            y_proportion = 0.5
-            y_proportion_zero = 0.5
-
-        else:
-            # Scale to proportional values
-            y_proportions_list = _normalize_to_dict(val=y_vals, all_vals=all_single_y_vals, zero=0)
-
-            y_proportion = y_proportions_list["val"][0]
-            y_proportion_zero = y_proportions_list["zero"][0]
+        # Scale to proportional values (when all values across rows are `0`, both are `0.5`)
+        y_proportion, y_proportion_zero = single_y_scale.proportions(y_vals[0])
 
         y0_width = y_proportion_zero * data_x_width
         y_width = y_proportion * data_x_width
@@ -1285,11 +1418,11 @@ def _generate_nanoplot(
             text_strings = f'<text x="{y0_width - 10}" y="{safe_y_d + 10}" fill="transparent" stroke="transparent" font-size="30px" text-anchor="end">{y_value}</text>'
 
         elif y_vals[0] == 0:
-            if all(val == 0 for val in all_single_y_vals):
+            if single_y_scale.all_zero:
                 text_anchor = "start"
                 x_position_text = y0_width + 10
 
-            elif all(val < 0 for val in all_single_y_vals):
+            elif single_y_scale.all_negative:
                 text_anchor = "end"
                 x_position_text = y0_width - 10
 
@@ -1436,16 +1569,7 @@ def _generate_nanoplot(
     # Generate background with repeating line pattern
     #
 
-    svg_defs = (
-        f"<defs>"
-        f'<pattern id="area_pattern" width="8" height="8" patternUnits="userSpaceOnUse">'
-        f'<path class="pattern-line" d="M 0,8 l 8,-8 M -1,1 l 4,-4 M 6,10 l 4,-4" stroke="'
-        f"{data_area_fill_color}"
-        f'" stroke-width="1.5" stroke-linecap="round" shape-rendering="geometricPrecision">'
-        f"</path>"
-        f"</pattern>"
-        f"</defs>"
-    )
+    svg_defs = _nanoplot_svg_defs(data_area_fill_color)
 
     if plot_type == "line" and show_data_area:
         area_path_tags = []
@@ -1472,20 +1596,7 @@ def _generate_nanoplot(
     # Generate style tag for vertical guidelines and y-axis
     #
 
-    hover_param = ":hover" if interactive_data_values else ""
-
-    svg_style = (
-        f"<style> text {{ font-family: ui-monospace, 'Cascadia Code', 'Source Code Pro', Menlo, Consolas, 'DejaVu Sans Mono', monospace; stroke-width: 0.15em; paint-order: stroke; stroke-linejoin: round; cursor: default; }} "
-        f".vert-line{hover_param} rect {{ fill: {vertical_guide_stroke_color}; fill-opacity: 40%; stroke: #FFFFFF60; color: red; }} "
-        f".vert-line{hover_param} text {{ stroke: white; fill: #212427; }} "
-        f".horizontal-line{hover_param} text {{stroke: white; fill: #212427; }} "
-        f".ref-line{hover_param} rect {{ stroke: #FFFFFF60; }} "
-        f".ref-line{hover_param} line {{ stroke: #FF0000; }} "
-        f".ref-line{hover_param} text {{ stroke: white; fill: #212427; }} "
-        f".y-axis-line{hover_param} rect {{ fill: #EDEDED; fill-opacity: 60%; stroke: #FFFFFF60; color: red; }} "
-        f".y-axis-line{hover_param} text {{ stroke: white; stroke-width: 0.20em; fill: #1A1C1F; }} "
-        f"</style>"
-    )
+    svg_style = _nanoplot_svg_style(interactive_data_values, vertical_guide_stroke_color)
 
     nanoplot_svg = _construct_nanoplot_svg(
         viewbox=viewbox,
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-from itertools import chain
-from typing import TYPE_CHECKING, Any, cast
+from itertools import chain, islice
+from typing import Any, Iterator, cast
 
 from htmltools import HTML, TagList, css, tags
 
 from . import _locations as loc
+from ._body import BodyCells
 from ._gt_data import (
     ColInfo,
     ColInfoTypeEnum,
@@ -17,15 +18,11 @@ from ._gt_data import (
     Styles,
     SummaryRowInfo,
 )
+from ._profile import record_counts
 from ._spanners import spanners_print_matrix
-from ._tbl_data import _get_cell, cast_frame_to_string, replace_null_frame
 from ._text import BaseText, _process_text, _process_text_id
 from ._utils import heading_has_subtitle, heading_has_title, seq_groups
 
-if TYPE_CHECKING:
-    from ._tbl_data import TblData
-
-
 # TODO: The footnote ordering functions (_get_locnum_for_footnote_location,
 # _get_summary_locnum, _get_footnote_mark_string, _process_footnotes_for_display)
 # should be extracted to a shared module (e.g., _footnote_ordering.py) so that
@@ -112,6 +109,45 @@ def _is_loc(loc: str | loc.Loc, cls: type[loc.Loc]):
     return isinstance(loc, cls)
 
 
+class _CellInfoIndex:
+    """Index StyleInfo or FootnoteInfo entries by row and by (row, column).
+
+    Body rendering looks up the entries for every cell; indexing them once turns each
+    lookup into a dict access rather than a scan over all entries. Lookups return entries
+    in their original order.
+    """
+
+    def __init__(self, infos: list[StyleInfo] | list[FootnoteInfo]):
+        self._by_row: dict[int | None, list[Any]] = {}
+        self._by_cell: dict[tuple[int | None, str | None], list[Any]] = {}
+
+        for info in infos:
+            self._by_row.setdefault(info.rownum, []).append(info)
+            self._by_cell.setdefault((info.rownum, info.colname), []).append(info)
+
+    def row(self, rownum: int | None) -> list[Any]:
+        return self._by_row.get(rownum, [])
+
+    def cell(self, rownum: int | None, colname: str | None) -> list[Any]:
+        return self._by_cell.get((rownum, colname), [])
+
+
+def _index_body_footnotes(footnotes: list[FootnoteInfo]) -> dict[type[loc.Loc], _CellInfoIndex]:
+    """Index footnotes that may appear in body or summary cells, by location class."""
+    loc_classes = (
+        loc.LocStub,
+        loc.LocBody,
+        loc.LocSummaryStub,
+        loc.LocSummary,
+        loc.LocGrandSummaryStub,
+        loc.LocGrandSummary,
+    )
+    return {
+        cls: _CellInfoIndex([x for x in footnotes if isinstance(x.locname, cls)])
+        for cls in loc_classes
+    }
+
+
 def _flatten_styles(styles: Styles, wrap: bool = False) -> str | None:
     # flatten all StyleInfo.styles lists
     style_entries = list(chain.from_iterable((x.styles for x in styles)))
@@ -615,10 +651,33 @@ def create_columns_component_h(data: GTData) -> str:
 
 
 def create_body_component_h(data: GTData) -> str:
-    # for now, just coerce everything in the original data to a string
-    # so we can fill in the body data with it
-    _str_orig_data = cast_frame_to_string(data._tbl_data)
-    tbl_data = replace_null_frame(data._body.body, _str_orig_data)
+    all_body_rows = "\n".join(_iter_body_rows_h(data))
+
+    return f"""<tbody class="gt_table_body">
+{all_body_rows}
+</tbody>"""
+
+
+def iter_body_component_h(data: GTData, batch_size: int) -> Iterator[str]:
+    """Yield the table body in chunks of up to `batch_size` rows.
+
+    The chunks join up to the output of `create_body_component_h()`.
+    """
+
+    yield '<tbody class="gt_table_body">\n'
+
+    rows = _iter_body_rows_h(data)
+    sep = ""
+    while batch := list(islice(rows, batch_size)):
+        yield sep + "\n".join(batch)
+        sep = "\n"
+
+    yield "\n</tbody>"
+
+
+def _iter_body_rows_h(data: GTData) -> Iterator[str]:
+    # cells that weren't formatted are filled in with the original data, coerced to a string
+    cell_data = BodyCells(data._body.body, data._tbl_data)
 
     # Filter list of StyleInfo to only those that apply to the stub
     styles_row_group_label = [x for x in data._styles if _is_loc(x.locname, loc.LocRowGroups)]
@@ -634,6 +693,16 @@ def create_body_component_h(data: GTData) -> str:
     styles_summary = [x for x in data._styles if _is_loc(x.locname, loc.LocSummary)]
     styles_grand_summary = [x for x in data._styles if _is_loc(x.locname, loc.LocGrandSummary)]
 
+    # Index the per-cell styles and footnotes once, so each cell is a lookup rather than a scan
+    index_row_label = _CellInfoIndex(styles_row_label)
+    index_summary_label = _CellInfoIndex(styles_summary_label)
+    index_grand_summary_label = _CellInfoIndex(styles_grand_summary_label)
+    index_cells = _CellInfoIndex(styles_cells)
+    index_summary = _CellInfoIndex(styles_summary)
+    index_grand_summary = _CellInfoIndex(styles_grand_summary)
+    footnotes_index = _index_body_footnotes(data._footnotes)
+    footnotes_row_groups = [x for x in data._footnotes if isinstance(x.locname, loc.LocRowGroups)]
+
     # Get the default column vars
     column_vars = data._boxhead._get_default_columns()
 
@@ -661,14 +730,14 @@ def create_body_component_h(data: GTData) -> str:
             )
             column_vars = [summary_row_stub_var] + column_vars
 
+    record_counts(cells=len(data._stub) * len(column_vars))
+
     # Is the stub to be striped?
     table_stub_striped = data._options.row_striping_include_stub.value
 
     # Are the rows in the table body to be striped?
     table_body_striped = data._options.row_striping_include_table_body.value
 
-    body_rows: list[str] = []
-
     # Add grand summary rows at top
     top_g_summary_rows = data._summary_rows_grand.get_summary_rows(side="top")
     for i, summary_row in enumerate(top_g_summary_rows):
@@ -679,14 +748,15 @@ def create_body_component_h(data: GTData) -> str:
             has_group_stub_column=has_group_stub_column,  # Add this parameter
             apply_stub_striping=False,  # No striping for summary rows
             apply_body_striping=False,  # No striping for summary rows
-            styles_cells=styles_grand_summary,
-            styles_labels=styles_grand_summary_label,
+            styles_cells=index_grand_summary,
+            styles_labels=index_grand_summary_label,
+            footnotes_index=footnotes_index,
             row_index=i,
             summary_row=summary_row,
             css_class="gt_last_grand_summary_row_top" if i == len(top_g_summary_rows) - 1 else None,
             data=data,
         )
-        body_rows.append(row_html)
+        yield row_html
 
     # iterate over rows (ordered by groupings)
     prev_group_info = None
@@ -717,9 +787,7 @@ def create_body_component_h(data: GTData) -> str:
 
                 # Apply footnote marks to group label
                 footnotes_group = [
-                    x
-                    for x in data._footnotes
-                    if isinstance(x.locname, loc.LocRowGroups) and x.grpname == group_info.group_id
+                    x for x in footnotes_row_groups if x.grpname == group_info.group_id
                 ]
                 group_label = _apply_footnotes_to_text(footnotes_group, data, group_label)
 
@@ -760,7 +828,7 @@ def create_body_component_h(data: GTData) -> str:
     <th class="gt_group_heading" colspan="{colspan_value}"{group_styles}>{group_label}</th>
   </tr>"""
 
-                    body_rows.append(group_row)
+                    yield group_row
 
                 # Render top summary rows immediately after the group heading
                 if data._summary_rows and top_summary_rows_for_group:
@@ -776,8 +844,9 @@ def create_body_component_h(data: GTData) -> str:
                             leading_cell=summary_leading,
                             apply_stub_striping=False,
                             apply_body_striping=False,
-                            styles_cells=styles_summary,
-                            styles_labels=styles_summary_label,
+                            styles_cells=index_summary,
+                            styles_labels=index_summary_label,
+                            footnotes_index=footnotes_index,
                             row_index=si,
                             summary_row=summary_row,
                             css_class="gt_last_summary_row_top"
@@ -787,7 +856,7 @@ def create_body_component_h(data: GTData) -> str:
                             summary_group_id=group_info.group_id,
                             row_class="gt_row_group_first" if si == 0 and leading_cell else None,
                         )
-                        body_rows.append(row_html)
+                        yield row_html
 
                     # Clear leading_cell so data row doesn't also get it
                     if leading_cell:
@@ -802,14 +871,15 @@ def create_body_component_h(data: GTData) -> str:
             leading_cell=leading_cell,
             apply_stub_striping=table_stub_striped and odd_j_row,
             apply_body_striping=table_body_striped and odd_j_row,
-            styles_cells=styles_cells,
-            styles_labels=styles_row_label,
+            styles_cells=index_cells,
+            styles_labels=index_row_label,
+            footnotes_index=footnotes_index,
             row_index=i,
-            tbl_data=tbl_data,
+            cell_data=cell_data,
             data=data,
             row_class="gt_row_group_first" if leading_cell else None,
         )
-        body_rows.append(row_html)
+        yield row_html
 
         prev_group_info = group_info
 
@@ -835,15 +905,16 @@ def create_body_component_h(data: GTData) -> str:
                         has_group_stub_column=has_group_stub_column,
                         apply_stub_striping=False,
                         apply_body_striping=False,
-                        styles_cells=styles_summary,
-                        styles_labels=styles_summary_label,
+                        styles_cells=index_summary,
+                        styles_labels=index_summary_label,
+                        footnotes_index=footnotes_index,
                         row_index=si,
                         summary_row=summary_row,
                         css_class="gt_first_summary_row" if si == 0 else None,
                         data=data,
                         summary_group_id=group_id,
                     )
-                    body_rows.append(row_html)
+                    yield row_html
 
     # Add grand summary rows at bottom
     bottom_g_summary_rows = data._summary_rows_grand.get_summary_rows(side="bottom")
@@ -855,20 +926,15 @@ def create_body_component_h(data: GTData) -> str:
             has_group_stub_column=has_group_stub_column,  # Add this parameter
             apply_stub_striping=False,
             apply_body_striping=False,
-            styles_cells=styles_grand_summary,
-            styles_labels=styles_grand_summary_label,
+            styles_cells=index_grand_summary,
+            styles_labels=index_grand_summary_label,
+            footnotes_index=footnotes_index,
             row_index=i + len(top_g_summary_rows),
             summary_row=summary_row,
             css_class="gt_first_grand_summary_row_bottom" if i == 0 else None,
             data=data,
         )
-        body_rows.append(row_html)
-
-    all_body_rows = "\n".join(body_rows)
-
-    return f"""<tbody class="gt_table_body">
-{all_body_rows}
-</tbody>"""
+        yield row_html
 
 
 def _create_row_component_h(
@@ -878,12 +944,13 @@ def _create_row_component_h(
     has_group_stub_column: bool,
     apply_stub_striping: bool,
     apply_body_striping: bool,
-    styles_cells: list[StyleInfo],  # Either styles_cells OR styles_grand_summary
-    styles_labels: list[StyleInfo],  # Either styles_row_label OR styles_grand_summary_label
+    styles_cells: _CellInfoIndex,  # Either styles_cells OR styles_grand_summary
+    styles_labels: _CellInfoIndex,  # Either styles_row_label OR styles_grand_summary_label
+    footnotes_index: dict[type[loc.Loc], _CellInfoIndex],  # From _index_body_footnotes()
     leading_cell: str | None = None,  # For group label when row_group_as_column = True
     row_index: int | None = None,
     summary_row: SummaryRowInfo | None = None,  # For summary rows
-    tbl_data: TblData | None = None,
+    cell_data: BodyCells | None = None,
     css_class: str | None = None,
     data: GTData | None = None,  # For footnote handling
     summary_group_id: str | None = None,  # For group summary rows (distinguishes from grand)
@@ -901,9 +968,7 @@ def _create_row_component_h(
 
     # Handle special cases for summary rows with group stub columns
     if is_summary_row and has_group_stub_column:
-        cell_styles = _flatten_styles(
-            [x for x in styles_labels if x.rownum == row_index], wrap=True
-        )
+        cell_styles = _flatten_styles(styles_labels.row(row_index), wrap=True)
 
         classes = ["gt_row", "gt_left", "gt_stub", summary_css_class]
         if css_class:
@@ -916,17 +981,11 @@ def _create_row_component_h(
             if is_group_summary:
                 footnotes_i = [
                     x
-                    for x in data._footnotes
-                    if isinstance(x.locname, loc.LocSummaryStub)
-                    and x.rownum == row_index
-                    and x.grpname == summary_group_id
+                    for x in footnotes_index[loc.LocSummaryStub].row(row_index)
+                    if x.grpname == summary_group_id
                 ]
             else:
-                footnotes_i = [
-                    x
-                    for x in data._footnotes
-                    if isinstance(x.locname, loc.LocGrandSummaryStub) and x.rownum == row_index
-                ]
+                footnotes_i = footnotes_index[loc.LocGrandSummaryStub].row(row_index)
             stub_label = _apply_footnotes_to_text(footnotes_i, data, stub_label)
 
         if is_group_summary:
@@ -961,7 +1020,7 @@ def _create_row_component_h(
             # TODO: this row is technically a summary row, but is_summary_row is False here
             cell_content = "&nbsp;"
         else:
-            cell_content = _get_cell(tbl_data, row_index, colinfo.var)
+            cell_content = cell_data.get(row_index, colinfo.var)
 
         if css_class:
             classes = [css_class]
@@ -975,67 +1034,38 @@ def _create_row_component_h(
         if data is not None and not is_summary_row:
             if colinfo.is_stub:
                 # For stub cells, footnotes are stored with colname=None
-                footnotes_i = [
-                    x
-                    for x in data._footnotes
-                    if isinstance(x.locname, loc.LocStub) and x.rownum == row_index
-                ]
+                footnotes_i = footnotes_index[loc.LocStub].row(row_index)
                 cell_str = _apply_footnotes_to_text(footnotes_i, data, cell_str)
             else:
-                footnotes_i = [
-                    x
-                    for x in data._footnotes
-                    if isinstance(x.locname, loc.LocBody)
-                    and x.colname == colinfo.var
-                    and x.rownum == row_index
-                ]
+                footnotes_i = footnotes_index[loc.LocBody].cell(row_index, colinfo.var)
                 cell_str = _apply_footnotes_to_text(footnotes_i, data, cell_str)
         elif data is not None and is_summary_row:
             if is_group_summary:
                 if colinfo.is_stub:
                     footnotes_i = [
                         x
-                        for x in data._footnotes
-                        if isinstance(x.locname, loc.LocSummaryStub)
-                        and x.rownum == row_index
-                        and x.grpname == summary_group_id
+                        for x in footnotes_index[loc.LocSummaryStub].row(row_index)
+                        if x.grpname == summary_group_id
                     ]
                     cell_str = _apply_footnotes_to_text(footnotes_i, data, cell_str)
                 else:
                     footnotes_i = [
                         x
-                        for x in data._footnotes
-                        if isinstance(x.locname, loc.LocSummary)
-                        and x.colname == colinfo.var
-                        and x.rownum == row_index
-                        and x.grpname == summary_group_id
+                        for x in footnotes_index[loc.LocSummary].cell(row_index, colinfo.var)
+                        if x.grpname == summary_group_id
                     ]
                     cell_str = _apply_footnotes_to_text(footnotes_i, data, cell_str)
             else:
                 if colinfo.is_stub:
-                    footnotes_i = [
-                        x
-                        for x in data._footnotes
-                        if isinstance(x.locname, loc.LocGrandSummaryStub) and x.rownum == row_index
-                    ]
+                    footnotes_i = footnotes_index[loc.LocGrandSummaryStub].row(row_index)
                     cell_str = _apply_footnotes_to_text(footnotes_i, data, cell_str)
                 else:
-                    footnotes_i = [
-                        x
-                        for x in data._footnotes
-                        if isinstance(x.locname, loc.LocGrandSummary)
-                        and x.colname == colinfo.var
-                        and x.rownum == row_index
-                    ]
+                    footnotes_i = footnotes_index[loc.LocGrandSummary].cell(row_index, colinfo.var)
                     cell_str = _apply_footnotes_to_text(footnotes_i, data, cell_str)
 
         # Get styles
-        _body_styles = [
-            x for x in styles_cells if x.rownum == row_index and x.colname == colinfo.var
-        ]
-        _rowname_styles = (
-            [x for x in styles_labels if x.rownum == row_index] if colinfo.is_stub else []
-        )
+        _body_styles = styles_cells.cell(row_index, colinfo.var)
+        _rowname_styles = styles_labels.row(row_index) if colinfo.is_stub else []
 
         # Build classes and element
         if colinfo.is_stub:
@@ -5,8 +5,9 @@ import warnings
 from itertools import chain
 from typing import TYPE_CHECKING
 
+from ._body import BodyCells
+from ._profile import record_counts, render_phase
 from ._spanners import spanners_print_matrix
-from ._tbl_data import _get_cell, cast_frame_to_string, replace_null_frame
 from ._text import _process_text
 from ._utils import heading_has_subtitle, heading_has_title, seq_groups
 from ._utils_render_html import _get_spanners_matrix_height
@@ -417,12 +418,13 @@ def create_body_component_l(data: GTData) -> str:
         The LaTeX code for the body component of the table.
     """
 
-    _str_orig_data = cast_frame_to_string(data._tbl_data)
-    tbl_data = replace_null_frame(data._body.body, _str_orig_data)
+    cell_data = BodyCells(data._body.body, data._tbl_data)
 
     # Get the default column vars
     column_vars = data._boxhead._get_default_columns()
 
+    record_counts(cells=len(data._stub) * len(column_vars))
+
     # Check if stub is present and determine layout
     has_summary_rows = bool(data._summary_rows or data._summary_rows_grand)
     stub_layout = data._stub._get_stub_layout(
@@ -501,7 +503,7 @@ def create_body_component_l(data: GTData) -> str:
         if has_row_stub_column:
             # Get the row name from the stub
             if row_stub_var is not None:
-                rowname = _get_cell(tbl_data, i, row_stub_var.var)
+                rowname = cell_data.get(i, row_stub_var.var)
                 rowname_str = str(rowname)
             else:
                 # Placeholder stub for summary rows (no actual rowname column)
@@ -511,7 +513,7 @@ def create_body_component_l(data: GTData) -> str:
 
         # Add data cells
         for colinfo in column_vars:
-            cell_content = _get_cell(tbl_data, i, colinfo.var)
+            cell_content = cell_data.get(i, colinfo.var)
             cell_str: str = str(cell_content)
 
             body_cells.append(cell_str)
@@ -743,16 +745,20 @@ def _render_as_latex(data: GTData, use_longtable: bool = False, tbl_pos: str | N
     table_start = create_table_start_l(data=data, use_longtable=use_longtable)
 
     # Create the heading component
-    heading_component = create_heading_component_l(data=data, use_longtable=use_longtable)
+    with render_phase("heading"):
+        heading_component = create_heading_component_l(data=data, use_longtable=use_longtable)
 
     # Create the columns component
-    columns_component = create_columns_component_l(data=data)
+    with render_phase("column_labels"):
+        columns_component = create_columns_component_l(data=data)
 
     # Create the body component
-    body_component = create_body_component_l(data=data)
+    with render_phase("body"):
+        body_component = create_body_component_l(data=data)
 
     # Create the footnotes component
-    footer_component = create_footer_component_l(data=data)
+    with render_phase("footer"):
+        footer_component = create_footer_component_l(data=data)
 
     # Create a LaTeX fragment for the ending tabular statement
     table_end = create_table_end_l(use_longtable=use_longtable)
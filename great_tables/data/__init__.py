@@ -29,6 +29,33 @@ def _read_csv_polars(fname: Any, dtype: dict[str, str] | None = None) -> Any:
     return pl.read_csv(fname, schema_overrides=schema_overrides)
 
 
+def _read_csv_pyarrow(fname: Any, dtype: dict[str, str] | None = None) -> Any:
+    """Read a CSV file as a pyarrow Table."""
+    import pyarrow as pa
+    from pyarrow import csv
+
+    column_types = None
+    if dtype is not None:
+        _PD_TO_PA = {
+            "object": pa.string(),
+            "int64": pa.int64(),
+            "Int64": pa.int64(),
+            "float64": pa.float64(),
+        }
+        column_types = {col: _PD_TO_PA[t] for col, t in dtype.items()}
+
+    # Treat only empty fields as missing (in string columns too), as polars does
+    convert_options = csv.ConvertOptions(
+        column_types=column_types, null_values=[""], strings_can_be_null=True
+    )
+
+    # The bundled files are small, so parse them on the calling thread
+    read_options = csv.ReadOptions(use_threads=False)
+
+    with fname.open("rb") as f:
+        return csv.read_csv(f, read_options=read_options, convert_options=convert_options)
+
+
 def _read_csv(fname: Any, dtype: dict[str, str] | None = None) -> Any:
     """Read a CSV file using pandas (preferred for backward compat) or polars."""
 
@@ -327,8 +354,7 @@ _nuclides_dtype = {
 _islands_fname = DATA_MOD / "x-islands.csv"
 _airquality_fname = DATA_MOD / "x-airquality.csv"
 
-countrypops = _read_csv(_countrypops_fname, dtype=_countrypops_dtype)  # type: ignore
-countrypops.__doc__ = """
+_countrypops_doc = """
 Yearly populations of countries from 1960 to 2022.
 
 A dataset that presents yearly, total populations of countries. Total population is based on counts
@@ -363,8 +389,7 @@ Source
 <https://data.worldbank.org/indicator/SP.POP.TOTL>
 """
 
-sza = _read_csv(_sza_fname, dtype=_sza_dtype)  # type: ignore
-sza.__doc__ = """
+_sza_doc = """
 Twice hourly solar zenith angles by month & latitude.
 
 This dataset contains solar zenith angles (in degrees, with the range of 0-90) every half hour from
@@ -410,8 +435,7 @@ Calculated Actinic Fluxes (290 - 700 nm) for Air Pollution Photochemistry Applic
 1976), available at: <https://nepis.epa.gov/Exe/ZyPURL.cgi?Dockey=9100JA26.txt>.
 """
 
-gtcars = _read_csv(_gtcars_fname, dtype=_gtcars_dtype)  # type: ignore
-gtcars.__doc__ = """
+_gtcars_doc = """
 Deluxe automobiles from the 2014-2017 period.
 
 Expensive and fast cars. Each row describes a car of a certain make, model, year, and trim. Basic
@@ -469,8 +493,7 @@ $ msrp        <f64> 447000.0, 291744.0, 263553.0
 
 """
 
-sp500 = _read_csv(_sp500_fname, dtype=_sp500_dtype)  # type: ignore
-sp500.__doc__ = """
+_sp500_doc = """
 Daily S&P 500 Index data from 1950 to 2015.
 
 This dataset provides daily price indicators for the S&P 500 index from the beginning of 1950 to the
@@ -503,8 +526,7 @@ $ adj_close <f64> 2043.9399, 2063.3601, 2078.3601
 
 """
 
-pizzaplace = _read_csv(_pizzaplace_fname, dtype=_pizzaplace_dtype)  # type: ignore
-pizzaplace.__doc__ = """
+_pizzaplace_doc = """
 A year of pizza sales from a pizza place.
 
 A synthetic dataset that describes pizza sales for a pizza place somewhere in the US. While the
@@ -620,8 +642,7 @@ $ price <f64> 13.25, 16.0, 16.0
 
 """
 
-exibble = _read_csv(_exibble_fname, dtype=_exibble_dtype)  # type: ignore
-exibble.__doc__ = """
+_exibble_doc = """
 A toy example table for testing with great_tables: exibble.
 
 This table contains data of a few different classes, which makes it well-suited for quick
@@ -663,8 +684,7 @@ $ group    <str> 'grp_a', 'grp_a', 'grp_a'
 
 """
 
-towny = _read_csv(_towny_fname, dtype=_towny_dtype)  # type: ignore
-towny.__doc__ = """
+_towny_doc = """
 Populations of all municipalities in Ontario from 1996 to 2021.
 
 A dataset containing census population data from six census years (1996 to 2021) for all 414 of
@@ -741,8 +761,7 @@ $ pop_change_2016_2021_pct <f64> 0.0932, 0.007, 0.0013
 
 """
 
-peeps = _read_csv(_peeps_fname, dtype=_peeps_dtype)  # type: ignore
-peeps.__doc__ = """
+_peeps_doc = """
 A table of personal information for people all over the world.
 
 The `peeps` dataset contains records for one hundred people residing in ten different countries.
@@ -797,8 +816,7 @@ $ weight_kg    <f64> 76.4, 74.9, 61.6
 
 """
 
-films = _read_csv(_films_fname, dtype=_films_dtype)  # type: ignore
-films.__doc__ = """
+_films_doc = """
 Feature films in competition at the Cannes Film Festival.
 
 Each entry in the `films` is a feature film that appeared in the official selection during a
@@ -845,8 +863,7 @@ $ imdb_url            <str> 'https://www.imdb.com/title/tt0038297/',
 
 """
 
-metro = _read_csv(_metro_fname, dtype=_metro_dtype)  # type: ignore
-metro.__doc__ = """
+_metro_doc = """
 The stations of the Paris Metro.
 
 A dataset with information on all 314 Paris Metro stations as of June 2024. Each record represents a
@@ -913,8 +930,7 @@ $ location           <str> 'Paris 16th, Paris 17th',
 
 """
 
-gibraltar = _read_csv(_gibraltar_fname, dtype=_gibraltar_dtype)  # type: ignore
-gibraltar.__doc__ = """
+_gibraltar_doc = """
 Weather conditions in Gibraltar, May 2023.
 
 The `gibraltar` dataset has meteorological data for the Gibraltar Airport Station from May 1 to May
@@ -955,8 +971,7 @@ $ condition  <str> 'Fair', 'Fair', 'Fair'
 
 """
 
-constants = _read_csv(_constants_fname, dtype=_constants_dtype)  # type: ignore
-constants.__doc__ = """
+_constants_doc = """
 The fundamental physical constants.
 
 This dataset contains values for over 300 basic fundamental constants in nature. The values
@@ -996,8 +1011,7 @@ $ units     <str> None, 'kg', 'J'
 
 """
 
-illness = _read_csv(_illness_fname, dtype=_illness_dtype)  # type: ignore
-illness.__doc__ = """
+_illness_doc = """
 Lab tests for one suffering from an illness.
 
 A dataset with artificial daily lab data for a patient with Yellow Fever (YF). The table comprises
@@ -1081,8 +1095,7 @@ $ norm_u <f64> None, 10.0, 8.0
 
 """
 
-reactions = _read_csv(_reactions_fname, dtype=_reactions_dtype)  # type: ignore
-reactions.__doc__ = """
+_reactions_doc = """
 Reaction rates for gas-phase atmospheric reactions of organic compounds.
 
 The `reactions` dataset contains kinetic data for second-order (two body) gas-phase chemical
@@ -1200,8 +1213,7 @@ $ Cl_t_high     <f64> 300.0, 500.0, 950.0
 
 """
 
-photolysis = _read_csv(_photolysis_fname, dtype=_photolysis_dtype)  # type: ignore
-photolysis.__doc__ = """
+_photolysis_doc = """
 Data on photolysis rates for gas-phase organic compounds.
 
 The `photolysis` dataset contains numerical values for describing the photolytic degradation
@@ -1255,8 +1267,7 @@ $ sigma_298_cm2 <str> '1.43E-18,1.27E-18,1.11E-18,...',
 
 """
 
-nuclides = _read_csv(_nuclides_fname, dtype=_nuclides_dtype)  # type: ignore
-nuclides.__doc__ = """
+_nuclides_doc = """
 Nuclide data.
 
 The `nuclides` dataset contains information on all known nuclides, providing data on nuclear
@@ -1330,9 +1341,6 @@ $ mass_excess_uncert         <f64> 1.3e-05, 1.5e-05, 8e-05
 
 """
 
-islands = _read_csv(_islands_fname)  # type: ignore
-airquality = _read_csv(_airquality_fname)  # type: ignore
-
 
 _x_locales_fname = DATA_MOD / "x_locales.csv"
 _x_locales_dtype = {
@@ -1390,11 +1398,9 @@ _x_locales_dtype = {
     "page_size_options_label_text": "object",
 }
 
-__x_locales = _read_csv(_x_locales_fname, dtype=_x_locales_dtype)  # type: ignore
-
 
 # ---------------------------------------------------------------------------
-# Backend-scoped dataset access: data.pd.<name> and data.pl.<name>
+# Lazy dataset access: data.<name>, data.pd.<name>, data.pl.<name>, and data.pa.<name>
 # ---------------------------------------------------------------------------
 
 # Registry mapping dataset names to (fname, dtype) pairs
@@ -1419,16 +1425,177 @@ _DATASETS: dict[str, tuple[Any, dict[str, str] | None]] = {
     "airquality": (_airquality_fname, None),
 }
 
+# Docstrings attached to the datasets available at the top level of this module
+_DATASET_DOCS: dict[str, str] = {
+    "countrypops": _countrypops_doc,
+    "sza": _sza_doc,
+    "gtcars": _gtcars_doc,
+    "sp500": _sp500_doc,
+    "pizzaplace": _pizzaplace_doc,
+    "exibble": _exibble_doc,
+    "towny": _towny_doc,
+    "peeps": _peeps_doc,
+    "films": _films_doc,
+    "metro": _metro_doc,
+    "gibraltar": _gibraltar_doc,
+    "constants": _constants_doc,
+    "illness": _illness_doc,
+    "reactions": _reactions_doc,
+    "photolysis": _photolysis_doc,
+    "nuclides": _nuclides_doc,
+}
+
+# Internal datasets, loaded on access (e.g., `from great_tables.data import __x_locales`)
+_INTERNAL_DATASETS: dict[str, tuple[Any, dict[str, str] | None]] = {
+    "__x_locales": (_x_locales_fname, _x_locales_dtype),
+}
+
+
+# On-disk cache ----
+# Parsing the larger CSVs dominates the time it takes to load them. If the environment variable
+# below names a directory, each dataset is saved there (per backend) in the Arrow IPC format the
+# first time it's loaded, and read back from there in later processes.
+
+DATA_CACHE_DIR_ENV = "GREAT_TABLES_DATA_CACHE_DIR"
+
+# Schema metadata key listing the pandas columns that had the `object` dtype before caching
+_PD_OBJECT_COLS_KEY = b"great_tables_object_columns"
+
+
+def _write_cache_pandas(df: Any, path: Any) -> None:
+    import json
+
+    import pandas.api.types as pd_api
+    import pyarrow as pa
+    import pyarrow.feather as feather
+
+    object_cols = [col for col, dtype in df.dtypes.items() if pd_api.is_object_dtype(dtype)]
+
+    tbl = pa.Table.from_pandas(df, preserve_index=False)
+    metadata = {**(tbl.schema.metadata or {}), _PD_OBJECT_COLS_KEY: json.dumps(object_cols)}
+    feather.write_feather(tbl.replace_schema_metadata(metadata), path)
+
+
+def _read_cache_pandas(path: Any) -> Any:
+    import json
+
+    import numpy as np
+    import pyarrow.feather as feather
+
+    tbl = feather.read_table(path)
+    df = tbl.to_pandas()
+
+    # Restore `object` columns (with NaN for missing values), which is what `pd.read_csv()` gives
+    for col in json.loads(tbl.schema.metadata[_PD_OBJECT_COLS_KEY]):
+        values = df[col].astype(object)
+        df[col] = values.where(values.notna(), np.nan)
+
+    return df
+
+
+def _write_cache_polars(df: Any, path: Any) -> None:
+    df.write_ipc(path)
+
+
+def _read_cache_polars(path: Any) -> Any:
+    import polars as pl
+
+    return pl.read_ipc(path)
+
+
+def _write_cache_pyarrow(df: Any, path: Any) -> None:
+    import pyarrow.feather as feather
+
+    feather.write_feather(df, path)
+
+
+def _read_cache_pyarrow(path: Any) -> Any:
+    import pyarrow.feather as feather
+
+    return feather.read_table(path, memory_map=False)
+
+
+def _cache_write_errors() -> tuple[type[Exception], ...]:
+    """Return the errors that writing a dataset to the cache may raise."""
+
+    try:
+        import pyarrow as pa
+    except ImportError:
+        return (ImportError, OSError)
+
+    return (ImportError, OSError, pa.ArrowException)
+
+
+def _cache_path(backend: str, name: str, fname: Any, dtype: dict[str, str] | None) -> Any:
+    """Return the path of the cached dataset, or None if caching isn't enabled.
+
+    The file name includes a hash of the CSV file's size and modification time (or of its contents,
+    if it isn't a file on disk) and the dtypes, so that a stale cache is never read.
+    """
+
+    import hashlib
+    import os
+    from pathlib import Path
+
+    cache_dir = os.environ.get(DATA_CACHE_DIR_ENV)
+    if not cache_dir:
+        return None
+
+    if isinstance(fname, Path):
+        stat = fname.stat()
+        source_key = f"{fname.name}:{stat.st_size}:{stat.st_mtime_ns}".encode()
+    else:
+        source_key = fname.read_bytes()
+
+    key = hashlib.sha256(source_key + repr(dtype).encode()).hexdigest()[:16]
+
+    return Path(cache_dir) / f"{name}-{backend}-{key}.arrow"
+
+
+def _load_dataset(backend: str, name: str, fname: Any, dtype: dict[str, str] | None) -> Any:
+    """Load a dataset with a backend's CSV reader, going through the on-disk cache if enabled."""
+
+    import os
+
+    reader = _READERS[backend]
+    read_cache, write_cache = _CACHE_FUNCS[backend]
+    path = _cache_path(backend, name, fname, dtype)
+
+    if path is not None and path.exists():
+        try:
+            return read_cache(path)
+        except Exception:
+            # An unreadable (e.g., partially written) file is replaced below
+            pass
+
+    df = reader(fname, dtype=dtype)
+
+    if path is not None:
+        # Write to a temporary file first, so other processes never read a partial file
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            write_cache(df, tmp_path)
+            os.replace(tmp_path, path)
+        except _cache_write_errors():
+            # The cache is only an optimization, so carry on without it (e.g., if the
+            # directory is read-only, pyarrow isn't installed, or a column can't be converted)
+            tmp_path.unlink(missing_ok=True)
+
+    return df
+
 
 class _BackendNamespace:
-    """Lazy namespace that loads datasets using a specific backend (pandas or polars).
+    """Lazy namespace that loads datasets using a specific backend (pandas, polars, or pyarrow).
 
-    Accessed as ``great_tables.data.pd.<dataset>`` or ``great_tables.data.pl.<dataset>``.
-    Datasets are loaded on first access and cached for subsequent use.
+    Accessed as ``great_tables.data.pd.<dataset>``, ``great_tables.data.pl.<dataset>``, or
+    ``great_tables.data.pa.<dataset>``. Datasets are loaded on first access and cached for
+    subsequent use.
     """
 
-    def __init__(self, reader: Any) -> None:
-        self._reader = reader
+    def __init__(self, backend: str) -> None:
+        self._backend = backend
         self._cache: dict[str, Any] = {}
 
     def __getattr__(self, name: str) -> Any:
@@ -1441,7 +1608,7 @@ class _BackendNamespace:
                 f"Dataset {name!r} not found. Available datasets: {', '.join(sorted(_DATASETS))}"
             )
         fname, dtype = _DATASETS[name]
-        df = self._reader(fname, dtype=dtype)
+        df = _load_dataset(self._backend, name, fname, dtype)
         self._cache[name] = df
         return df
 
@@ -1449,5 +1616,55 @@ class _BackendNamespace:
         return sorted(_DATASETS)
 
 
-pd = _BackendNamespace(_read_csv_pandas)
-pl = _BackendNamespace(_read_csv_polars)
+_READERS: dict[str, Any] = {
+    "pandas": _read_csv_pandas,
+    "polars": _read_csv_polars,
+    "pyarrow": _read_csv_pyarrow,
+}
+
+_CACHE_FUNCS: dict[str, tuple[Any, Any]] = {
+    "pandas": (_read_cache_pandas, _write_cache_pandas),
+    "polars": (_read_cache_polars, _write_cache_polars),
+    "pyarrow": (_read_cache_pyarrow, _write_cache_pyarrow),
+}
+
+pd = _BackendNamespace("pandas")
+pl = _BackendNamespace("polars")
+pa = _BackendNamespace("pyarrow")
+
+
+def _default_backend() -> str:
+    """Return the backend for the top-level datasets: pandas (for backward compat) or polars."""
+
+    import importlib.util
+
+    for backend in ("pandas", "polars"):
+        if importlib.util.find_spec(backend) is not None:
+            return backend
+
+    raise ImportError(
+        "Importing great_tables.data requires either pandas or polars to be installed."
+    )
+
+
+def __getattr__(name: str) -> Any:
+    # Datasets are read when first accessed (rather than when this module is imported), then
+    # stored as module attributes so that later accesses don't come through here
+    if name in _DATASETS:
+        backend = _default_backend()
+        fname, dtype = _DATASETS[name]
+        df = _load_dataset(backend, name, fname, dtype)
+        if name in _DATASET_DOCS:
+            df.__doc__ = _DATASET_DOCS[name]
+    elif name in _INTERNAL_DATASETS:
+        fname, dtype = _INTERNAL_DATASETS[name]
+        df = _read_csv(fname, dtype=dtype)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = df
+    return df
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_DATASETS})
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Iterable, Iterator
 
 from typing_extensions import Self
 
@@ -9,7 +9,7 @@ from ._body import body_reassemble
 from ._boxhead import cols_align, cols_label, cols_label_rotate, cols_label_with
 from ._cols_merge import perform_col_merge
 from ._data_color import data_color
-from ._export import as_latex, as_raw_html, gtsave, save, show, write_raw_html
+from ._export import as_latex, as_raw_html, gtsave, iter_raw_html, save, show, write_raw_html
 from ._footnotes import tab_footnote
 from ._formats import (
     fmt,
@@ -67,7 +67,9 @@ from ._options import (
     tab_options,
 )
 from ._pipe import pipe
+from ._profile import render_phase, render_phase_iter
 from ._render import infer_render_env_defaults
+from ._render_cache import render_html_table
 from ._render_checks import _render_check
 from ._rm import rm_footnotes, rm_header, rm_source_notes, rm_spanners, rm_stubhead
 from ._source_notes import tab_source_note
@@ -97,14 +99,14 @@ from ._tab_create_modify import (
     text_transform,
 )
 from ._tab_stub_indent import tab_stub_indent
-from ._tbl_data import _get_cell, _set_cell, n_rows
+from ._tbl_data import _get_cell, data_fingerprint, n_rows
 from ._utils import _migrate_unformatted_to_output
 from ._utils_render_html import (
     _get_table_defs,
-    create_body_component_h,
     create_columns_component_h,
     create_footer_component_h,
     create_heading_component_h,
+    iter_body_component_h,
 )
 
 if TYPE_CHECKING:
@@ -131,16 +133,14 @@ def _apply_text_transforms(data: GT, body: Body) -> Body:
         if isinstance(loc, LocBody):
             positions = resolve(loc, data)
             for pos in positions:
-                cell_value = _get_cell(body.body, pos.row, pos.colname)
+                cell_value = body.get_cell(pos.row, pos.colname)
                 # If the cell is NA (unformatted), fall back to the raw data value
-                if is_na(body.body, cell_value):
+                if body.is_na(cell_value):
                     cell_value = _get_cell(data._tbl_data, pos.row, pos.colname)
                     if is_na(data._tbl_data, cell_value):
                         continue
                 new_value = fn(str(cell_value))
-                result = _set_cell(body.body, pos.row, pos.colname, new_value)
-                if result is not None:
-                    body.body = result
+                body.set_cell(pos.row, pos.colname, new_value)
 
     return body
 
@@ -168,15 +168,13 @@ def _apply_text_transforms_stub(data: GT, stub: Stub, body: Body) -> tuple[Stub,
 
             resolved_rows: set[int] = resolve(loc, data)
             for row_idx in resolved_rows:
-                cell_value = _get_cell(body.body, row_idx, stub_col)
-                if is_na(body.body, cell_value):
+                cell_value = body.get_cell(row_idx, stub_col)
+                if body.is_na(cell_value):
                     cell_value = _get_cell(data._tbl_data, row_idx, stub_col)
                     if is_na(data._tbl_data, cell_value):
                         continue
                 new_value = fn(str(cell_value))
-                result = _set_cell(body.body, row_idx, stub_col, new_value)
-                if result is not None:
-                    body.body = result
+                body.set_cell(row_idx, stub_col, new_value)
 
         elif isinstance(loc, LocRowGroups):
             resolved_groups: set[str] = resolve(loc, data)
@@ -450,6 +448,7 @@ class GT(
     gtsave = gtsave
     show = show
     as_raw_html = as_raw_html
+    iter_raw_html = iter_raw_html
     write_raw_html = write_raw_html
     as_latex = as_latex
 
@@ -487,33 +486,67 @@ class GT(
         return self._replace(_body=new_body, _stub=new_stub)
 
     def _build_data(self, context: str) -> Self:
+        # Building only reads these parts of the table, so a previous build of a table with the
+        # same parts (e.g., one that only differs by options or styles) can be reused
+        inputs = (
+            self._tbl_data,
+            self._body,
+            self._stub,
+            self._boxhead,
+            self._formats,
+            self._substitutions,
+            self._col_merge,
+            self._transforms,
+        )
+
+        # The table data can also be modified in place, so its contents are checked too
+        data_key = data_fingerprint(self._tbl_data)
+
+        cached = self._build_cache.get(context, inputs, data_key)
+        if cached is not None:
+            final_body, final_stub, final_boxhead = cached
+            return self._replace(_body=final_body.copy(), _stub=final_stub, _boxhead=final_boxhead)
+
         # Build the body of the table by generating a dictionary
         # of lists with cells initially set to nan values
-        built = self._render_formats(context)
+        with render_phase("render_formats"):
+            built = self._render_formats(context)
 
         if context == "latex":
-            built = _migrate_unformatted_to_output(
-                data=built, data_tbl=self._tbl_data, formats=self._formats, context=context
-            )
+            with render_phase("migrate_unformatted"):
+                built = _migrate_unformatted_to_output(
+                    data=built, data_tbl=self._tbl_data, formats=self._formats, context=context
+                )
 
         # Perform column merging
-        built = perform_col_merge(built)
+        with render_phase("col_merge"):
+            built = perform_col_merge(built)
 
-        final_body = body_reassemble(built._body)
+        with render_phase("body_reassemble"):
+            final_body = body_reassemble(built._body)
 
         # Reordering of the metadata elements of the table
 
-        final_stub = reorder_stub_df(built._stub)
+        with render_phase("reorder_stub"):
+            final_stub = reorder_stub_df(built._stub)
         # self = self.reorder_footnotes()
         # self = self.reorder_styles()
 
         # Transformations of individual cells at supported locations
-        final_body = _apply_text_transforms(built, final_body)
-        final_stub, final_body = _apply_text_transforms_stub(built, final_stub, final_body)
-        final_boxhead = _apply_text_transforms_boxhead(built)
+        with render_phase("text_transforms"):
+            final_body = _apply_text_transforms(built, final_body)
+            final_stub, final_body = _apply_text_transforms_stub(built, final_stub, final_body)
+            final_boxhead = _apply_text_transforms_boxhead(built)
 
         # ...
 
+        # The cache gets its own copy of the body, since the cache is shared by several tables.
+        # Writing the buffered cells first means that they're copied along with the DataFrame.
+        final_body.flush()
+        self._build_cache.put(
+            context, inputs, data_key, (final_body.copy(), final_stub, final_boxhead)
+        )
+
         return built._replace(_body=final_body, _stub=final_stub, _boxhead=final_boxhead)
 
     def render(
@@ -523,8 +556,15 @@ class GT(
         # Note ideally, this function will forward to things like .as_raw_html(), using a
         # context dataclass to set the options on those functions. E.g. a LatexContext
         # would have the options for a .as_latex() method, etc..
-        html_table = self._build_data(context=context)._render_as_html()
-        return html_table
+
+        # The checks run before the render cache is used, so that a cached render still warns.
+        # TODO: better to put these checks in a pre render hook?
+        _render_check(self)
+
+        html_table = render_html_table(
+            self, context, lambda: self._build_data(context=context)._render_table_as_html()
+        )
+        return self._wrap_html_table(html_table)
 
     # =============================================================================
     # HTML Rendering
@@ -534,13 +574,21 @@ class GT(
         make_page: bool = False,
         all_important: bool = False,
     ) -> str:
-        # TODO: better to put these checks in a pre render hook?
         _render_check(self)
 
-        heading_component = create_heading_component_h(data=self)
-        column_labels_component = create_columns_component_h(data=self)
-        body_component = create_body_component_h(data=self)
-        footer_component = create_footer_component_h(data=self)
+        html_table = self._render_table_as_html()
+
+        return self._wrap_html_table(html_table, make_page=make_page, all_important=all_important)
+
+    def _render_table_as_html(self) -> str:
+        return "".join(self._iter_table_as_html())
+
+    def _iter_table_as_html(self, batch_size: int = 1000) -> Iterator[str]:
+        with render_phase("heading"):
+            heading_component = create_heading_component_h(data=self)
+
+        with render_phase("column_labels"):
+            column_labels_component = create_columns_component_h(data=self)
 
         # Get attributes for the table
         table_defs = _get_table_defs(data=self)
@@ -561,16 +609,47 @@ class GT(
         else:
             table_tag_open = f'<table style="{table_defs["table_style"]}" class="gt_table" data-quarto-disable-processing="{quarto_disable_processing}" data-quarto-bootstrap="{quarto_use_bootstrap}">'
 
-        html_table = f"""{table_tag_open}{table_colgroups}
+        yield f"""{table_tag_open}{table_colgroups}
 <thead>
 {heading_component}
 {column_labels_component}
 </thead>
-{body_component}
+"""
+
+        # The body is yielded in batches of rows, so that it never has to be held in memory as a
+        # whole when the table is streamed
+        body_chunks = iter_body_component_h(data=self, batch_size=batch_size)
+        yield from render_phase_iter("body", body_chunks)
+
+        with render_phase("footer"):
+            footer_component = create_footer_component_h(data=self)
+
+        yield f"""
 {footer_component}
 </table>
 """
 
+    def _wrap_html_table(
+        self,
+        html_table: str,
+        make_page: bool = False,
+        all_important: bool = False,
+    ) -> str:
+        chunks = self._iter_wrapped_html(
+            [html_table], make_page=make_page, all_important=all_important
+        )
+
+        return "".join(chunks)
+
+    def _iter_wrapped_html(
+        self,
+        table_chunks: Iterable[str],
+        make_page: bool = False,
+        all_important: bool = False,
+    ) -> Iterator[str]:
+        # The container (and its CSS) is generated separately from the `<table>` element, since
+        # it gets a new random ID on each render when `table_id` isn't set
+
         # Obtain the `table_id` value from the Options (might be set, might be None)
         table_id = self._options.table_id.value
 
@@ -582,7 +661,8 @@ class GT(
         # Compile the SCSS as CSS
         from ._scss import compile_scss
 
-        css = compile_scss(data=self, id=id, all_important=all_important)
+        with render_phase("compile_scss"):
+            css = compile_scss(data=self, id=id, all_important=all_important)
 
         # Obtain options set for overflow and container dimensions
 
@@ -593,27 +673,31 @@ class GT(
         container_width = self._options.container_width.value
         container_height = self._options.container_height.value
 
-        finalized_table = f"""<div id="{id}" style="padding-left:{container_padding_x};padding-right:{container_padding_x};padding-top:{container_padding_y};padding-bottom:{container_padding_y};overflow-x:{container_overflow_x};overflow-y:{container_overflow_y};width:{container_width};height:{container_height};">
-<style>
-{css}
-</style>
-{html_table}
-</div>
-"""
-
         if make_page:
             # Create an HTML page and place the table within it
-            finalized_table = f"""<!DOCTYPE html>
+            yield """<!DOCTYPE html>
 <html lang="en">
 <head>
 <meta charset="utf-8"/>
 </head>
 <body>
-{finalized_table}
+"""
+
+        yield f"""<div id="{id}" style="padding-left:{container_padding_x};padding-right:{container_padding_x};padding-top:{container_padding_y};padding-bottom:{container_padding_y};overflow-x:{container_overflow_x};overflow-y:{container_overflow_y};width:{container_width};height:{container_height};">
+<style>
+{css}
+</style>
+"""
+
+        yield from table_chunks
+
+        yield "\n</div>\n"
+
+        if make_page:
+            yield """
 </body>
 </html>
 """
-        return finalized_table
 
 
 # =============================================================================
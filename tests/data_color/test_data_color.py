@@ -83,6 +83,43 @@ def test_data_color_pl_cols_rows_snap(snapshot: str):
     )
 
 
+@pytest.mark.parametrize("autocolor_text", [True, False])
+def test_data_color_styles_match_per_cell_tab_style(df: DataFrameLike, autocolor_text: bool):
+    from great_tables import loc
+    from great_tables._data_color.base import _ideal_fgnd_color
+
+    new_gt = GT(df).data_color(
+        columns=["num", "currency"], palette=["#000000", "#FFFFFF"], autocolor_text=autocolor_text
+    )
+
+    # a black to white palette makes each fill's gray level 255 * (x - min) / (max - min), e.g.
+    # (33.33 - 0.1111) / (444.4 - 0.1111) * 255 = 19 (#13) for the third "num" value
+    fills = {
+        "num": ["#000000", "#010101", "#131313", "#ffffff"],
+        "currency": ["#000000", "#000000", "#000000", "#ffffff"],
+    }
+
+    # data_color() adds the same entries as styling each cell separately, in the same order
+    expected = GT(df)
+    for col, col_fills in fills.items():
+        for row, fill in enumerate(col_fills):
+            cell_styles = [style.fill(color=fill)]
+            if autocolor_text:
+                cell_styles.insert(0, style.text(color=_ideal_fgnd_color(fill)))
+
+            expected = expected.tab_style(
+                style=cell_styles, locations=loc.body(columns=col, rows=[row])
+            )
+
+    assert [(x.colname, x.rownum) for x in new_gt._styles] == [
+        (x.colname, x.rownum) for x in expected._styles
+    ]
+    assert [x.styles for x in new_gt._styles] == [x.styles for x in expected._styles]
+    assert create_body_component_h(new_gt._build_data("html")) == create_body_component_h(
+        expected._build_data("html")
+    )
+
+
 @pytest.mark.parametrize("none_val", [None, np.nan, float("nan"), pd.NA])
 @pytest.mark.parametrize("df_cls", [pd.DataFrame, pl.DataFrame])
 def test_data_color_missing_value(df_cls, none_val):
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import math
+from decimal import Decimal
 from contextlib import nullcontext
 from typing import Any
 
 import numpy as np
+import pandas as pd
 import pytest
 from great_tables._data_color.base import (
     _add_alpha,
@@ -18,6 +20,7 @@ from great_tables._data_color.base import (
     _hex_to_rgb,
     _html_color,
     _ideal_fgnd_color,
+    _ideal_fgnd_colors,
     _is_hex_col,
     _is_short_hex,
     _is_standard_hex_col,
@@ -76,6 +79,21 @@ def test_ideal_fgnd_color_custom_contrast(
     assert _ideal_fgnd_color(bgnd_color, light=light_color, dark=dark_color) == fgnd_color
 
 
+@pytest.mark.parametrize(
+    ("light_color", "dark_color"), [("#FFFFFF", "#000000"), ("#00FF00", "#0000FF")]
+)
+def test_ideal_fgnd_colors_matches_single(light_color: str, dark_color: str) -> None:
+    bgnd_colors = [f"#{x:02X}{(x * 7) % 256:02X}{255 - x:02X}" for x in range(256)]
+    bgnd_colors += [color + "80" for color in bgnd_colors] + ["#FF0000FF", "#FFFFFF00"]
+
+    res = _ideal_fgnd_colors(bgnd_colors, light=light_color, dark=dark_color)
+    assert res == [_ideal_fgnd_color(x, light=light_color, dark=dark_color) for x in bgnd_colors]
+
+
+def test_ideal_fgnd_colors_empty() -> None:
+    assert _ideal_fgnd_colors([]) == []
+
+
 @pytest.mark.parametrize(
     ("color_1", "color_2", "contrast_ratio"),
     [
@@ -349,6 +367,21 @@ def test_rescale_numeric(
     assert_equal_with_na(df, result, expected)
 
 
+@pytest.mark.parametrize(
+    ("vals", "domain"),
+    [
+        ([2**60 + 1, 2**60 + 3], [2**60, 2**60 + 4]),  # too large for exact float arithmetic
+        ([np.float32(0.1), np.float32(0.7)], [0, 1]),
+        ([Decimal("0.25"), Decimal("0.5")], [Decimal("0"), Decimal("1")]),
+    ],
+)
+def test_rescale_numeric_inexact_values_fall_back(vals: list[Any], domain: list[Any]) -> None:
+    df = pd.DataFrame({"col": [1]})
+
+    result = _rescale_numeric(df=df, vals=vals, domain=domain)
+    assert result == [(x - domain[0]) / (domain[1] - domain[0]) for x in vals]
+
+
 @pytest.mark.parametrize(
     "vals",
     [
@@ -445,6 +478,18 @@ def test_gradient_n_pal_manual_values() -> None:
     assert res == ["#ff0000", "#0000ff", "#008080", "#00ff00"]
 
 
+@pytest.mark.parametrize("values", [None, [0, 0.3, 0.35, 1]])
+def test_gradient_n_pal_array_matches_scalar(values: list[float] | None) -> None:
+    palette = GradientPalette(["red", "#00FF0080", "steelblue", "white"], values=values)
+    data = [x / 1000 for x in range(1001)] + [None, math.nan, np.float64(0.123), 1, 0]
+
+    res = palette(data)
+
+    # interpolate each value on its own
+    palette._vals_to_rgb_array = lambda data: None
+    assert res == palette(data)
+
+
 @pytest.mark.parametrize(
     ("colors", "values", "context"),
     [
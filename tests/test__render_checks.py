@@ -32,6 +32,23 @@ def test_check_quarto_runs():
         gt.render("html")
 
 
+def test_check_quarto_runs_on_cached_render():
+    from great_tables import disable_render_cache, enable_render_cache
+
+    gt = GT(exibble).cols_width({"num": "100px"})
+
+    enable_render_cache()
+    try:
+        with set_quarto_env():
+            for _ in range(2):
+                with pytest.warns(RenderWarning):
+                    gt.render("html")
+                with pytest.warns(RenderWarning):
+                    gt.as_raw_html()
+    finally:
+        disable_render_cache()
+
+
 def test_check_quarto_disable_processing():
     gt = GT(exibble).cols_width({"num": "100px"}).tab_options(quarto_disable_processing=True)
 
@@ -28,6 +28,7 @@ from great_tables._utils_nanoplots import (
     _normalize_to_dict,
     _normalize_vals,
     _remove_exponent,
+    _SingleYScale,
     _val_is_numeric,
     _val_is_str,
     calc_ref_value,
@@ -2202,3 +2203,41 @@ def test_nanoplot_remove_drops_nan():
     circles_no_nan = len(re.findall(r"<circle ", result_no_nan))
     circles = len(re.findall(r"<circle ", result))
     assert circles == circles_no_nan
+
+
+@pytest.mark.parametrize(
+    "all_vals",
+    [Y_VALS, [3, 1, 2], [-3.5, -1.0, -2.25], [4.0, float("nan"), -2.0]],
+)
+def test_single_y_scale_matches_normalize_to_dict(all_vals: list[Union[int, float]]):
+    scale = _SingleYScale.from_vals(all_vals)
+
+    for val in [v for v in all_vals if v == v] + [3432]:
+        dst = _normalize_to_dict(val=[val], all_vals=all_vals, zero=0)
+        assert scale.proportions(val) == (dst["val"][0], dst["zero"][0])
+
+
+def test_single_y_scale_flags():
+    assert _SingleYScale.from_vals([0, 0.0]).all_zero
+    assert _SingleYScale.from_vals([0, 0.0]).proportions(0) == (0.5, 0.5)
+    assert not _SingleYScale.from_vals([0, float("nan")]).all_zero
+
+    assert _SingleYScale.from_vals([-1, -2.5]).all_negative
+    assert not _SingleYScale.from_vals([-1, 0]).all_negative
+    assert not _SingleYScale.from_vals([-1, None]).all_negative
+
+
+@pytest.mark.parametrize("plot_type", ["line", "bar"])
+def test_fmt_nanoplot_single_vals_share_scale(plot_type: str):
+    vals = [4.1, 1.3, -5.3, 0, 8.2]
+    gt = GT(pl.DataFrame({"x": vals})).fmt_nanoplot("x", plot_type=plot_type)
+
+    res = gt._build_data("html")._body.body["x"].to_list()
+    dst = [
+        _generate_nanoplot(
+            y_vals=val, all_single_y_vals=vals, plot_type=plot_type, **nanoplot_options()
+        )
+        for val in vals
+    ]
+
+    assert res == dst
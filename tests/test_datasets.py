@@ -1,5 +1,9 @@
+import subprocess
+import sys
+
 import pandas as pd
 import polars as pl
+import pyarrow as pa
 import pytest
 
 from great_tables import data
@@ -52,6 +56,15 @@ def test_datasets_pd_pl_same_shape(name: str):
     assert pd_df.shape == pl_df.shape
 
 
+@pytest.mark.parametrize("name", _DATASET_NAMES)
+def test_datasets_pa_namespace(name: str):
+    tbl = getattr(data.pa, name)
+    pl_df = getattr(data.pl, name)
+    assert isinstance(tbl, pa.Table)
+    assert tbl.column_names == pl_df.columns
+    assert tbl.to_pylist() == pl_df.to_dicts()
+
+
 def test_pd_namespace_caches_results():
     df1 = data.pd.exibble
     df2 = data.pd.exibble
@@ -77,6 +90,76 @@ def test_pl_namespace_invalid_dataset():
 def test_namespace_dir():
     pd_datasets = dir(data.pd)
     pl_datasets = dir(data.pl)
-    assert pd_datasets == pl_datasets
+    assert pd_datasets == pl_datasets == dir(data.pa)
     for name in _DATASET_NAMES:
         assert name in pd_datasets
+
+
+def test_datasets_loaded_lazily():
+    code = (
+        "import great_tables.data as data; "
+        "assert 'pizzaplace' not in vars(data); "
+        "data.exibble; "
+        "assert 'exibble' in vars(data) and 'pizzaplace' not in vars(data)"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_module_dataset_has_doc():
+    assert data.exibble.__doc__.strip().startswith("A toy example table")
+    assert "exibble" in dir(data)
+
+
+def test_module_invalid_dataset():
+    with pytest.raises(AttributeError, match="has no attribute"):
+        data.nonexistent_dataset
+
+
+@pytest.mark.parametrize(
+    "backend, assert_equal",
+    [
+        ("pandas", lambda x, y: pd.testing.assert_frame_equal(x, y, check_exact=True)),
+        ("polars", lambda x, y: x.equals(y, null_equal=True) or pytest.fail("not equal")),
+        ("pyarrow", lambda x, y: x.equals(y) or pytest.fail("not equal")),
+    ],
+)
+def test_dataset_disk_cache(tmp_path, monkeypatch, backend, assert_equal):
+    monkeypatch.setenv(data.DATA_CACHE_DIR_ENV, str(tmp_path))
+    fname, dtype = data._DATASETS["exibble"]
+
+    fresh = data._load_dataset(backend, "exibble", fname, dtype)
+    assert len(list(tmp_path.iterdir())) == 1
+
+    # the second load must come from the cache, not the CSV reader
+    monkeypatch.setitem(data._READERS, backend, lambda *args, **kwargs: pytest.fail("CSV read"))
+
+    cached = data._load_dataset(backend, "exibble", fname, dtype)
+    assert cached is not fresh
+    assert_equal(cached, fresh)
+
+
+def test_dataset_disk_cache_unreadable_file_replaced(tmp_path, monkeypatch):
+    monkeypatch.setenv(data.DATA_CACHE_DIR_ENV, str(tmp_path))
+    fname, dtype = data._DATASETS["exibble"]
+
+    path = data._cache_path("polars", "exibble", fname, dtype)
+    path.write_bytes(b"not an arrow file")
+
+    df = data._load_dataset("polars", "exibble", fname, dtype)
+    assert df.equals(data.pl.exibble, null_equal=True)
+    assert data._read_cache_polars(path).equals(df, null_equal=True)
+
+
+def test_dataset_disk_cache_write_error_falls_back(tmp_path, monkeypatch):
+    monkeypatch.setenv(data.DATA_CACHE_DIR_ENV, str(tmp_path))
+    fname, dtype = data._DATASETS["exibble"]
+
+    def write_cache(df, path):
+        path.write_bytes(b"partial")
+        raise pa.ArrowInvalid("can't convert")
+
+    monkeypatch.setitem(data._CACHE_FUNCS, "pandas", (data._read_cache_pandas, write_cache))
+
+    df = data._load_dataset("pandas", "exibble", fname, dtype)
+    pd.testing.assert_frame_equal(df, data.pd.exibble)
+    assert list(tmp_path.iterdir()) == []
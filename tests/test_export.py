@@ -1,3 +1,4 @@
+import io
 import tempfile
 import time
 from pathlib import Path
@@ -7,7 +8,7 @@ import requests
 from ipykernel.zmqshell import ZMQInteractiveShell
 from IPython.terminal.interactiveshell import InteractiveShell, TerminalInteractiveShell
 
-from great_tables import GT, exibble, md
+from great_tables import GT, exibble, loc, md
 from great_tables._export import _create_temp_file_server, _infer_render_target, as_raw_html
 from great_tables.data import gtcars
 
@@ -110,6 +111,70 @@ def test_write_raw_html(gt_tbl):
         assert Path(s_file).exists()
 
 
+def test_write_raw_html_file_object(gt_tbl):
+    f = io.StringIO()
+    gt_tbl.write_raw_html(f, make_page=True)
+
+    assert f.getvalue() == gt_tbl.as_raw_html(make_page=True)
+
+
+def test_write_raw_html_error_keeps_file(tmp_path: Path):
+    p_file = tmp_path / "table.html"
+    p_file.write_text("old table")
+
+    gt_tbl = GT(exibble).fmt(lambda x: 1 / 0, columns="num")
+
+    with pytest.raises(ZeroDivisionError):
+        gt_tbl.write_raw_html(p_file)
+
+    assert p_file.read_text() == "old table"
+    assert list(tmp_path.iterdir()) == [p_file]
+
+
+def test_write_raw_html_raises_not_writable(gt_tbl):
+    with pytest.raises(TypeError, match="writable file object"):
+        gt_tbl.write_raw_html(123)
+
+
+def test_write_raw_html_matches_as_raw_html(gt_tbl):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        p_file = Path(tmp_dir, "table.html")
+        gt_tbl.write_raw_html(p_file, newline="\n")
+
+        assert p_file.read_text(encoding="utf-8") == gt_tbl.as_raw_html()
+
+
+@pytest.mark.parametrize("make_page", [True, False])
+@pytest.mark.parametrize("batch_size", [1, 2, 1000])
+def test_iter_raw_html_matches_as_raw_html(gt_tbl, make_page, batch_size):
+    gt_tbl = gt_tbl.tab_footnote("A footnote", locations=loc.body(columns="num", rows=0))
+
+    chunks = list(gt_tbl.iter_raw_html(make_page=make_page, batch_size=batch_size))
+
+    assert "".join(chunks) == gt_tbl.as_raw_html(make_page=make_page)
+
+
+def test_iter_raw_html_batches_body_rows():
+    gt_tbl = GT(exibble[["num", "char"]], id="test_table")
+
+    chunks = list(gt_tbl.iter_raw_html(batch_size=3))
+    body_chunks = [chunk for chunk in chunks if chunk.lstrip().startswith("<tr>")]
+
+    # 8 rows in batches of up to 3 rows
+    assert [chunk.count("<tr>") for chunk in body_chunks] == [3, 3, 2]
+
+
+def test_iter_raw_html_empty_body():
+    gt_tbl = GT(exibble.head(0), id="test_table")
+
+    assert "".join(gt_tbl.iter_raw_html()) == gt_tbl.as_raw_html()
+
+
+def test_iter_raw_html_raises_batch_size(gt_tbl):
+    with pytest.raises(ValueError, match="at least 1"):
+        gt_tbl.iter_raw_html(batch_size=0)
+
+
 def test_snap_as_latex(snapshot):
     gt_tbl = (
         GT(
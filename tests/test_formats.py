@@ -1,3 +1,4 @@
+import math
 import re
 from typing import Any, Union
 
@@ -11,15 +12,25 @@ from great_tables._formats import (
     FmtImage,
     _check_colors,
     _expand_exponential_to_full_string,
+    _format_datetime_babel,
+    _format_distinct,
     _format_number_n_sigfig,
     _format_number_fixed_decimals,
     _get_currency_str,
+    _get_babel_locale,
+    _get_flag_icon,
     _get_locale_currency_code,
     _get_locale_dec_mark,
     _get_locale_sep_mark,
     _normalize_locale,
     _validate_locale,
     fmt,
+    fmt_integer_batch,
+    fmt_integer_context,
+    fmt_number_batch,
+    fmt_number_context,
+    fmt_percent_batch,
+    fmt_percent_context,
 )
 from great_tables._utils_render_html import create_body_component_h
 from great_tables.data import exibble
@@ -1012,6 +1023,111 @@ def test_fmt_number_pattern(pattern: str, x_out: str):
     assert x == x_out
 
 
+def _default_number_opts() -> dict[str, Any]:
+    return dict(
+        decimals=2,
+        n_sigfig=None,
+        drop_trailing_zeros=False,
+        drop_trailing_dec_mark=True,
+        use_seps=True,
+        accounting=False,
+        scale_by=1,
+        compact=False,
+        sep_mark=",",
+        dec_mark=".",
+        force_sign=False,
+        pattern="{x}",
+    )
+
+
+BATCH_VALUES = [0, -0.0, 1, -1, 0.005, 2.675, -1234567.891, 1e20, None, float("nan"), float("inf")]
+
+
+@pytest.mark.parametrize("context", ["html", "latex"])
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        dict(),
+        dict(decimals=0, use_seps=False),
+        dict(decimals=3, drop_trailing_zeros=True, drop_trailing_dec_mark=False),
+        dict(accounting=True, force_sign=True, pattern="a{x}_"),
+        dict(scale_by=100, sep_mark=".", dec_mark=","),
+    ],
+)
+def test_fmt_number_batch_matches_scalar(kwargs: dict[str, Any], context: str):
+    opts = {**_default_number_opts(), **kwargs}
+
+    data = GT(pd.DataFrame({"x": [1.0]}))
+
+    res = fmt_number_batch(BATCH_VALUES, data=data, context=context, **opts)
+    dst = [fmt_number_context(x, data=data, context=context, **opts) for x in BATCH_VALUES]
+
+    assert res[:-3] == dst[:-3]
+    assert res[-3] is None and math.isnan(res[-2]) and res[-1] == dst[-1]
+
+
+@pytest.mark.parametrize("context", ["html", "latex"])
+@pytest.mark.parametrize("placement", ["left", "right"])
+@pytest.mark.parametrize("force_sign", [True, False])
+def test_fmt_percent_integer_batch_matches_scalar(context: str, placement: str, force_sign: bool):
+    values = [x for x in BATCH_VALUES if x is not None and not math.isnan(x)]
+    data = GT(pd.DataFrame({"x": [1.0]}))
+
+    pct_opts = dict(
+        decimals=1,
+        drop_trailing_zeros=False,
+        drop_trailing_dec_mark=True,
+        use_seps=True,
+        accounting=False,
+        scale_by=100.0,
+        sep_mark=",",
+        dec_mark=".",
+        force_sign=force_sign,
+        placement=placement,
+        incl_space=True,
+        pattern="{x}",
+    )
+    res = fmt_percent_batch(values, data=data, context=context, **pct_opts)
+    assert res == [fmt_percent_context(x, data=data, context=context, **pct_opts) for x in values]
+
+    int_opts = dict(
+        use_seps=True,
+        scale_by=1,
+        accounting=placement == "left",
+        compact=False,
+        sep_mark=" ",
+        force_sign=force_sign,
+        pattern="{x}",
+    )
+    res = fmt_integer_batch(values, data=data, context=context, **int_opts)
+    assert res == [fmt_integer_context(x, data=data, context=context, **int_opts) for x in values]
+
+
+def test_fmt_number_batch_array_inputs():
+    import numpy as np
+    import pyarrow as pa
+
+    data = GT(pd.DataFrame({"x": [1.0]}))
+    opts = {**_default_number_opts(), "decimals": 1, "context": "html"}
+
+    assert fmt_number_batch(np.array([1500, -2]), data=data, **opts) == ["1,500.0", "−2.0"]
+    assert fmt_number_batch(pa.array([1500.25, 3.0]), data=data, **opts) == ["1,500.2", "3.0"]
+
+
+def test_fmt_number_batch_falls_back_for_unsupported_values():
+    from decimal import Decimal
+
+    df = pd.DataFrame({"x": [Decimal("1.005"), Decimal("-2.5")]})
+    data = GT(df)
+
+    assert (
+        fmt_number_batch(list(df["x"]), data=data, context="html", **_default_number_opts()) is None
+    )
+
+    gt = GT(df).fmt_number(columns="x", decimals=2)
+    assert _get_column_of_values(gt, column_name="x", context="html") == ["1.00", "−2.50"]
+
+
 # Test `_format_number_fixed_decimals()` util function
 @pytest.mark.parametrize(
     "value,x_out",
@@ -1504,6 +1620,55 @@ def test_fmt_datetime_bad_date_style_raises():
     assert "date_style must be one of:" in exc_info.value.args[0]
 
 
+def test_fmt_datetime_repeated_values_timezones():
+    import datetime as dt
+    from zoneinfo import ZoneInfo
+
+    # The same instant, in two timezones
+    utc = dt.datetime(2020, 1, 1, 12, tzinfo=dt.timezone.utc)
+    ny = utc.astimezone(ZoneInfo("America/New_York"))
+    df = pd.DataFrame({"x": [utc, ny, utc, ny]})
+
+    gt = GT(df).fmt_datetime(columns="x", date_style="iso", time_style="iso-short")
+
+    x = _get_column_of_values(gt, column_name="x", context="html")
+    assert x == ["2020-01-01 12:00", "2020-01-01 07:00"] * 2
+
+
+def test_format_datetime_babel_matches_babel():
+    import datetime as dt
+
+    from babel.dates import format_date
+
+    value = dt.date(2020, 3, 1)
+
+    res = _format_datetime_babel(value, "date", "EEEE d MMMM y", "fr-CA")
+    assert res == format_date(value, format="EEEE d MMMM y", locale="fr_CA")
+
+
+def test_get_babel_locale_cached():
+    assert _get_babel_locale("fr-CA") is _get_babel_locale("fr-CA")
+    assert str(_get_babel_locale("fr-CA")) == "fr_CA"
+    assert str(_get_babel_locale(None)) == "en_US"
+
+
+def test_format_distinct_formats_each_value_once():
+    calls = []
+
+    def pf_format(x, context):
+        calls.append(x)
+        return f"{x}-{context}"
+
+    res = _format_distinct(["a", "b", "a", None, "a"], pf_format=pf_format, context="html")
+
+    assert res == ["a-html", "b-html", "a-html", "None-html", "a-html"]
+    assert calls == ["a", "b", None]
+
+
+def test_format_distinct_unhashable_returns_none():
+    assert _format_distinct([[1], [2]], pf_format=lambda x, context: x, context="html") is None
+
+
 # ------------------------------------------------------------------------------
 # Test `fmt_tf()`
 # ------------------------------------------------------------------------------
@@ -1816,6 +1981,64 @@ def test_fmt_image_encode(tmpdir):
     assert strip_windows_drive(res) == dst
 
 
+def test_fmt_image_encode_cache_checks_file(tmpdir):
+    import os
+    from pathlib import Path
+
+    p_svg = Path(tmpdir) / "some.svg"
+    p_svg.write_text("abc")
+    filename = str(p_svg)
+
+    uri = FmtImage._get_image_uri(filename)
+    assert FmtImage._get_image_uri(filename) is uri
+
+    # a file changed on disk is read again
+    p_svg.write_text("abcd")
+    os.utime(filename, ns=(0, 0))
+
+    assert FmtImage._get_image_uri(filename) == FmtImage._encode_image(filename)
+    assert FmtImage._get_image_uri(filename) != uri
+
+
+def test_fmt_image_batch_matches_to_html(tmpdir):
+    from pathlib import Path
+
+    for name in ["a", "b", "c"]:
+        (Path(tmpdir) / f"{name}.svg").write_text(name * 3)
+
+    formatter = FmtImage(pd.DataFrame(), path=tmpdir, file_pattern="{}.svg")
+    vals = ["a", "b,c", None, "c"]
+
+    assert formatter.to_html_batch(vals) == [formatter.to_html(val) for val in vals]
+
+
+def test_fmt_image_batch_missing_file_raises(tmpdir):
+    formatter = FmtImage(path=tmpdir, file_pattern="{}.svg")
+
+    with pytest.raises(FileNotFoundError):
+        formatter.to_html_batch(["x", "y"])
+
+
+def test_fmt_image_shared_css(tmpdir):
+    from pathlib import Path
+
+    for name in ["a", "b"]:
+        (Path(tmpdir) / f"{name}.svg").write_text(name * 3)
+
+    df = pd.DataFrame({"x": ["a", "b,a", "a"]})
+    gt = GT(df).fmt_image("x", path=tmpdir, file_pattern="{}.svg", shared_css=True)
+
+    uri_a = FmtImage._get_image_uri(str(Path(tmpdir) / "a.svg"))
+    class_a = FmtImage._get_css_class(str(Path(tmpdir) / "a.svg"))
+    html = gt.as_raw_html()
+
+    # each image is encoded once, in the CSS
+    assert html.count(uri_a) == 1
+    assert f'.{class_a} {{ content: url("{uri_a}"); }}' in html
+    assert html.count(f'<img class="{class_a}"') == 3
+    assert "src=" not in html
+
+
 def test_fmt_image_width_height_str():
     formatter = FmtImage(encode=False, width="20px", height="30px")
     res = formatter.to_html("/a")
@@ -2074,6 +2297,30 @@ def test_fmt_flag_height():
     assert column_vals_px == column_vals_num
 
 
+def test_fmt_flag_codes_share_index_entry():
+    index = _locale._get_flags_index()
+
+    assert index["FR"] is index["FRA"]
+    assert index["FR"]["country_name"] == "France"
+
+
+def test_fmt_flag_unknown_code_raises():
+    df = pd.DataFrame({"x": ["ZZ"]})
+
+    with pytest.raises(Exception, match="Internal Error"):
+        _get_column_of_values(GT(df).fmt_flag(columns="x"), column_name="x", context="html")
+
+
+def test_fmt_flag_icon_cached():
+    _get_flag_icon.cache_clear()
+
+    df = pd.DataFrame({"x": ["FR", "fr", "FRA,DE"]})
+    _get_column_of_values(GT(df).fmt_flag(columns="x"), column_name="x", context="html")
+
+    cache_info = _get_flag_icon.cache_info()
+    assert (cache_info.hits, cache_info.misses) == (1, 3)
+
+
 @pytest.mark.parametrize(
     "url", ["http://posit.co/", "http://posit.co", "https://posit.co/", "https://posit.co"]
 )
@@ -2753,6 +3000,30 @@ def test_normalize_locale_babel_validation():
     assert _normalize_locale("de-CH") == "de-CH"
 
 
+def test_locale_registry_is_loaded_once():
+    assert _locale._get_locale_registry() is _locale._get_locale_registry()
+    assert _locale._get_locales_data() is _locale._get_locales_data()
+
+
+def test_locale_registry_indexes_tables():
+    registry = _locale._get_locale_registry()
+
+    assert list(registry.locales) == [entry["locale"] for entry in _locale._get_locales_data()]
+    assert registry.get_locale("fr-CA")["decimal"] == ","
+    assert registry.default_locales["en-US"] == "en"
+    assert registry.get_currency("EUR")["curr_name"] == "Euro"
+
+
+def test_locale_registry_no_match_raises():
+    registry = _locale._get_locale_registry()
+
+    with pytest.raises(Exception, match="Internal Error"):
+        registry.get_locale("NOT_A_LOCALE")
+
+    with pytest.raises(Exception, match="Internal Error"):
+        registry.get_currency("NOT_A_CURRENCY")
+
+
 def test_get_locale_sep_mark_lookup():
     # , is the group associated with "ak" locale
     assert _get_locale_sep_mark("zzz", use_seps=True, locale="ak") == ","
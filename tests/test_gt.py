@@ -1,6 +1,7 @@
 import pandas as pd
 import pytest
 from great_tables import GT
+from great_tables._utils import PersistentList
 
 
 # Generate a gt Table object for assertion testing
@@ -36,8 +37,8 @@ def test_gt_object_prerender(gt_tbl: GT):
     assert type(gt_tbl._spanners).__name__ == "Spanners"
     assert type(gt_tbl._heading).__name__ == "Heading"
     assert isinstance(gt_tbl._source_notes, list)
-    assert isinstance(gt_tbl._footnotes, list)
-    assert isinstance(gt_tbl._styles, list)
+    assert isinstance(gt_tbl._footnotes, PersistentList)
+    assert isinstance(gt_tbl._styles, PersistentList)
     assert type(gt_tbl._locale).__name__ == "Locale"
 
 
@@ -64,3 +65,84 @@ def test_gt_table_render(gt_tbl: GT):
         ).__name__
         == "str"
     )
+
+
+def _n_builds(*tables: GT, context: str = "html") -> int:
+    from great_tables import profile_render
+
+    with profile_render() as profile:
+        for gt in tables:
+            gt._build_data(context)
+
+    stats = profile.phases.get("render_formats")
+    return stats.runs if stats is not None else 0
+
+
+def test_gt_build_reused_after_options_and_styles(gt_tbl: GT):
+    from great_tables import loc, style
+
+    gt = gt_tbl.fmt_number("a")
+    built = gt._build_data("html")
+
+    new_gt = gt.tab_options(table_font_size="10px").tab_style(style.text(weight="bold"), loc.body())
+    new_built = new_gt._build_data("html")
+
+    assert _n_builds(new_gt) == 0
+    assert new_built._options is new_gt._options
+    assert new_built._styles is new_gt._styles
+
+    # tables don't share the cached body, since it can be modified
+    assert new_built._body is not built._body
+    assert new_built._body.body.equals(built._body.body)
+
+
+def test_gt_build_not_reused_after_format_change(gt_tbl: GT):
+    gt = gt_tbl.fmt_number("a")
+    gt._build_data("html")
+
+    assert _n_builds(gt.fmt_integer("a")) == 1
+    assert _n_builds(gt, context="latex") == 1
+    assert "5.00" in gt.as_raw_html()
+    assert "5.00" not in gt.fmt_integer("a").as_raw_html()
+
+
+@pytest.mark.parametrize("frame", ["pandas", "polars"])
+def test_gt_build_not_reused_after_data_modified_in_place(frame: str):
+    if frame == "pandas":
+        df = pd.DataFrame({"a": [1.0, 2.0], "b": ["x", "y"]})
+    else:
+        pl = pytest.importorskip("polars")
+        df = pl.DataFrame({"a": [1.0, 2.0], "b": ["x", "y"]})
+
+    gt = GT(df).fmt_number("a")
+    assert "1.00" in gt.as_raw_html()
+
+    if frame == "pandas":
+        df.loc[0, "a"] = 99.0
+        df.loc[0, "b"] = "z"
+    else:
+        df[0, "a"] = 99.0
+        df[0, "b"] = "z"
+
+    assert "99.00" in gt.as_raw_html()
+    assert "99.00" in gt.tab_options(table_font_size="10px").as_raw_html()
+    assert ">z<" in gt.as_raw_html()
+
+
+def test_gt_build_not_cached_for_unhashable_data():
+    df = pd.DataFrame({"a": [1.0, 2.0], "b": [[1], [2]]})
+
+    gt = GT(df).fmt_number("a")
+
+    assert _n_builds(gt, gt) == 2
+    assert gt._build_cache._entries == {}
+
+
+def test_gt_build_cache_not_pickled(gt_tbl: GT):
+    import pickle
+
+    gt = gt_tbl.fmt_number("a")
+    gt._build_data("html")
+
+    assert pickle.loads(pickle.dumps(gt))._build_cache._entries == {}
+    assert gt._build_cache._entries
@@ -1,6 +1,14 @@
+import pickle
+
 import pandas as pd
+import polars as pl
+import pyarrow as pa
+import pytest
 from great_tables import GT
-from great_tables._gt_data import Boxhead, ColInfo, RowInfo, Stub
+from great_tables import loc
+from great_tables._gt_data import Body, Boxhead, ColInfo, FootnoteInfo, RowInfo, StyleInfo, Stub
+from great_tables._locations import CellPos
+from great_tables._tbl_data import to_list
 
 
 def test_stub_construct_df():
@@ -48,3 +56,61 @@ def test_google_font_imports_is_set():
     from great_tables._helpers import GoogleFontImports
 
     assert isinstance(gt_table._google_font_imports, GoogleFontImports)
+
+
+@pytest.mark.parametrize(
+    "record",
+    [
+        ColInfo("x"),
+        StyleInfo(locname=loc.body(), colname="x", rownum=0),
+        FootnoteInfo(locname=loc.body(), colname="x", rownum=0, footnotes=["note"]),
+        CellPos(column=0, row=0, colname="x"),
+    ],
+)
+def test_records_are_slotted(record):
+    assert not hasattr(record, "__dict__")
+    assert pickle.loads(pickle.dumps(record)) == record
+
+
+def test_col_info_default_label():
+    assert ColInfo("x").column_label == "x"
+    assert ColInfo("x", column_label="X").column_label == "X"
+
+
+@pytest.mark.parametrize("Frame", [pd.DataFrame, pl.DataFrame, pa.table])
+def test_body_set_cell_buffers_writes(Frame):
+    body = Body.from_empty(Frame({"x": [1, 2, 3], "y": [4, 5, 6]}))
+    frame = body._frame
+
+    body.set_cell(1, "x", "two")
+    body.set_column_cells("y", [0, 2], ["four", "six"])
+
+    # writes are buffered until the frame is needed
+    assert body._frame is frame
+    assert body.get_cell(1, "x") == "two"
+    assert body.is_na(body.get_cell(0, "x"))
+
+    assert to_list(body.body["x"])[1] == "two"
+    assert to_list(body.body["y"])[::2] == ["four", "six"]
+
+
+@pytest.mark.parametrize("Frame", [pd.DataFrame, pl.DataFrame, pa.table])
+def test_body_copy_keeps_buffered_writes(Frame):
+    body = Body.from_empty(Frame({"x": [1, 2]}))
+    body.set_cell(0, "x", "one")
+
+    new_body = body.copy()
+    new_body.set_cell(1, "x", "two")
+
+    assert to_list(new_body.body["x"]) == ["one", "two"]
+    assert body.is_na(to_list(body.body["x"])[1])
+
+
+def test_body_setter_drops_buffered_writes():
+    body = Body.from_empty(pd.DataFrame({"x": [1, 2]}))
+    body.set_cell(0, "x", "one")
+
+    body.body = pd.DataFrame({"x": ["a", "b"]}, dtype="string")
+
+    assert body.get_cell(0, "x") == "a"
+    assert body.body["x"].tolist() == ["a", "b"]
@@ -287,6 +287,24 @@ def test_set_style_loc_body_from_column(expr):
     assert cell_info.styles[0].color == "blue"
 
 
+def test_set_style_loc_body_shares_static_styles():
+    df = pd.DataFrame({"x": [1, 2], "color": ["red", "blue"]})
+    gt_df = GT(df)
+
+    static_gt = set_style(LocBody(["x"], [0, 1]), gt_df, [CellStyleText(color="red")])
+    from_column_gt = set_style(
+        LocBody(["x"], [0, 1]), gt_df, [CellStyleText(color=FromColumn("color"))]
+    )
+
+    # Styles that don't depend on the row are shared across cells
+    static_0, static_1 = static_gt._styles
+    assert static_0.styles is static_1.styles
+
+    from_column_0, from_column_1 = from_column_gt._styles
+    assert from_column_0.styles[0].color == "red"
+    assert from_column_1.styles[0].color == "blue"
+
+
 def test_set_style_loc_title_from_column_error(snapshot):
     df = pd.DataFrame({"x": [1, 2], "color": ["red", "blue"]})
     gt_df = GT(df)
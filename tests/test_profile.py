@@ -0,0 +1,94 @@
+import pandas as pd
+import pytest
+from great_tables import GT, profile_render
+from great_tables._profile import RenderProfile, _active_profile, record_counts, render_phase
+
+
+@pytest.fixture
+def gt():
+    df = pd.DataFrame({"x": [1.5, 2.5, 3.5], "y": ["a", "b", "c"]})
+    return GT(df).fmt_number("x").cols_merge(["x", "y"])
+
+
+def test_profile_render_html_phases(gt: GT):
+    with profile_render() as profile:
+        gt.as_raw_html()
+
+    assert list(profile.phases) == [
+        "render_formats",
+        "col_merge",
+        "body_reassemble",
+        "reorder_stub",
+        "text_transforms",
+        "heading",
+        "column_labels",
+        "body",
+        "footer",
+        "compile_scss",
+    ]
+    assert all(stats.runs == 1 for stats in profile.phases.values())
+    assert profile.total_seconds == sum(stats.seconds for stats in profile.phases.values())
+
+    # fmt_number() formats each column as a batch
+    assert profile.phases["render_formats"].cells == 3
+    assert profile.phases["render_formats"].formatter_calls == 1
+    # the merged column "y" is hidden
+    assert profile.phases["body"].cells == 3
+
+
+def test_profile_render_latex_phases(gt: GT):
+    with profile_render() as profile:
+        gt.fmt(lambda x: x, columns="y").as_latex()
+
+    assert "migrate_unformatted" in profile.phases
+    assert "compile_scss" not in profile.phases
+    assert profile.phases["render_formats"].formatter_calls == 4
+
+
+def test_profile_render_adds_up_renders(gt: GT):
+    with profile_render() as profile:
+        gt.as_raw_html()
+        gt.as_raw_html()
+
+    assert profile.phases["body"].runs == 2
+    # the second render reuses the built body
+    assert profile.phases["render_formats"].runs == 1
+    assert profile.phases["render_formats"].cells == 3
+
+
+def test_profile_render_callback(gt: GT):
+    profiles: list[RenderProfile] = []
+
+    with profile_render(callback=profiles.append) as profile:
+        gt.as_raw_html()
+        assert profiles == []
+
+    assert profiles == [profile]
+    assert [phase["name"] for phase in profile.to_dict()["phases"]] == list(profile.phases)
+
+
+def test_profile_render_callback_skipped_on_error():
+    profiles: list[RenderProfile] = []
+
+    with pytest.raises(ZeroDivisionError):
+        with profile_render(callback=profiles.append):
+            1 / 0
+
+    assert profiles == []
+    assert _active_profile.get() is None
+
+
+def test_profile_render_trace_memory(gt: GT):
+    with profile_render(trace_memory=True) as profile:
+        gt.as_raw_html()
+
+    assert profile.phases["render_formats"].peak_bytes > 0
+    assert profile.phases["body"].peak_bytes is None
+    assert "peak KiB" in str(profile)
+
+
+def test_render_phase_noop_without_profile():
+    with render_phase("x"):
+        record_counts(cells=1)
+
+    assert _active_profile.get() is None
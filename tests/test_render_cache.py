@@ -0,0 +1,170 @@
+import pandas as pd
+import polars as pl
+import pytest
+
+import great_tables as gt
+from great_tables import GT, exibble, loc, style
+from great_tables import _render_cache
+from great_tables._render_cache import RenderCache, fingerprint
+
+
+@pytest.fixture(autouse=True)
+def render_cache():
+    gt.enable_render_cache(maxsize=4)
+    yield _render_cache._render_cache
+    gt.disable_render_cache()
+
+
+def make_gt(data=exibble) -> GT:
+    return (
+        GT(data, rowname_col="row", groupname_col="group")
+        .fmt_number(columns="num", decimals=1)
+        .fmt_currency(columns="currency")
+        .fmt(lambda x: f"<{x}>", columns="fctr")
+        .tab_header(title="Title")
+        .tab_spanner(label="spanner", columns=["num", "char"])
+        .tab_style(style=style.fill(color="red"), locations=loc.body(columns="num"))
+        .tab_footnote(footnote="A note", locations=loc.body(columns="num", rows=0))
+        .sub_missing()
+        .with_id("test")
+    )
+
+
+def test_render_cache_disabled_by_default():
+    gt.disable_render_cache()
+
+    assert _render_cache._render_cache is None
+    assert make_gt().as_raw_html() == make_gt().as_raw_html()
+
+
+def test_render_cache_same_html():
+    gt.disable_render_cache()
+    uncached = make_gt().as_raw_html()
+
+    gt.enable_render_cache()
+    render_cache = _render_cache._render_cache
+
+    assert make_gt().as_raw_html() == uncached
+    assert make_gt().as_raw_html() == uncached
+    assert (render_cache.hits, render_cache.misses) == (1, 1)
+
+
+def test_render_cache_new_id_per_render():
+    gt_tbl = GT(exibble)
+
+    html_1 = gt_tbl.as_raw_html()
+    html_2 = gt_tbl.as_raw_html()
+
+    assert html_1 != html_2
+    assert html_1.split("<table", 1)[1] == html_2.split("<table", 1)[1]
+
+
+def test_render_cache_make_page(render_cache: RenderCache):
+    gt_tbl = make_gt()
+
+    assert gt_tbl.as_raw_html(make_page=False) in gt_tbl.as_raw_html(make_page=True)
+    assert render_cache.hits == 1
+
+
+@pytest.mark.parametrize(
+    "modify",
+    [
+        lambda x: x.fmt_number(columns="num", decimals=3),
+        lambda x: x.tab_options(table_font_size="30px"),
+        lambda x: x.cols_label(num="Number"),
+        lambda x: x.tab_style(style=style.text(weight="bold"), locations=loc.body(columns="char")),
+        lambda x: x.sub_missing(missing_text="nothing"),
+        lambda x: x.with_locale("de"),
+    ],
+)
+def test_render_cache_miss_on_change(render_cache: RenderCache, modify):
+    gt_tbl = make_gt()
+    gt_tbl.as_raw_html()
+
+    modify(gt_tbl).as_raw_html()
+
+    assert render_cache.hits == 0
+    assert render_cache.misses == 2
+
+
+def test_render_cache_miss_on_data_change(render_cache: RenderCache):
+    data = exibble.copy()
+    make_gt(data).as_raw_html()
+
+    data.loc[0, "num"] = 100
+    html = make_gt(data).as_raw_html()
+
+    assert render_cache.hits == 0
+    assert "100.0" in html
+
+
+def test_render_cache_miss_on_closure_change(render_cache: RenderCache):
+    def fmt_with(suffix: str):
+        return GT(exibble).fmt(lambda x: f"{x}{suffix}", columns="char").as_raw_html()
+
+    assert "apricot!" in fmt_with("!")
+    assert "apricot?" in fmt_with("?")
+    assert "apricot?" in fmt_with("?")
+
+    assert (render_cache.hits, render_cache.misses) == (1, 2)
+
+
+def test_render_cache_polars():
+    df = pl.DataFrame({"x": [1.5, 2.5], "y": ["a", "b"]})
+    gt.disable_render_cache()
+    uncached = GT(df).fmt_number(columns="x").with_id("test").as_raw_html()
+
+    gt.enable_render_cache()
+    render_cache = _render_cache._render_cache
+    GT(df).fmt_number(columns="x").with_id("test").as_raw_html()
+
+    assert GT(df).fmt_number(columns="x").with_id("test").as_raw_html() == uncached
+    assert render_cache.hits == 1
+
+
+def test_render_cache_maxsize(render_cache: RenderCache):
+    tables = [GT(pd.DataFrame({"x": [i]})) for i in range(6)]
+
+    for gt_tbl in tables:
+        gt_tbl.as_raw_html()
+
+    assert len(render_cache) == 4
+
+    # The oldest renders were dropped, the newest ones are kept
+    tables[0].as_raw_html()
+    tables[5].as_raw_html()
+
+    assert render_cache.hits == 1
+
+
+def test_render_cache_maxsize_invalid():
+    with pytest.raises(ValueError, match="at least 1"):
+        gt.enable_render_cache(maxsize=0)
+
+
+def test_fingerprint_contents():
+    assert fingerprint([1, "a", None], []) == fingerprint([1, "a", None], [])
+    assert fingerprint([1, "a"], []) != fingerprint((1, "a"), [])
+    assert fingerprint(["a", "b"], []) != fingerprint(["ab"], [])
+    assert fingerprint({1, 2}, []) == fingerprint({2, 1}, [])
+    assert fingerprint(float("nan"), []) == fingerprint(float("nan"), [])
+    assert fingerprint(0.0, []) != fingerprint(-0.0, [])
+    assert fingerprint(1, []) != fingerprint(True, [])
+
+
+def test_fingerprint_cycle():
+    x = []
+    x.append(x)
+
+    assert fingerprint(x, []) == fingerprint(x, [])
+
+
+def test_fingerprint_unknown_object_by_identity():
+    class Thing:
+        pass
+
+    thing = Thing()
+    refs = []
+
+    assert fingerprint(thing, refs) != fingerprint(Thing(), [])
+    assert thing in refs
@@ -0,0 +1,93 @@
+import pickle
+
+import pandas as pd
+import pytest
+
+from great_tables import GT, exibble, render_many
+from great_tables._render_many import RenderResult
+
+
+def make_gts(n: int) -> list[GT]:
+    return [
+        GT(exibble.head(i + 1), id=f"table_{i}").fmt_number(columns="num").tab_header(f"T{i}")
+        for i in range(n)
+    ]
+
+
+def failing_fmt(x):
+    raise ValueError("bad value")
+
+
+@pytest.mark.parametrize(
+    "workers, mode", [(1, "process"), (2, "thread"), pytest.param(2, "process", id="2-process")]
+)
+def test_render_many_html_in_order(workers, mode):
+    gts = make_gts(5)
+
+    results = list(render_many(gts, workers=workers, mode=mode))
+
+    assert [result.index for result in results] == list(range(5))
+    assert all(result.ok for result in results)
+    assert [result.output for result in results] == [gt.as_raw_html() for gt in gts]
+
+
+@pytest.mark.parametrize("workers, mode", [(1, "process"), (2, "thread"), (2, "process")])
+def test_render_many_captures_errors(workers, mode):
+    gts = make_gts(3)
+    gts[1] = gts[1].fmt(failing_fmt, columns="char")
+
+    results = list(render_many(gts, workers=workers, mode=mode))
+
+    assert [result.ok for result in results] == [True, False, True]
+    assert results[1].output is None
+    assert isinstance(results[1].error, ValueError)
+    assert results[2].output == gts[2].as_raw_html()
+
+
+def test_render_many_process_unpicklable_table():
+    gts = make_gts(2)
+    gts[0] = gts[0].fmt(lambda x: "x", columns="char")
+
+    results = list(render_many(gts, workers=2, mode="process"))
+
+    assert not results[0].ok
+    assert isinstance(results[0].error, (pickle.PicklingError, AttributeError, TypeError))
+    assert results[1].ok
+
+
+def test_render_many_latex_with_options():
+    gts = [GT(pd.DataFrame({"x": [1, 2]})), GT(pd.DataFrame({"y": [3]}))]
+
+    results = list(render_many(gts, context="latex", workers=2, mode="thread", use_longtable=True))
+
+    assert [result.output for result in results] == [gt.as_latex(use_longtable=True) for gt in gts]
+
+
+def test_render_many_accepts_generator():
+    gts = (gt for gt in make_gts(10))
+
+    results = list(render_many(gts, workers=2, mode="thread"))
+
+    assert [result.index for result in results] == list(range(10))
+
+
+def test_render_many_empty():
+    assert list(render_many([], workers=2, mode="thread")) == []
+
+
+@pytest.mark.parametrize(
+    "kwargs, match",
+    [
+        (dict(context="rtf"), "context"),
+        (dict(mode="async"), "mode"),
+        (dict(workers=0), "workers"),
+    ],
+)
+def test_render_many_raises(kwargs, match):
+    with pytest.raises(ValueError, match=match):
+        render_many(make_gts(1), **kwargs)
+
+
+def test_render_result_ok():
+    assert RenderResult(0, output="x").ok
+    assert not RenderResult(0, error=ValueError()).ok
@@ -2,7 +2,13 @@ import pytest
 import pandas as pd
 
 from great_tables import GT
-from great_tables._scss import font_color, css_add, compile_scss
+from great_tables._scss import (
+    _compile_styles,
+    _compile_styles_cached,
+    compile_scss,
+    css_add,
+    font_color,
+)
 
 
 @pytest.mark.parametrize(
@@ -53,3 +59,29 @@ def test_scss_default_generated(snapshot):
     gt = GT(pd.DataFrame({"x": [1, 2, 3]}))
 
     assert snapshot == compile_scss(gt, id="abc", compress=False)
+
+
+def test_compile_scss_cached_per_theme():
+    _compile_styles_cached.cache_clear()
+    gt = GT(pd.DataFrame({"x": [1, 2, 3]}))
+    gt_themed = gt.tab_options(table_background_color="navy")
+
+    css = compile_scss(gt, id="abc")
+    assert compile_scss(GT(pd.DataFrame({"y": [4]})), id="abc") == css
+    assert _compile_styles_cached.cache_info().hits == 1
+
+    # a different theme, id, or flag is compiled separately
+    assert compile_scss(gt_themed, id="abc") != css
+    assert compile_scss(gt, id="xyz") == css.replace("#abc", "#xyz")
+    assert compile_scss(gt, id="abc", all_important=True) != css
+    assert _compile_styles_cached.cache_info().misses == 4
+
+
+def test_compile_scss_uncached_options_match():
+    gt = GT(pd.DataFrame({"x": [1, 2, 3]}))
+    params = {
+        k: opt.value for k, opt in vars(gt._options).items() if opt.scss and opt.value is not None
+    }
+
+    compiled = _compile_styles(params, id="abc", compress=False, all_important=False)
+    assert compiled in compile_scss(gt, id="abc", compress=False)
@@ -527,3 +527,100 @@ class TestSubValues:
         result = gt._render_formats("html")
         body = [x for x in to_list(result._body.body["col"])]
         assert body == ["&lt;b&gt;bold&lt;/b&gt;", None]
+
+
+# =============================================================================
+# Vectorized masks
+# =============================================================================
+
+
+MASK_SUBBERS = [
+    pytest.param(SubZero("nil"), id="zero"),
+    pytest.param(SubSmallVals(threshold=0.01, small_pattern="<{x}", sign="+"), id="small+"),
+    pytest.param(SubSmallVals(threshold=0.01, small_pattern=">-{x}", sign="-"), id="small-"),
+    pytest.param(SubLargeVals(threshold=100, large_pattern=">={x}", sign="+"), id="large+"),
+    pytest.param(SubLargeVals(threshold=100, large_pattern=">={x}", sign="-"), id="large-"),
+    pytest.param(
+        SubValues(values=[2, 0.001, "b"], pattern=None, fn=None, replacement="R"), id="values"
+    ),
+    pytest.param(SubValues(values=None, pattern="^a", fn=None, replacement="R"), id="pattern"),
+]
+
+
+@pytest.mark.parametrize("Frame", [pd.DataFrame, pl.DataFrame, pa.table])
+@pytest.mark.parametrize("subber", MASK_SUBBERS)
+def test_sub_mask_matches_per_value(Frame, subber):
+    from great_tables._tbl_data import _get_column_cells
+
+    df = Frame(
+        {
+            "i": [0, 2, -500, 100, 7],
+            "f": [0.0, 0.001, nan, -0.005, float("inf")],
+            "s": ["a", "b", None, "ab", "0"],
+        }
+    )
+    rows = [4, 0, 1, 3]
+
+    for column in ["i", "f", "s"]:
+        mask, text = subber.mask(df, column, rows)
+        values = _get_column_cells(df, column, rows)
+
+        assert mask == [subber.to_html(x) == text for x in values]
+
+
+@pytest.mark.parametrize("Frame", [pd.DataFrame, pl.DataFrame, pa.table])
+def test_sub_missing_mask(Frame):
+    df = Frame({"x": [1.0, None, nan]})
+
+    assert SubMissing(df, "--").mask(df, "x", [2, 1, 0]) == ([True, True, False], "--")
+
+
+def test_sub_mask_falls_back_per_value():
+    df = pd.DataFrame({"b": [True, False], "o": [0, "a"]})
+
+    assert SubZero("nil").mask(df, "b", [0, 1]) is None
+    assert SubZero("nil").mask(df, "o", [0, 1]) is None
+    assert SubValues(values=None, pattern=None, fn=bool, replacement="R").mask(df, "o", [0]) is None
+
+    new_gt = GT(df).sub_zero(zero_text="nil")._render_formats("html")
+    assert_series_equals(new_gt._body.body["o"], ["nil", None])
+
+
+def test_sub_large_vals_pandas_int_column():
+    df = pd.DataFrame({"x": [1, 10**7]})
+    new_gt = GT(df).sub_large_vals(threshold=1000)._render_formats("html")
+
+    assert_series_equals(new_gt._body.body["x"], [None, "&gt;=1000"])
+
+
+UINT8_FRAMES = [
+    pytest.param(pd.DataFrame({"x": pd.Series([0, 1, 200], dtype="uint8")}), id="pandas"),
+    pytest.param(pl.DataFrame({"x": pl.Series([0, 1, 200], dtype=pl.UInt8)}), id="polars"),
+    pytest.param(pa.table({"x": pa.array([0, 1, 200], pa.uint8())}), id="pyarrow"),
+]
+
+
+@pytest.mark.parametrize("df", UINT8_FRAMES)
+@pytest.mark.parametrize("sign", ["+", "-"])
+def test_sub_small_large_vals_unsigned_column(df, sign):
+    from great_tables._tbl_data import _get_column_cells
+
+    values = _get_column_cells(df, "x", [0, 1, 2])
+    subbers = [
+        SubSmallVals(threshold=100, small_pattern="<{x}", sign=sign),
+        SubLargeVals(threshold=100, large_pattern=">={x}", sign=sign),
+    ]
+
+    for subber in subbers:
+        mask, text = subber.mask(df, "x", [0, 1, 2])
+        assert mask == [subber.to_html(x) == text for x in values]
+
+    small = GT(df).sub_small_vals(threshold=100, sign=sign)._render_formats("html")
+    large = GT(df).sub_large_vals(threshold=100, sign=sign)._render_formats("html")
+
+    if sign == "+":
+        assert_series_equals(small._body.body["x"], [None, "&lt;100", None])
+        assert_series_equals(large._body.body["x"], [None, None, "&gt;=100"])
+    else:
+        assert_series_equals(small._body.body["x"], [None, None, None])
+        assert_series_equals(large._body.body["x"], [None, None, None])
@@ -11,18 +11,25 @@ from great_tables._tbl_data import (
     DataFrameLike,
     SeriesLike,
     _get_cell,
+    _get_column_cells,
     _get_column_dtype,
     _set_cell,
+    _set_column_cells,
+    _string_columns,
     _validate_selector_list,
+    cast_column_to_string,
     cast_frame_to_string,
     copy_frame,
     create_empty_frame,
+    data_fingerprint,
     eval_aggregate,
     eval_select,
+    fill_null_column,
     get_column_names,
     group_splits,
     is_series,
     reorder,
+    replace_null_frame,
     to_frame,
     to_list,
     validate_frame,
@@ -121,6 +128,27 @@ def test_set_cell(df: DataFrameLike):
     assert_frame_equal(new_df, expected)
 
 
+def test_get_column_cells(df: DataFrameLike):
+    assert _get_column_cells(df, "col2", [2, 0]) == ["c", "a"]
+    assert _get_column_cells(df, "col1", [1]) == [_get_cell(df, 1, "col1")]
+
+
+def test_get_column_cells_container_dtypes(df_container_dtypes: pl.DataFrame):
+    res = _get_column_cells(df_container_dtypes, "col2", [0, 2])
+    assert res == [_get_cell(df_container_dtypes, 0, "col2"), None]
+
+
+def test_set_column_cells(df: DataFrameLike):
+    expected_data = {"col1": [1, 2, 3], "col2": ["x", "b", "y"], "col3": [4.0, 5.0, 6.0]}
+    if isinstance(df, pa.Table):
+        expected = pa.table(expected_data)
+    else:
+        expected = df.__class__(expected_data)
+
+    new_df = _set_column_cells(df, "col2", [0, 2], ["x", "y"])
+    assert_frame_equal(new_df, expected)
+
+
 def test_reorder(df: DataFrameLike):
     res = reorder(df, [0, 2], ["col2"])
 
@@ -239,6 +267,22 @@ def test_group_splits_pl_na():
     assert splits[None] == [2]
 
 
+def test_group_splits_pa_chunked_many_groups():
+    groups = [f"g{i % 7}" for i in range(100)]
+    df = pa.Table.from_batches(
+        [
+            pa.record_batch({"g": groups[:40]}),
+            pa.record_batch({"g": groups[40:]}),
+        ]
+    )
+
+    splits = group_splits(df, "g")
+
+    # groups are in order of first appearance, with their rows in ascending order
+    assert list(splits) == [f"g{i}" for i in range(7)]
+    assert splits == {k: [i for i, g in enumerate(groups) if g == k] for k in splits}
+
+
 def test_validate_selector_list_strict_raises():
     with pytest.raises(TypeError) as exc_info:
         _validate_selector_list([pl.col("a")])
@@ -347,6 +391,93 @@ def test_cast_frame_to_string_polars_list_col():
     assert new_df["z"].dtype.is_(pl.String)
 
 
+def test_fill_null_column(df: DataFrameLike):
+    body = create_empty_frame(df)
+    body = _set_cell(body, 1, "col3", "five") or body
+    expected = replace_null_frame(body, cast_frame_to_string(df))
+
+    for col in get_column_names(df):
+        assert fill_null_column(body, col, df) == [_get_cell(expected, i, col) for i in range(3)]
+
+
+def test_fill_null_column_container_dtypes(df_container_dtypes: pl.DataFrame):
+    body = create_empty_frame(df_container_dtypes)
+    expected = replace_null_frame(body, cast_frame_to_string(df_container_dtypes))
+
+    assert fill_null_column(body, "col2", df_container_dtypes) == expected["col2"].to_list()
+
+
+def test_fill_null_column_pd_duplicate_index():
+    df = pd.DataFrame({"x": [1.5, 2.5, 3.5]}, index=[0, 0, 1])
+    body = create_empty_frame(df)
+    body.iloc[0, 0] = "one"
+
+    assert fill_null_column(body, "x", df) == ["one", "2.5", "3.5"]
+
+
+def test_cast_column_to_string_memoized():
+    df = pa.table({"x": [1, 2], "y": [3, 4]})
+
+    res = cast_column_to_string(df, "x")
+    assert to_list(res) == ["1", "2"]
+    assert cast_column_to_string(df, "x") is res
+    assert cast_column_to_string(pa.table({"x": [1, 2]}), "x") is not res
+
+    n_entries = len(_string_columns)
+    del df, res
+    assert len(_string_columns) == n_entries - 1
+
+
+def test_cast_column_to_string_pd_not_memoized():
+    df = pd.DataFrame({"x": [1, 2]})
+    assert to_list(cast_column_to_string(df, "x")) == ["1", "2"]
+
+    # pandas DataFrames can be modified in place
+    df.iloc[0, 0] = 3
+    assert to_list(cast_column_to_string(df, "x")) == ["3", "2"]
+
+
+def test_cast_column_to_string_pl_not_memoized():
+    df = pl.DataFrame({"x": [1, 2]})
+    assert to_list(cast_column_to_string(df, "x")) == ["1", "2"]
+
+    # polars DataFrames can also be modified in place, keeping their identity
+    df[0, "x"] = 3
+    assert to_list(cast_column_to_string(df, "x")) == ["3", "2"]
+
+
+def test_data_fingerprint(df: DataFrameLike):
+    key = data_fingerprint(df)
+
+    assert key is not None
+    assert data_fingerprint(df) == key
+    assert data_fingerprint(copy_frame(df)) != key
+
+
+@pytest.mark.parametrize("frame", [pd.DataFrame, pl.DataFrame])
+def test_data_fingerprint_modified_in_place(frame):
+    df = frame({"x": [1, 2], "y": ["a", "b"]})
+    key = data_fingerprint(df)
+
+    if isinstance(df, pd.DataFrame):
+        df.loc[0, "y"] = "c"
+    else:
+        df[0, "y"] = "c"
+
+    assert data_fingerprint(df) != key
+
+
+def test_data_fingerprint_pd_unhashable():
+    assert data_fingerprint(pd.DataFrame({"x": [[1], [2]]})) is None
+
+
+def test_frame_rendering_casts_visible_unformatted_columns():
+    df = pa.table({"x": [1, 2], "y": [3, 4], "z": [5, 6]})
+    GT(df).fmt_integer("x").cols_hide("z").as_raw_html()
+
+    assert set(_string_columns._entries[id(df)][1]) == {"y"}
+
+
 def test_frame_rendering(df: DataFrameLike, snapshot):
     gt = GT(df).fmt_number(columns="col3", decimals=0).fmt_currency(columns="col1")
     assert create_body_component_h(gt._build_data("html")) == snapshot
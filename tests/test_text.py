@@ -8,7 +8,12 @@ from great_tables._text import (
     _latex_escape,
     escape_pattern_str_latex,
     _process_text,
+    _md_html,
+    _md_html_cache,
+    _md_html_many,
+    _md_html_uncached,
     _md_latex,
+    _strip_md_paragraph,
 )
 
 
@@ -87,6 +92,56 @@ def test_md_html():
     assert Md("<b>raw</b>").to_html() == "<b>raw</b>"
 
 
+MD_DOCS = [
+    "*italic*",
+    "",
+    "  ",
+    "- a\n- b",
+    "1. one\n\n2. two",
+    "> quote\ncontinued",
+    "    indented code",
+    "```\nunclosed fence",
+    "~~~\nfence\n~~~",
+    "[ref]\n\n[ref]: http://x.com",
+    "[ref]",
+    "<div>\nraw",
+    "<!-- comment",
+    "Heading\n===",
+    "---",
+    "line  \nbreak",
+    "trailing backslash\\",
+    "m^2 of {{m^2}}",
+    "*italic*",
+]
+
+
+def test_md_html_many_matches_md_html():
+    _md_html_cache.clear()
+    expected = [_md_html_uncached(x) for x in MD_DOCS]
+
+    _md_html_cache.clear()
+    assert _md_html_many(MD_DOCS) == expected
+
+    # again, from the cache
+    assert _md_html_many(MD_DOCS) == expected
+
+
+def test_md_html_cached():
+    _md_html_cache.clear()
+
+    res = _md_html("**cached**")
+    assert _md_html_cache["**cached**"] == res == "<strong>cached</strong>"
+
+
+@pytest.mark.parametrize(
+    "x", ["<p>a</p>\n", "<p>a</p>\n\n", "a</p>", "<p><p>a</p>\n", "</p>\n", "<p>", "a"]
+)
+def test_strip_md_paragraph(x: str):
+    import re
+
+    assert _strip_md_paragraph(x) == re.sub(r"^<p>|</p>\n$", "", x)
+
+
 def test_html_to_latex_strips_tags():
     # Tags are stripped, remaining text is LaTeX-escaped
     assert Html("<b>bold</b>").to_latex() == "bold"
@@ -1,9 +1,12 @@
+import copy
+import pickle
 from collections.abc import Generator
 import re
+import pyarrow as pa
 import pytest
 
 
-from great_tables import GT, exibble
+from great_tables import GT, exibble, loc, style
 from great_tables._tbl_data import is_na
 from great_tables._utils import (
     _assert_list_is_subset,
@@ -15,6 +18,7 @@ from great_tables._utils import (
     _match_arg,
     _migrate_unformatted_to_output,
     OrderedSet,
+    PersistentList,
     _str_detect,
     _str_scalar_to_list,
     is_valid_http_schema,
@@ -127,6 +131,63 @@ def test_orderedSet():
     assert repr(o) == "OrderedSet([1, 2, 'x', 'y'])"
 
 
+def test_persistent_list():
+    p = PersistentList([1, 2, "x"])
+
+    assert len(p) == 3
+    assert list(p) == [1, 2, "x"]
+    assert p[0] == 1
+    assert p[-1] == "x"
+    assert p[1:] == PersistentList([2, "x"])
+    assert p == [1, 2, "x"]
+    assert repr(p) == "PersistentList([1, 2, 'x'])"
+
+    with pytest.raises(IndexError):
+        p[3]
+
+
+def test_persistent_list_add_keeps_earlier_lists():
+    p0 = PersistentList()
+    p1 = p0 + [1]
+    p2 = p1 + [2, 3]
+
+    # adding to an earlier list branches off, without changing the later ones
+    p2_branch = p1 + ["x"]
+    p3 = p2 + [4]
+
+    assert p0 == []
+    assert p1 == [1]
+    assert p2 == [1, 2, 3]
+    assert p2_branch == [1, "x"]
+    assert p3 == [1, 2, 3, 4]
+    assert p1[-1] == 1
+    assert p1 + [] is p1
+
+
+def test_persistent_list_pickle_and_copy():
+    p = PersistentList([1]) + [2]
+    _ = PersistentList([1]) + ["x"]
+
+    assert pickle.loads(pickle.dumps(p)) == [1, 2]
+    assert copy.deepcopy(p) == [1, 2]
+
+
+def test_gt_snapshots_unchanged_by_later_methods():
+    gt = GT(exibble)
+    gt_1 = gt.fmt_number(columns="num").tab_style(style.fill("red"), loc.body(columns="num"))
+    gt_2 = gt_1.fmt_currency(columns="currency")
+    gt_3 = gt_1.tab_style(style.text(weight="bold"), loc.body(columns="char"))
+
+    assert len(gt._formats) == 0
+    assert len(gt._styles) == 0
+    assert len(gt_1._formats) == 1
+    assert len(gt_2._formats) == 2
+    assert len(gt_3._formats) == 1
+    assert len(gt_2._styles) == len(gt_1._styles)
+    assert len(gt_3._styles) == len(gt_1._styles) + len(exibble)
+    assert list(gt_3._styles)[: len(gt_1._styles)] == list(gt_1._styles)
+
+
 @pytest.mark.parametrize(
     "iterable, ordered_list",
     [
@@ -203,6 +264,17 @@ def test_migrate_unformatted_to_output_latex():
     assert migrated._body.body["char"].tolist() == ["apricot", "banana"]
 
 
+def test_migrate_unformatted_to_output_latex_pyarrow():
+    gt_tbl = GT(pa.table({"x": ["a_b", "c"], "y": [1.5, 2.5]})).fmt_number(columns="y")
+    rendered = gt_tbl._render_formats(context="latex")
+
+    migrated = _migrate_unformatted_to_output(
+        data=rendered, data_tbl=rendered._tbl_data, formats=rendered._formats, context="latex"
+    )
+
+    assert migrated._body.body["x"].to_pylist() == ["a\\_b", "c"]
+
+
 def test_migrate_unformatted_to_output_html():
     gt_tbl = GT(exibble.head(2)).fmt_number(columns="num", decimals=3)
 
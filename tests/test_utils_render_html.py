@@ -1,7 +1,9 @@
 import pandas as pd
 import polars as pl
 from great_tables import GT, exibble, html, loc, md, style
+from great_tables._gt_data import StyleInfo
 from great_tables._utils_render_html import (
+    _CellInfoIndex,
     create_body_component_h,
     create_columns_component_h,
     create_heading_component_h,
@@ -110,6 +112,35 @@ def test_body_multiple_styles(snapshot):
     assert_rendered_body(snapshot, new_gt)
 
 
+def test_cell_info_index_lookups_keep_order():
+    infos = [
+        StyleInfo(locname="data", rownum=0, colname="num", styles=[style.fill("red")]),
+        StyleInfo(locname="data", rownum=1, colname="num", styles=[style.fill("blue")]),
+        StyleInfo(locname="data", rownum=0, colname="char", styles=[style.fill("green")]),
+        StyleInfo(locname="data", rownum=0, colname="num", styles=[style.borders()]),
+    ]
+    index = _CellInfoIndex(infos)
+
+    assert index.cell(0, "num") == [infos[0], infos[3]]
+    assert index.row(0) == [infos[0], infos[2], infos[3]]
+    assert index.cell(2, "num") == []
+    assert index.row(2) == []
+
+
+def test_body_layered_styles_and_footnotes_same_cell():
+    new_gt = (
+        GT(small_exibble)
+        .tab_style(style=style.fill(color="red"), locations=loc.body(columns="num", rows=[1]))
+        .tab_style(style=style.text(color="blue"), locations=loc.body(columns="num"))
+        .tab_footnote("A note", locations=loc.body(columns="num", rows=[1]))
+    )
+    body = create_body_component_h(new_gt._build_data("html"))
+
+    row_1_num = body.split("<tr>")[2].split("</td>")[0]
+    assert 'style="background-color: red; color: blue;"' in row_1_num
+    assert "gt_footnote_marks" in row_1_num
+
+
 def test_styling_data_01(snapshot):
     new_gt = GT(small_exibble).tab_style(
         style=style.text(color="red"),